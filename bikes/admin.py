@@ -1,17 +1,27 @@
+from django import forms
 from django.contrib import admin
+from django.db.models import Max
 from .models import Footer
 from .models import AboutSection, AboutSection3Image
 from .models import SellBikePage, HowItWorks
 from .models import LoginPageContent
 from .models import Contact
 from .models import HeroSection, HeroBikeImage, InfoSection, SupportFeature
-from .models import Location, BuyBike
+from .models import Location, BuyBike, BuyBikeImage
 from .models import LastSection, LastSectionImage
-from django.utils.html import format_html   
 from .models import HomepageBanner, StatItem
 from .models import TestimonialsSection, Testimonial
 from .models import TrustedSection
 from .models import FAQ
+from .models import Booking
+from .models import SavedSearch
+from .models import Job
+from .admin_tools import (
+    CachedAllValuesFieldListFilter, CachedRelatedFieldListFilter, EstimatedCountPaginator,
+    MultipleImageField, store_files_parallel,
+)
+from .jobs import requeue
+from .thumbnails import admin_thumbnail
 
 
 class LastSectionImageInline(admin.TabularInline):
@@ -23,13 +33,7 @@ class LastSectionImageInline(admin.TabularInline):
 
     def image_preview(self, obj):
         # defensive: obj might be None in the "add new" inline row
-        if obj and getattr(obj, "image", None):
-            try:
-                return format_html('<img src="{}" style="max-height:80px;"/>', obj.image.url)
-            except Exception:
-                # if image.url access fails for some reason, return a placeholder text
-                return "(image)"
-        return ""
+        return admin_thumbnail(obj.image, 80) if obj else ""
     image_preview.short_description = "Preview"
 
 
@@ -72,47 +76,77 @@ class SupportFeatureAdmin(admin.ModelAdmin):
 
 @admin.register(Location)
 class LocationAdmin(admin.ModelAdmin):
-    list_display = ("name",)
+    list_display = ("name", "latitude", "longitude")
     search_fields = ("name",)
 
 
 
+class BuyBikeImageInline(admin.TabularInline):
+    model = BuyBikeImage
+    extra = 0
+    fields = ("image_preview", "image", "order")
+    readonly_fields = ("image_preview",)
+
+    def image_preview(self, obj):
+        return admin_thumbnail(obj.image, 100) if obj else ""
+    image_preview.short_description = "Preview"
+
+
+class BuyBikeAdminForm(forms.ModelForm):
+    upload_images = MultipleImageField(required=False, label="Upload images")
+
+    class Meta:
+        model = BuyBike
+        fields = "__all__"
+
+
 @admin.register(BuyBike)
 class BuyBikeAdmin(admin.ModelAdmin):
     list_display = (
-        "id", "title", "brand", "bike_model", "bike_variant", "price",
-        "year", "kilometers", "owners", "transmission", "is_booked"
+        "id", "thumbnail", "title", "brand", "bike_model", "bike_variant", "price",
+        "year", "kilometers", "owners", "transmission", "location", "is_booked"
     )
+    list_select_related = ("location",)
     list_filter = (
-        "brand", "category", "year", "fuel_type", "color", "is_booked",
+        ("brand", CachedAllValuesFieldListFilter),
+        ("category", CachedAllValuesFieldListFilter),
+        ("year", CachedAllValuesFieldListFilter),
+        ("fuel_type", CachedAllValuesFieldListFilter),
+        ("color", CachedAllValuesFieldListFilter),
+        "is_booked",
         "refurbished", "registration_certificate", "finance", "insurance", "warranty",
-        "owners", "transmission", "location"
+        "owners", "transmission",
+        ("location", CachedRelatedFieldListFilter),
     )
-    search_fields = ("title", "brand", "description", "bike_model", "bike_variant")
+    # Prefix matches where a prefix is what people type; no description scan.
+    search_fields = ("title", "^brand", "^bike_model")
+    search_help_text = "Title contains, or brand / model starts with, the search terms."
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
-    readonly_fields = (
-        "created_at", "updated_at", 
-        "featured_image_preview", 
-        "variant1_preview", "variant2_preview",
-        "variant3_preview", "variant4_preview", "variant5_preview"
-    )
+    readonly_fields = ("created_at", "updated_at", "featured_image_preview")
+    inlines = [BuyBikeImageInline]
+    form = BuyBikeAdminForm
 
     def featured_image_preview(self, obj):
-        if obj and obj.featured_image:
-            return format_html('<img src="{}" style="max-height:120px;"/>', obj.featured_image.url)
-        return ""
+        return admin_thumbnail(obj.featured_image, 120) if obj else ""
     featured_image_preview.short_description = "Featured preview"
 
-    def variant1_preview(self, obj):
-        return format_html('<img src="{}" style="max-height:100px;"/>', obj.variant_image1.url) if obj.variant_image1 else ""
-    def variant2_preview(self, obj):
-        return format_html('<img src="{}" style="max-height:100px;"/>', obj.variant_image2.url) if obj.variant_image2 else ""
-    def variant3_preview(self, obj):
-        return format_html('<img src="{}" style="max-height:100px;"/>', obj.variant_image3.url) if obj.variant_image3 else ""
-    def variant4_preview(self, obj):
-        return format_html('<img src="{}" style="max-height:100px;"/>', obj.variant_image4.url) if obj.variant_image4 else ""
-    def variant5_preview(self, obj):
-        return format_html('<img src="{}" style="max-height:100px;"/>', obj.variant_image5.url) if obj.variant_image5 else ""
+    def thumbnail(self, obj):
+        return admin_thumbnail(obj.featured_image, 80)
+    thumbnail.short_description = "Image"
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        uploads = form.cleaned_data.get("upload_images") or []
+        if not uploads:
+            return
+        bike = form.instance
+        field = BuyBikeImage._meta.get_field("image")
+        names = store_files_parallel(field, BuyBikeImage(bike=bike), uploads)
+        start = (bike.images.aggregate(Max("order"))["order__max"] or 0) + 1
+        for order, name in enumerate(names, start=start):
+            BuyBikeImage.objects.create(bike=bike, image=name, order=order)
 
     fieldsets = (
         ("Basic", {
@@ -124,14 +158,9 @@ class BuyBikeAdmin(admin.ModelAdmin):
                 ("featured_image", "card_bg_image"),
             )
         }),
-        ("Variant Thumbnails", {
-            "fields": (
-                "variant1_preview", "variant_image1",
-                "variant2_preview", "variant_image2",
-                "variant3_preview", "variant_image3",
-                "variant4_preview", "variant_image4",
-                "variant5_preview", "variant_image5",
-            )
+        ("Gallery", {
+            "fields": ("upload_images",),
+            "description": "Add several images at once; edit or reorder them below.",
         }),
         ("Identity", {
             "fields": (
@@ -223,10 +252,54 @@ class ContactAdmin(admin.ModelAdmin):
     search_fields = ("name", "email", "phone", "reason", "find_us")
     list_filter = ("reason", "find_us", "created_at")
     readonly_fields = ("created_at",)
+    ordering = ("-created_at",)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
     fields = ("name", "email", "phone", "reason", "find_us", "message", "created_at")
 
 
+@admin.register(Booking)
+class BookingAdmin(admin.ModelAdmin):
+    list_display = ("id", "buybike", "user", "total_amount", "status", "created_at")
+    list_filter = ("status", "created_at")
+    list_select_related = ("buybike", "user")
+    raw_id_fields = ("buybike", "user")
+    search_fields = ("buybike__title", "user__username")
+    ordering = ("-created_at",)
+    readonly_fields = ("created_at", "updated_at")
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "brand", "location", "price_min", "price_max", "is_active", "created_at")
+    list_filter = ("is_active",)
+    list_select_related = ("user", "location")
+    raw_id_fields = ("user",)
+    search_fields = ("user__username", "^brand")
+    ordering = ("-created_at",)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "status", "priority", "attempts", "run_at", "finished_at")
+    list_filter = ("status", "name")
+    search_fields = ("=name", "locked_by")
+    ordering = ("-created_at",)
+    readonly_fields = ("locked_by", "locked_until", "last_error", "created_at", "finished_at")
+    actions = ["requeue_jobs"]
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+    @admin.action(description="Requeue selected dead jobs")
+    def requeue_jobs(self, request, queryset):
+        self.message_user(request, f"Requeued {requeue(queryset)} jobs.")
+
+
 @admin.register(LoginPageContent)
 class LoginPageContentAdmin(admin.ModelAdmin):
     list_display = ("title", "created_at")
@@ -0,0 +1,109 @@
+"""
+Changelist helpers for the large tables.
+
+Stock ``list_filter`` facets on free-text and numeric columns run a
+``SELECT DISTINCT`` over the whole table on every changelist load. The
+cached variants below keep those choices in the cache, keyed on the model's
+version from ``bikes/cache.py``, so they are recomputed only after a save or
+delete (bulk writes that skip signals are picked up after
+``FILTER_CHOICES_TIMEOUT``).
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from django import forms
+from django.contrib.admin import AllValuesFieldListFilter, RelatedFieldListFilter
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from .cache import versioned_key
+
+
+FILTER_CHOICES_TIMEOUT = 600
+
+UPLOAD_WORKERS = 4
+
+
+def cached_choices(model, field_name, compute):
+    key = versioned_key(model._meta.label_lower, "admin-choices", field_name)
+    choices = cache.get(key)
+    if choices is None:
+        choices = list(compute())
+        cache.set(key, choices, FILTER_CHOICES_TIMEOUT)
+    return choices
+
+
+class CachedAllValuesFieldListFilter(AllValuesFieldListFilter):
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super().__init__(field, request, params, model, model_admin, field_path)
+        # The parent left lookup_choices as an unevaluated queryset.
+        queryset = self.lookup_choices
+        self.lookup_choices = cached_choices(field.model, field_path, lambda: queryset)
+
+
+class CachedRelatedFieldListFilter(RelatedFieldListFilter):
+    def field_choices(self, field, request, model_admin):
+        return cached_choices(
+            field.related_model, f"{field.model._meta.label_lower}.{field.name}",
+            lambda: super(CachedRelatedFieldListFilter, self).field_choices(field, request, model_admin),
+        )
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    On PostgreSQL, an unfiltered changelist of a table past
+    ``estimate_threshold`` rows is paginated with the planner's row estimate
+    instead of an exact ``COUNT(*)``.
+    """
+    estimate_threshold = 100_000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, "query", None)
+        if query is not None and not query.where and connections[queryset.db].vendor == "postgresql":
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.estimate_threshold:
+                return row[0]
+        return super().count
+
+
+class MultipleFileInput(forms.ClearableFileInput):
+    allow_multiple_selected = True
+
+
+class MultipleImageField(forms.ImageField):
+    """An image field that accepts several files and cleans to a list."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("widget", MultipleFileInput())
+        super().__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        clean_one = super().clean
+        if isinstance(data, (list, tuple)):
+            return [clean_one(item, initial) for item in data]
+        return [clean_one(data, initial)] if data else []
+
+
+def store_files_parallel(field, instance, files):
+    """
+    Save ``files`` to ``field``'s storage (under its ``upload_to``) from a
+    small thread pool and return the stored names in input order. Storage
+    writes are I/O (disk or the Cloudinary API), so uploads overlap instead
+    of queueing behind each other.
+    """
+    def store(upload):
+        name = field.generate_filename(instance, upload.name)
+        return field.storage.save(name, upload, max_length=field.max_length)
+
+    if len(files) <= 1:
+        return [store(upload) for upload in files]
+    with ThreadPoolExecutor(max_workers=min(UPLOAD_WORKERS, len(files))) as pool:
+        return list(pool.map(store, files))
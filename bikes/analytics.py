@@ -0,0 +1,237 @@
+"""
+Sales and inventory rollups for ``/api/analytics/``.
+
+Three small tables are kept current by the ``Booking``/``BuyBike`` signal
+handlers in ``bikes/signals.py``, each write adding or subtracting its
+delta with an ``F()`` update:
+
+* ``BookingDailyStats``: bookings per creation day and current status, with
+  their amounts. A booking moving from "created" to "paid" moves between
+  buckets of its day.
+* ``InventoryDailyStats``: bikes listed, booked, released (un-booked) and
+  removed per day, brand and showroom.
+* ``InventoryLevel``: bikes on sale and booked per brand and showroom now.
+
+Reading a time series therefore touches one row per day and bucket, however
+long the history. ``manage.py rebuild_analytics`` recomputes everything
+from the source tables (after deploying, or to repair drift from bulk
+updates, which send no signals).
+"""
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Booking, BookingDailyStats, BuyBike, InventoryDailyStats, InventoryLevel
+
+
+BOOKING_AMOUNTS = ("amount", "gst_amount", "test_drive_fee", "total_amount")
+
+BOOKING_FIELDS = ("created_at", "status") + BOOKING_AMOUNTS
+
+BIKE_FIELDS = ("brand", "location_id", "is_booked", "price")
+
+MAX_DAYS = 366
+
+CENT = Decimal("0.01")
+
+
+def bump(model, key, deltas):
+    """Add ``deltas`` to the counters of the ``key`` bucket, creating it if needed."""
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    pk = model.objects.filter(**key).order_by("pk").values_list("pk", flat=True).first()
+    if pk is None:
+        try:
+            with transaction.atomic():
+                model.objects.create(**key, **deltas)
+            return
+        except IntegrityError:
+            # Created concurrently; add to that row instead.
+            pk = model.objects.filter(**key).order_by("pk").values_list("pk", flat=True).first()
+    model.objects.filter(pk=pk).update(**{field: F(field) + delta for field, delta in deltas.items()})
+
+
+# Bookings
+
+def booking_state(booking):
+    return {field: getattr(booking, field) for field in BOOKING_FIELDS}
+
+
+def stored_booking_state(pk):
+    return Booking.objects.filter(pk=pk).values(*BOOKING_FIELDS).first()
+
+
+def count_booking(state, sign):
+    if state is None or state["created_at"] is None:
+        return
+    bump(
+        BookingDailyStats,
+        {"day": timezone.localdate(state["created_at"]), "status": state["status"]},
+        {"bookings": sign,
+         **{field: sign * Decimal(str(state[field] or 0)).quantize(CENT) for field in BOOKING_AMOUNTS}},
+    )
+
+
+def booking_changed(old, new):
+    if old == new:
+        return
+    count_booking(old, -1)
+    count_booking(new, 1)
+
+
+# Bikes
+
+def bike_state(bike):
+    return {field: getattr(bike, field) for field in BIKE_FIELDS}
+
+
+def stored_bike_state(pk):
+    return BuyBike.objects.filter(pk=pk).values(*BIKE_FIELDS).first()
+
+
+def bucket(state):
+    return {"brand": (state["brand"] or "").strip(), "location_id": state["location_id"]}
+
+
+def count_level(state, sign):
+    if state is None:
+        return
+    booked = bool(state["is_booked"])
+    bump(InventoryLevel, bucket(state), {
+        "on_sale": 0 if booked else sign,
+        "booked": sign if booked else 0,
+        "value": 0 if booked else sign * state["price"],
+    })
+
+
+def count_activity(state, **deltas):
+    bump(InventoryDailyStats, {"day": timezone.localdate(), **bucket(state)}, deltas)
+
+
+def bike_changed(old, new):
+    """Apply a bike going from ``old`` to ``new`` state (``None``: not listed)."""
+    if old == new:
+        return
+    count_level(old, -1)
+    count_level(new, 1)
+    if old is None:
+        count_activity(new, listed=1, booked=1 if new["is_booked"] else 0)
+    elif new is None:
+        count_activity(old, removed=1)
+    elif new["is_booked"] != old["is_booked"]:
+        count_activity(new, **({"booked": 1} if new["is_booked"] else {"released": 1}))
+
+
+# Backfill
+
+@transaction.atomic
+def rebuild():
+    """Recompute all rollups from ``Booking`` and ``BuyBike``."""
+    BookingDailyStats.objects.all().delete()
+    InventoryDailyStats.objects.all().delete()
+    InventoryLevel.objects.all().delete()
+
+    BookingDailyStats.objects.bulk_create([
+        BookingDailyStats(**row) for row in
+        Booking.objects.annotate(day=TruncDate("created_at")).values("day", "status")
+        .annotate(bookings=Count("pk"), **{field: Sum(field) for field in BOOKING_AMOUNTS})
+        .order_by()
+    ], batch_size=1000)
+
+    levels = {}
+    stock = BuyBike.objects.values("brand", "location_id").annotate(
+        on_sale=Count("pk", filter=Q(is_booked=False)),
+        booked=Count("pk", filter=Q(is_booked=True)),
+        value=Sum("price", filter=Q(is_booked=False), default=0),
+    )
+    for row in stock.order_by():
+        key = (row["brand"].strip(), row["location_id"])
+        level = levels.setdefault(key, dict.fromkeys(("on_sale", "booked", "value"), 0))
+        for field in level:
+            level[field] += row[field]
+    InventoryLevel.objects.bulk_create([
+        InventoryLevel(brand=brand, location_id=location_id, **counts)
+        for (brand, location_id), counts in levels.items()
+    ], batch_size=1000)
+
+    # Past bookings and removals are not recorded anywhere else, so the
+    # history only has listings and the bookings of bikes still listed.
+    activity = {}
+    listed = BuyBike.objects.annotate(day=TruncDate("created_at")).values("day", "brand", "location_id")
+    for row in listed.annotate(n=Count("pk")).order_by():
+        counts = activity.setdefault((row["day"], row["brand"].strip(), row["location_id"]), {})
+        counts["listed"] = counts.get("listed", 0) + row["n"]
+    booked = (Booking.objects.exclude(status="cancelled").annotate(day=TruncDate("created_at"))
+              .values("day", brand=F("buybike__brand"), location_id=F("buybike__location_id")))
+    for row in booked.annotate(n=Count("buybike", distinct=True)).order_by():
+        counts = activity.setdefault((row["day"], row["brand"].strip(), row["location_id"]), {})
+        counts["booked"] = counts.get("booked", 0) + row["n"]
+    InventoryDailyStats.objects.bulk_create([
+        InventoryDailyStats(day=day, brand=brand, location_id=location_id, **counts)
+        for (day, brand, location_id), counts in activity.items()
+    ], batch_size=1000)
+
+
+# Reading
+
+def day_range(days, end=None):
+    end = end or timezone.localdate()
+    return end - timedelta(days=days - 1), end
+
+
+def booking_series(start, end):
+    """One entry per day from ``start`` to ``end``, with bookings per status and their amounts."""
+    rows = BookingDailyStats.objects.filter(day__range=(start, end)).values(
+        "day", "status", "bookings", *BOOKING_AMOUNTS
+    )
+    by_day = {}
+    for row in rows:
+        day = by_day.setdefault(row["day"], {})
+        totals = day.setdefault(row["status"], dict.fromkeys(("bookings",) + BOOKING_AMOUNTS, 0))
+        for field in ("bookings",) + BOOKING_AMOUNTS:
+            totals[field] += row[field]
+    series = []
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        statuses = by_day.get(day, {})
+        series.append({
+            "day": day,
+            "bookings": sum(totals["bookings"] for totals in statuses.values()),
+            "statuses": {
+                status: {field: totals[field] if field == "bookings" else str(totals[field])
+                         for field in totals}
+                for status, totals in sorted(statuses.items())
+            },
+        })
+    return series
+
+
+def inventory_series(start, end, brand=None, location=None):
+    """Listings per day from ``start`` to ``end``, optionally for one brand and/or showroom."""
+    rows = InventoryDailyStats.objects.filter(day__range=(start, end))
+    if brand:
+        rows = rows.filter(brand__iexact=brand)
+    if location:
+        rows = rows.filter(location_id=location)
+    counts = ("listed", "booked", "released", "removed")
+    by_day = {row["day"]: row for row in rows.values("day").annotate(**{f: Sum(f) for f in counts}).order_by()}
+    return [
+        {"day": day, **{f: by_day.get(day, {}).get(f, 0) for f in counts}}
+        for day in (start + timedelta(days=offset) for offset in range((end - start).days + 1))
+    ]
+
+
+def inventory_levels():
+    rows = (InventoryLevel.objects.values("brand", "location_id", "location__name")
+            .annotate(on_sale_n=Sum("on_sale"), booked_n=Sum("booked"), value_n=Sum("value"))
+            .order_by("brand", "location__name"))
+    return [
+        {"brand": row["brand"], "location": row["location_id"], "location_name": row["location__name"],
+         "on_sale": row["on_sale_n"], "booked": row["booked_n"], "value": row["value_n"]}
+        for row in rows if row["on_sale_n"] or row["booked_n"]
+    ]
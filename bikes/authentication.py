@@ -0,0 +1,91 @@
+"""
+Stateless signed tokens for the API.
+
+``login_view`` and ``signup_view`` hand out an access/refresh pair, so the
+password hash is checked once per login instead of on every request.
+
+* The access token (``Authorization: Bearer <token>``) is signed with
+  ``SECRET_KEY`` and verified without touching the password hasher.
+  Authenticating a request costs one primary-key lookup.
+* The refresh token is exchanged at ``/api/token/refresh/`` for a new pair.
+  It is bound to the user's current password hash, so changing the password
+  revokes every outstanding refresh token. Access tokens just expire
+  (``BIKES_ACCESS_TOKEN_TTL``).
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.utils.crypto import constant_time_compare, salted_hmac
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+
+
+ACCESS_SALT = "bikes.authentication.access"
+REFRESH_SALT = "bikes.authentication.refresh"
+KEYWORD = "Bearer"
+
+
+def password_fingerprint(user):
+    return salted_hmac(REFRESH_SALT, user.password).hexdigest()[:16]
+
+
+def issue_tokens(user):
+    return {
+        "access": signing.dumps({"uid": user.pk}, salt=ACCESS_SALT),
+        "refresh": signing.dumps({"uid": user.pk, "pwd": password_fingerprint(user)}, salt=REFRESH_SALT),
+        "expires_in": settings.BIKES_ACCESS_TOKEN_TTL,
+    }
+
+
+def read_access_token(token):
+    """Return the user id in a valid, unexpired access token, or raise ``signing.BadSignature``."""
+    return signing.loads(token, salt=ACCESS_SALT, max_age=settings.BIKES_ACCESS_TOKEN_TTL)["uid"]
+
+
+def bearer_token(request):
+    parts = get_authorization_header(request).split()
+    if len(parts) != 2 or parts[0].decode("latin-1").lower() != KEYWORD.lower():
+        return None
+    return parts[1].decode("latin-1")
+
+
+def bearer_user_id(request):
+    """User id from a valid bearer token, without a database query (``None`` otherwise)."""
+    token = bearer_token(request)
+    if token is None:
+        return None
+    try:
+        return read_access_token(token)
+    except signing.BadSignature:
+        return None
+
+
+def refresh_tokens(refresh):
+    try:
+        payload = signing.loads(refresh, salt=REFRESH_SALT, max_age=settings.BIKES_REFRESH_TOKEN_TTL)
+    except signing.BadSignature:
+        raise exceptions.AuthenticationFailed("Invalid or expired refresh token.")
+    user = get_user_model().objects.filter(pk=payload["uid"], is_active=True).first()
+    if user is None or not constant_time_compare(payload["pwd"], password_fingerprint(user)):
+        raise exceptions.AuthenticationFailed("Invalid or expired refresh token.")
+    return issue_tokens(user)
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    def authenticate(self, request):
+        token = bearer_token(request)
+        if token is None:
+            return None
+        try:
+            user_id = read_access_token(token)
+        except signing.SignatureExpired:
+            raise exceptions.AuthenticationFailed("Access token expired.")
+        except signing.BadSignature:
+            raise exceptions.AuthenticationFailed("Invalid access token.")
+        user = get_user_model().objects.filter(pk=user_id, is_active=True).first()
+        if user is None:
+            raise exceptions.AuthenticationFailed("User inactive or deleted.")
+        return user, token
+
+    def authenticate_header(self, request):
+        return KEYWORD
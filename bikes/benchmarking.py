@@ -0,0 +1,159 @@
+"""
+Small helpers shared by the ``bench_*`` management commands.
+
+A benchmark is a list of callables timed with ``perf_counter``; results are
+plain dicts so they can be dumped to JSON and compared with a stored
+baseline.
+"""
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of ``samples`` (``pct`` in 0..100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies, queries=0, peak_kib=0, errors=0):
+    """Collapse raw latencies (seconds) into the reported metrics."""
+    millis = [value * 1000 for value in latencies]
+    return {
+        "requests": len(millis),
+        "p50_ms": round(percentile(millis, 50), 3),
+        "p99_ms": round(percentile(millis, 99), 3),
+        "mean_ms": round(statistics.fmean(millis), 3) if millis else 0.0,
+        "queries": queries,
+        "peak_kib": peak_kib,
+        "errors": errors,
+    }
+
+
+def measure(call, repeat):
+    """
+    Time ``call`` ``repeat`` times. One extra warm-up pass records the query
+    count and peak traced memory so tracing overhead stays out of the timings.
+    """
+    # The query log is a bounded deque; once full its length stops changing
+    # and CaptureQueriesContext would report zero queries.
+    connection.queries_log.clear()
+    with CaptureQueriesContext(connection) as ctx:
+        tracemalloc.start()
+        try:
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    latencies = []
+    errors = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ok = call()
+        latencies.append(time.perf_counter() - start)
+        if ok is False:
+            errors += 1
+    return summarize(latencies, queries=len(ctx.captured_queries), peak_kib=peak // 1024, errors=errors)
+
+
+def compare(results, baseline, keys=("p50_ms", "p99_ms", "queries", "peak_kib")):
+    """
+    Yield ``(scenario, key, old, new, delta_pct)`` for every metric present in
+    both runs. ``delta_pct`` is ``None`` when the baseline value is zero.
+    """
+    for scenario, metrics in results.items():
+        previous = baseline.get(scenario)
+        if not previous:
+            continue
+        for key in keys:
+            if key not in metrics or key not in previous:
+                continue
+            old, new = previous[key], metrics[key]
+            delta = round((new - old) / old * 100, 1) if old else None
+            yield scenario, key, old, new, delta
+
+
+# What a gunicorn worker does before it can serve: configure Django and load
+# the URLconf (which imports every view and serializer module it routes to).
+STARTUP_SCRIPT = (
+    "import sys, django; django.setup(); "
+    "from django.urls import get_resolver; get_resolver().url_patterns; "
+    "print('\\n'.join(sys.modules))"
+)
+
+
+def startup_profile(settings_module="secondsbikes.settings", env=None):
+    """
+    Boot Django in a fresh interpreter under ``python -X importtime``.
+
+    Returns ``(timings, modules)``: ``{module: (self_us, cumulative_us)}`` as
+    reported by importtime (the total import cost is the sum of ``self_us``)
+    and the set of every module loaded once the URLconf is ready.
+    """
+    child_env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module, **(env or {}))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+        capture_output=True, text=True, env=child_env,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings, set(proc.stdout.split())
+
+
+def load_baseline(path):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("results", {})
+
+
+def save_baseline(path, results, meta=None):
+    Path(path).write_text(json.dumps({"meta": meta or {}, "results": results}, indent=2, sort_keys=True))
+
+
+class BenchmarkDatabase:
+    """
+    Context manager that swaps the default connection to a throwaway
+    file-backed test database (file-backed so concurrent writers behave like
+    they do in production rather than against a shared in-memory cache).
+    """
+
+    def __init__(self, verbosity=0):
+        self.verbosity = verbosity
+        self.tmpdir = None
+        self.old_name = None
+
+    def __enter__(self):
+        self.tmpdir = tempfile.TemporaryDirectory(prefix="bikes-bench-")
+        if connection.vendor == "sqlite":
+            connection.settings_dict.setdefault("TEST", {})["NAME"] = str(Path(self.tmpdir.name) / "bench.sqlite3")
+        self.old_name = connection.creation.create_test_db(
+            verbosity=self.verbosity, autoclobber=True, serialize=False
+        )
+        return self
+
+    def __exit__(self, *exc):
+        connection.creation.destroy_test_db(self.old_name, verbosity=self.verbosity)
+        self.tmpdir.cleanup()
+        return False
@@ -0,0 +1,390 @@
+"""
+Cache helpers shared by the app.
+
+Derived data is cached under a per-namespace version number. Bumping the
+version (the model signals in ``bikes/signals.py`` do this on every save or
+delete) makes all keys built from the old version unreachable without having
+to know or delete them one by one; they simply expire. Versions start from
+the clock in nanoseconds, so a version key evicted by the cache comes back
+with a value no older entry was built from.
+
+``cached_api`` applies this to whole JSON responses: the body is stored once
+as identity, gzip and (with the optional ``brotli`` package) Brotli bytes,
+and each request gets the best encoding its ``Accept-Encoding`` allows
+without compressing anything per request. Each URL keeps one entry stamped
+with the versions it was built from, so a stale entry can still be served
+while its replacement is computed (single flight, stale-while-revalidate).
+"""
+import asyncio
+import contextvars
+import functools
+import gzip
+import hashlib
+import threading
+import time
+from functools import partial
+from inspect import iscoroutinefunction
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # optional: br is simply not offered
+    brotli = None
+
+
+# Bodies smaller than this aren't worth compressing.
+MIN_COMPRESS_SIZE = 200
+
+# Response headers kept with a cached body (DRF sets these on its views).
+STORED_HEADERS = ("Vary", "Allow")
+
+# Longest a response computation may hold the cross-process lock.
+LOCK_TIMEOUT = 10
+
+# How often requests waiting on another process's computation look for it.
+POLL_INTERVAL = 0.05
+
+
+def version_key(namespace):
+    return f"version:{namespace}"
+
+
+def new_version():
+    return time.time_ns()
+
+
+def get_version(namespace):
+    return cache.get_or_set(version_key(namespace), new_version, timeout=None)
+
+
+def bump_version(namespace):
+    key = version_key(namespace)
+    if cache.add(key, new_version(), timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, new_version(), timeout=None)
+
+
+def seed_versions(found, keys):
+    """Fill in the version ``keys`` missing from a ``get_many`` result, storing new ones."""
+    for key in keys:
+        if found.get(key) is None:
+            cache.add(key, new_version(), timeout=None)
+            found[key] = cache.get(key) or new_version()
+    return found
+
+
+async def aseed_versions(found, keys):
+    for key in keys:
+        if found.get(key) is None:
+            await cache.aadd(key, new_version(), timeout=None)
+            found[key] = await cache.aget(key) or new_version()
+    return found
+
+
+def versioned_key(namespace, *parts):
+    return ":".join([namespace, f"v{get_version(namespace)}", *map(str, parts)])
+
+
+def version_stamp(namespaces, versions):
+    return ",".join(f"{ns}={versions[version_key(ns)]}" for ns in namespaces)
+
+
+def response_key(namespaces, *parts):
+    digest = hashlib.md5("|".join([*namespaces, *map(str, parts)]).encode()).hexdigest()
+    return f"api:{digest}"
+
+
+def compress(body):
+    """``{encoding: bytes}`` for every encoding worth storing for ``body``."""
+    encoded = {"identity": body}
+    if len(body) >= MIN_COMPRESS_SIZE:
+        encoded["gzip"] = gzip.compress(body, compresslevel=6, mtime=0)
+        if brotli is not None:
+            encoded["br"] = brotli.compress(body, quality=5)
+    return encoded
+
+
+def accepted_encodings(header):
+    """``{coding: q}`` from an ``Accept-Encoding`` header."""
+    accepted = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def negotiate_encoding(header, available):
+    """Pick ``br``, then ``gzip``, then ``identity`` among what the client accepts."""
+    accepted = accepted_encodings(header or "")
+    for coding in ("br", "gzip"):
+        if coding in available and accepted.get(coding, accepted.get("*", 0)) > 0:
+            return coding
+    return "identity"
+
+
+def build_entry(response):
+    """Cache entry for a rendered 200 JSON response, or ``None`` if it must not be stored."""
+    if response.status_code != 200 or response.streaming or response.has_header("Content-Encoding"):
+        return None
+    if not response.get("Content-Type", "").startswith("application/json"):
+        return None
+    return {
+        "content_type": response["Content-Type"],
+        "headers": {name: response[name] for name in STORED_HEADERS if response.has_header(name)},
+        "bodies": compress(response.content),
+    }
+
+
+def respond(entry, request):
+    coding = negotiate_encoding(request.headers.get("Accept-Encoding"), entry["bodies"])
+    response = HttpResponse(entry["bodies"][coding], content_type=entry["content_type"])
+    for name, value in entry["headers"].items():
+        response[name] = value
+    if coding != "identity":
+        response["Content-Encoding"] = coding
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def cacheable_request(request):
+    # Browsers negotiate DRF's HTML browsable API; only JSON is cached.
+    return request.method == "GET" and "text/html" not in request.headers.get("Accept", "")
+
+
+class Flight:
+    """One computation of a cached response, awaited by the other requests for it."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.entry = None
+
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+# Background refreshes still running in async workers (held so they aren't
+# garbage collected mid-flight).
+_tasks = set()
+
+
+def join_flight(key):
+    """``(flight, leader)``: this process's flight for ``key``, and whether the caller leads it."""
+    with _flights_lock:
+        flight = _flights.get(key)
+        if flight is not None:
+            return flight, False
+        flight = _flights[key] = Flight()
+        return flight, True
+
+
+def land_flight(key, flight, entry):
+    flight.entry = entry
+    with _flights_lock:
+        if _flights.get(key) is flight:
+            del _flights[key]
+    flight.done.set()
+
+
+def lock_key(key):
+    return f"{key}:lock"
+
+
+def fresh(record, stamp):
+    return record is not None and record["stamp"] == stamp and record["expires"] > time.time()
+
+
+def make_record(stamp, entry, lifetime):
+    return {"stamp": stamp, "expires": time.time() + lifetime, "entry": entry}
+
+
+def stored_for(lifetime):
+    # Kept past its lifetime so it can still be served while being refreshed.
+    return lifetime + settings.BIKES_API_CACHE_STALE_TIMEOUT
+
+
+def wait_for_record(key, stamp):
+    """Poll the shared cache while another process computes ``key``."""
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        record = cache.get(key)
+        if record is not None and record["stamp"] == stamp:
+            return record["entry"]
+        if cache.get(lock_key(key)) is None:
+            break
+    return None
+
+
+async def await_record(key, stamp):
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(POLL_INTERVAL)
+        record = await cache.aget(key)
+        if record is not None and record["stamp"] == stamp:
+            return record["entry"]
+        if await cache.aget(lock_key(key)) is None:
+            break
+    return None
+
+
+async def await_flight(flight):
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while not flight.done.is_set() and time.monotonic() < deadline:
+        await asyncio.sleep(POLL_INTERVAL)
+    return flight.entry
+
+
+def in_background(func):
+    """Run ``func`` in a daemon thread, in a copy of the current context, with its own DB connections."""
+    def run():
+        try:
+            func()
+        finally:
+            connections.close_all()
+    context = contextvars.copy_context()
+    threading.Thread(target=context.run, args=(run,), daemon=True).start()
+
+
+def cached_api(*models, timeout=None):
+    """
+    Cache a read-only JSON view's responses, precompressed, until any of
+    ``models`` changes (or ``timeout``, default ``BIKES_API_CACHE_TIMEOUT``).
+    Works on sync and async views.
+
+    A response is computed once at a time per URL: within a process,
+    concurrent requests wait for the first one (single flight), and across
+    processes a lock in the cache elects one to compute. Requests arriving
+    while a payload is being recomputed get the previous one at once if it
+    is still around (``BIKES_API_CACHE_STALE_TIMEOUT``). When a payload only
+    timed out, even the request that notices gets the old one and it is
+    refreshed in the background; after a model change that request waits
+    for the new payload, so editors see their own change.
+    """
+    namespaces = [model._meta.label_lower for model in models]
+    version_keys = [version_key(ns) for ns in namespaces]
+
+    def entry_key(request):
+        return response_key(namespaces, request.build_absolute_uri(request.get_full_path()))
+
+    def lifetime():
+        return settings.BIKES_API_CACHE_TIMEOUT if timeout is None else timeout
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            async def compute(key, stamp, request, args, kwargs):
+                response = await view(request, *args, **kwargs)
+                entry = build_entry(response)
+                if entry is not None:
+                    await cache.aset(key, make_record(stamp, entry, lifetime()), stored_for(lifetime()))
+                return response, entry
+
+            async def refresh(key, stamp, flight, request, args, kwargs):
+                entry = None
+                try:
+                    _, entry = await compute(key, stamp, request, args, kwargs)
+                finally:
+                    await cache.adelete(lock_key(key))
+                    land_flight(key, flight, entry)
+
+            async def wrapper(request, *args, **kwargs):
+                if not cacheable_request(request) or lifetime() <= 0:
+                    return await view(request, *args, **kwargs)
+                key = entry_key(request)
+                stamp = version_stamp(namespaces, await aseed_versions(await cache.aget_many(version_keys),
+                                                                       version_keys))
+                record = await cache.aget(key)
+                if fresh(record, stamp):
+                    return respond(record["entry"], request)
+
+                flight, leader = join_flight(key)
+                if not leader:
+                    entry = record["entry"] if record is not None else await await_flight(flight)
+                    return respond(entry, request) if entry is not None else await view(request, *args, **kwargs)
+                if not await cache.aadd(lock_key(key), 1, LOCK_TIMEOUT):
+                    entry = record["entry"] if record is not None else await await_record(key, stamp)
+                    land_flight(key, flight, entry)
+                    return respond(entry, request) if entry is not None else await view(request, *args, **kwargs)
+                if record is not None and record["stamp"] == stamp:
+                    task = asyncio.get_running_loop().create_task(refresh(key, stamp, flight, request, args, kwargs))
+                    _tasks.add(task)
+                    task.add_done_callback(_tasks.discard)
+                    return respond(record["entry"], request)
+
+                response, entry = None, None
+                try:
+                    response, entry = await compute(key, stamp, request, args, kwargs)
+                finally:
+                    await cache.adelete(lock_key(key))
+                    land_flight(key, flight, entry)
+                return respond(entry, request) if entry is not None else response
+        else:
+            def compute(key, stamp, request, args, kwargs):
+                response = view(request, *args, **kwargs)
+                if hasattr(response, "render") and not response.is_rendered:
+                    response.render()
+                entry = build_entry(response)
+                if entry is not None:
+                    cache.set(key, make_record(stamp, entry, lifetime()), stored_for(lifetime()))
+                return response, entry
+
+            def refresh(key, stamp, flight, request, args, kwargs):
+                entry = None
+                try:
+                    _, entry = compute(key, stamp, request, args, kwargs)
+                finally:
+                    cache.delete(lock_key(key))
+                    land_flight(key, flight, entry)
+
+            def wrapper(request, *args, **kwargs):
+                if not cacheable_request(request) or lifetime() <= 0:
+                    # A zero timeout turns caching off (stale copies included).
+                    return view(request, *args, **kwargs)
+                key = entry_key(request)
+                stamp = version_stamp(namespaces, seed_versions(cache.get_many(version_keys), version_keys))
+                record = cache.get(key)
+                if fresh(record, stamp):
+                    return respond(record["entry"], request)
+
+                flight, leader = join_flight(key)
+                if not leader:
+                    # Someone in this process is on it: the old payload now, or theirs.
+                    entry = record["entry"] if record is not None else (
+                        flight.entry if flight.done.wait(LOCK_TIMEOUT) else None
+                    )
+                    return respond(entry, request) if entry is not None else view(request, *args, **kwargs)
+                if not cache.add(lock_key(key), 1, LOCK_TIMEOUT):
+                    # Another process is on it.
+                    entry = record["entry"] if record is not None else wait_for_record(key, stamp)
+                    land_flight(key, flight, entry)
+                    return respond(entry, request) if entry is not None else view(request, *args, **kwargs)
+                if record is not None and record["stamp"] == stamp:
+                    # Merely expired: serve it and refresh behind the response.
+                    in_background(partial(refresh, key, stamp, flight, request, args, kwargs))
+                    return respond(record["entry"], request)
+
+                response, entry = None, None
+                try:
+                    response, entry = compute(key, stamp, request, args, kwargs)
+                finally:
+                    cache.delete(lock_key(key))
+                    land_flight(key, flight, entry)
+                return respond(entry, request) if entry is not None else response
+        return functools.wraps(view)(wrapper)
+
+    return decorator
@@ -0,0 +1,79 @@
+"""
+Change feed for incremental catalog sync.
+
+Every save or delete of a ``BuyBike`` (and every change to a ``Location``,
+which is embedded in the bike payload) writes a ``CatalogChange`` row from
+``bikes/signals.py``. A bike keeps only its newest row, so the log holds at
+most one entry per bike and a client that has been away for a week still
+gets each changed bike once.
+
+Clients keep the ``cursor`` of the last page and ask for
+``/api/buybikes/changes/?since=<cursor>``; ``since=0`` (or no ``since``)
+starts from scratch and lists every bike. Ids are allocated before their
+transaction commits, so a row with a lower id can become visible after a
+higher one; changes younger than ``BIKES_CHANGES_SETTLE_SECONDS`` are held
+back until any such transaction has finished, and a cursor never skips a
+change.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import BuyBike, CatalogChange
+
+
+DEFAULT_LIMIT = 200
+MAX_LIMIT = 1000
+
+
+def record_changes(bike_ids, deleted=False):
+    """Move ``bike_ids`` to the head of the log."""
+    bike_ids = list(bike_ids)
+    if not bike_ids:
+        return
+    CatalogChange.objects.filter(bike_id__in=bike_ids).delete()
+    CatalogChange.objects.bulk_create([CatalogChange(bike_id=pk, deleted=deleted) for pk in bike_ids])
+
+
+def settled_before():
+    return timezone.now() - timedelta(seconds=getattr(settings, "BIKES_CHANGES_SETTLE_SECONDS", 5))
+
+
+def settled_cursor():
+    """A cursor from which ``read_changes`` will not miss any later change."""
+    return (
+        CatalogChange.objects.filter(changed_at__lte=settled_before())
+        .order_by("-id").values_list("id", flat=True).first() or 0
+    )
+
+
+def read_changes(since, limit):
+    """
+    Return ``(changes, cursor, more)``: up to ``limit`` settled log rows after
+    ``since``, the cursor to resume from, and whether more rows are waiting.
+    """
+    rows = list(
+        CatalogChange.objects.filter(id__gt=since, changed_at__lte=settled_before())
+        .order_by("id")
+        .values_list("id", "bike_id", "deleted")[: limit + 1]
+    )
+    more = len(rows) > limit
+    rows = rows[:limit]
+    cursor = rows[-1][0] if rows else since
+    return rows, cursor, more
+
+
+def changed_bikes(rows):
+    """Split log rows into ``(bikes, deleted_ids)``, in log order."""
+    live_ids = [bike_id for _, bike_id, deleted in rows if not deleted]
+    bikes = BuyBike.objects.select_related("location").in_bulk(live_ids)
+    found, deleted_ids = [], []
+    for _, bike_id, deleted in rows:
+        bike = bikes.get(bike_id)
+        if bike is None:
+            # Deleted after this row was read; the tombstone is further on.
+            deleted_ids.append(bike_id)
+        else:
+            found.append(bike)
+    return found, deleted_ids
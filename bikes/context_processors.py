@@ -1,5 +1,6 @@
-from .models import Footer
+from .layout import get_layout
+
 
 def footer_context(request):
-    footer = Footer.objects.first()
-    return {"footer": footer}
\ No newline at end of file
+    layout = get_layout()
+    return {"footer": layout.footer, "site_layout": layout.as_data(request)}
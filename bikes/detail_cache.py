@@ -0,0 +1,193 @@
+"""
+Two-tier cache of serialized ``BuyBikeDetail`` payloads.
+
+A payload is keyed by the bike's pk and ``updated_at`` (its *stamp*), the
+``Location`` and ``BuyBikeImage`` versions (``bikes/cache.py``) and the
+site root its absolute image URLs were built for. Lookups go through
+
+1. a bounded, per-worker LRU with a TTL (no I/O at all), then
+2. the shared cache backend, then
+3. the database and ``BuyBikeDetailSerializer``, filling both tiers.
+
+Stamps live in the shared cache, so one ``get_many`` per request tells every
+worker whether its copy is current. ``bikes/signals.py`` stores the new
+stamp when a save commits (bookings save the bike too) and drops it on
+delete; a showroom or gallery edit moves the versions instead. An entry
+that is no longer current is never read again and just ages out.
+
+This relies on every worker seeing the same stamps, so it needs a shared
+cache backend (``REDIS_URL``). With the per-process default, a worker that
+didn't make the save keeps its old stamp and would serve a booked bike as
+available; ``gunicorn.conf.py`` refuses to start several workers without
+one.
+
+Hit, miss and eviction counts are kept per worker and added to the shared
+``bikes_detail_cache_events`` counter (``/api/metrics/``) every
+``FLUSH_INTERVAL`` seconds.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404
+
+from . import metrics
+from .cache import aseed_versions, seed_versions, version_key
+from .models import BuyBike, BuyBikeImage, Location
+
+
+EVENTS_METRIC = "bikes_detail_cache_events"
+
+FLUSH_INTERVAL = 10
+
+VERSION_KEYS = [version_key(model._meta.label_lower) for model in (Location, BuyBikeImage)]
+
+
+def stamp_key(pk):
+    return f"buybike-stamp:{pk}"
+
+
+def stamp_of(updated_at):
+    return updated_at.isoformat()
+
+
+class LRUCache:
+    """A bounded, thread-safe LRU whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.counts = {}
+
+    def count(self, event, tier):
+        # Caller holds ``lock``.
+        key = (tier, event)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def get(self, key):
+        now = time.monotonic()
+        with self.lock:
+            item = self.entries.get(key)
+            if item is not None and item[0] > now:
+                self.entries.move_to_end(key)
+                self.count("hit", "local")
+                return item[1]
+            if item is not None:
+                del self.entries[key]
+                self.count("eviction", "local")
+            self.count("miss", "local")
+            return None
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.count("eviction", "local")
+
+    def take_counts(self):
+        with self.lock:
+            counts, self.counts = self.counts, {}
+        return counts
+
+
+class DetailCache:
+    def __init__(self, max_entries, ttl):
+        self.local = LRUCache(max_entries, ttl)
+        self.flushed_at = time.monotonic()
+
+    @staticmethod
+    def stamp_from_db(pk):
+        updated_at = BuyBike.objects.filter(pk=pk).values_list("updated_at", flat=True).first()
+        if updated_at is None:
+            raise Http404("No BuyBike matches the given query.")
+        stamp = stamp_of(updated_at)
+        # add(): never overwrite a newer stamp stored by a save meanwhile.
+        cache.add(stamp_key(pk), stamp, timeout=None)
+        return stamp
+
+    @staticmethod
+    def entry_key(request, pk, stamp, found):
+        versions = ",".join(str(found[key]) for key in VERSION_KEYS)
+        return f"buybike-detail:{pk}:{stamp}:{versions}:{request.build_absolute_uri('/')}"
+
+    def fetch(self, request, pk, build):
+        """
+        ``build()``'s serialized payload for bike ``pk``, from the nearest
+        tier that has it; raises ``Http404`` when the bike doesn't exist.
+        """
+        found = seed_versions(cache.get_many([stamp_key(pk), *VERSION_KEYS]), VERSION_KEYS)
+        stamp = found.get(stamp_key(pk)) or self.stamp_from_db(pk)
+        key = self.entry_key(request, pk, stamp, found)
+        data = self.local.get(key)
+        if data is None:
+            data = self.shared_result(key, cache.get(key))
+        if data is None:
+            data = build()
+            self.set(key, data)
+        self.maybe_flush()
+        return data
+
+    async def afetch(self, request, pk, build):
+        """``fetch`` for async views; ``build`` and any database access run in a thread."""
+        found = await aseed_versions(await cache.aget_many([stamp_key(pk), *VERSION_KEYS]), VERSION_KEYS)
+        stamp = found.get(stamp_key(pk)) or await sync_to_async(self.stamp_from_db)(pk)
+        key = self.entry_key(request, pk, stamp, found)
+        data = self.local.get(key)
+        if data is None:
+            data = self.shared_result(key, await cache.aget(key))
+        if data is None:
+            data = await sync_to_async(build)()
+            await cache.aset(key, data, settings.BIKES_API_CACHE_TIMEOUT)
+            self.local.set(key, data)
+        self.maybe_flush()
+        return data
+
+    def shared_result(self, key, data):
+        """Count the shared-tier lookup of ``key`` that returned ``data``; keep a hit locally."""
+        with self.local.lock:
+            self.local.count("miss" if data is None else "hit", "shared")
+        if data is not None:
+            self.local.set(key, data)
+        return data
+
+    def set(self, key, data):
+        cache.set(key, data, settings.BIKES_API_CACHE_TIMEOUT)
+        self.local.set(key, data)
+
+    def maybe_flush(self):
+        now = time.monotonic()
+        if now - self.flushed_at < FLUSH_INTERVAL:
+            return
+        self.flushed_at = now
+        self.flush()
+
+    def flush(self):
+        for (tier, event), n in self.local.take_counts().items():
+            metrics.incr(EVENTS_METRIC, amount=n, tier=tier, event=event)
+
+
+detail_cache = DetailCache(
+    getattr(settings, "BIKES_DETAIL_CACHE_SIZE", 1000), getattr(settings, "BIKES_DETAIL_CACHE_TTL", 60),
+)
+
+
+def event_label_sets():
+    # The shared tier expires entries itself; it reports no evictions.
+    return [{"tier": "local", "event": event} for event in ("hit", "miss", "eviction")] + [
+        {"tier": "shared", "event": event} for event in ("hit", "miss")
+    ]
+
+
+def store_stamp(pk, updated_at):
+    cache.set(stamp_key(pk), stamp_of(updated_at), timeout=None)
+
+
+def drop_stamp(pk):
+    cache.delete(stamp_key(pk))
@@ -0,0 +1,138 @@
+"""
+Live catalog events for ``/api/events/`` (server-sent events, ASGI only).
+
+Each worker process has one ``Broker``. Every connected client holds a
+``Subscription`` (a bounded queue) and the broker fans each event out to
+all of them, so N viewers cost one encode and N queue puts, not N queries.
+
+Events reach the broker two ways:
+
+* Bikes saved or deleted in this worker are published when the transaction
+  commits (``bikes/signals.py``), so this worker's viewers see them at once.
+* Changes made in other workers are read from the catalog change log
+  (``bikes/changes.py``) by a single poller per worker, every
+  ``BIKES_EVENTS_POLL_INTERVAL`` seconds, and only while someone is
+  subscribed. They arrive after the log's settle window.
+
+A bike may therefore be pushed twice; the payload is its current state, so
+clients just upsert. A client whose queue fills up is disconnected and
+should reconnect (``EventSource`` does so on its own) and catch up through
+``/api/buybikes/changes/``.
+"""
+import asyncio
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .changes import read_changes, settled_cursor
+from .models import BuyBike
+from .serializers.catalog import BikeEventSerializer
+
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = 100
+
+POLL_BATCH = 500
+
+
+def frame(kind, data):
+    return f"event: {kind}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+def bike_frame(bike):
+    return bike.pk, frame("bike", BikeEventSerializer(bike).data)
+
+
+def removed_frame(bike_id):
+    return bike_id, frame("removed", {"id": bike_id})
+
+
+def poll_changes(cursor):
+    """Frames for the settled changes after ``cursor``, and the new cursor."""
+    rows, cursor, _ = read_changes(cursor, POLL_BATCH)
+    live_ids = [bike_id for _, bike_id, deleted in rows if not deleted]
+    bikes = BuyBike.objects.only(*BikeEventSerializer.Meta.fields).in_bulk(live_ids)
+    frames = [bike_frame(bikes[bike_id]) if bike_id in bikes else removed_frame(bike_id)
+              for _, bike_id, _ in rows]
+    return frames, cursor
+
+
+class Subscription:
+    def __init__(self, bike_id=None):
+        self.bike_id = bike_id
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.closed = False
+
+
+class Broker:
+    def __init__(self):
+        self.subscriptions = set()
+        self.loop = None
+        self.cursor = None
+        self._poller = None
+
+    def subscribe(self, bike_id=None):
+        """Register a client on the running loop; pass ``bike_id`` to follow one bike."""
+        self.loop = asyncio.get_running_loop()
+        subscription = Subscription(bike_id)
+        self.subscriptions.add(subscription)
+        if self._poller is None:
+            self._poller = self.loop.create_task(self._poll())
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self.subscriptions.discard(subscription)
+        if not self.subscriptions and self._poller is not None:
+            self._poller.cancel()
+            self._poller = None
+            self.cursor = None
+
+    def fan_out(self, frames):
+        """Queue ``(bike_id, frame)`` pairs for matching subscribers. Loop thread only."""
+        for subscription in list(self.subscriptions):
+            for bike_id, data in frames:
+                if subscription.bike_id not in (None, bike_id):
+                    continue
+                try:
+                    subscription.queue.put_nowait(data)
+                except asyncio.QueueFull:
+                    subscription.closed = True
+                    self.unsubscribe(subscription)
+                    break
+
+    def publish(self, frames):
+        """Thread-safe ``fan_out``; a no-op until a client has subscribed."""
+        loop = self.loop
+        if loop is not None and not loop.is_closed() and self.subscriptions:
+            loop.call_soon_threadsafe(self.fan_out, frames)
+
+    async def _poll(self):
+        interval = getattr(settings, "BIKES_EVENTS_POLL_INTERVAL", 1)
+        while True:
+            try:
+                if self.cursor is None:
+                    # Not the newest id: earlier ids may still be committing.
+                    self.cursor = await sync_to_async(settled_cursor)()
+                else:
+                    frames, self.cursor = await sync_to_async(poll_changes)(self.cursor)
+                    if frames:
+                        self.fan_out(frames)
+            except Exception:
+                logger.exception("Polling the catalog change log failed")
+            await asyncio.sleep(interval)
+
+
+broker = Broker()
+
+
+def publish_bike(bike):
+    if broker.subscriptions:
+        broker.publish([bike_frame(bike)])
+
+
+def publish_removed(bike_id):
+    if broker.subscriptions:
+        broker.publish([removed_frame(bike_id)])
@@ -1,6 +1,78 @@
 import django_filters
-from django.db.models import Q
-from .models import BuyBike
+from django import forms
+from django.conf import settings
+from django.db.models import Case, FloatField, Q, Value, When
+from rest_framework.filters import OrderingFilter
+
+from .fuzzy import fuzzy_match
+from .geo import covering_cells, distances_km, prefix_q
+from .models import BuyBike, Location
+
+
+class LatLngField(forms.CharField):
+    def to_python(self, value):
+        value = super().to_python(value)
+        if not value:
+            return None
+        try:
+            lat, lng = (float(part) for part in value.split(","))
+        except ValueError:
+            raise forms.ValidationError("Enter coordinates as lat,lng.")
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            raise forms.ValidationError("Coordinates are out of range.")
+        return lat, lng
+
+
+class LatLngFilter(django_filters.CharFilter):
+    field_class = LatLngField
+
+
+def near(queryset, lat, lng, radius_km=None):
+    """
+    Bikes at showrooms within ``radius_km`` of ``(lat, lng)`` (any distance
+    when ``None``), annotated with ``distance`` in km. Distances are computed
+    once per showroom, not per bike.
+    """
+    locations = Location.objects.exclude(geohash="")
+    cells = covering_cells(lat, lng, radius_km) if radius_km is not None else None
+    if cells:
+        locations = locations.filter(prefix_q("geohash", cells))
+    rows = list(locations.values_list("pk", "latitude", "longitude"))
+    distances = distances_km(lat, lng, [(row_lat, row_lng) for _, row_lat, row_lng in rows])
+    in_range = {
+        pk: round(distance, 3)
+        for (pk, _, _), distance in zip(rows, distances)
+        if radius_km is None or distance <= radius_km
+    }
+    if not in_range:
+        return queryset.none()
+    return queryset.filter(location_id__in=in_range).annotate(
+        distance=Case(*(When(location_id=pk, then=Value(d)) for pk, d in in_range.items()),
+                      output_field=FloatField())
+    )
+
+
+class AnnotatedOrderingFilter(OrderingFilter):
+    """
+    Allows ordering by the annotations ``BikeFilter`` may add: ``distance``
+    (with ``near``) and ``relevance`` (with a fuzzy ``search``). Without an
+    explicit ``ordering`` the results are sorted by them first; ordering by
+    one that is absent is ignored.
+    """
+    # Default direction of each annotation, in priority order.
+    annotations = ["-relevance", "distance"]
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        present = queryset.query.annotations
+        ordering = [field for field in ordering
+                    if field.lstrip("-") in present or field.lstrip("-") not in self.annotation_names()]
+        if not request.query_params.get(self.ordering_param):
+            return [field for field in self.annotations if field.lstrip("-") in present] + ordering
+        return ordering
+
+    def annotation_names(self):
+        return {field.lstrip("-") for field in self.annotations}
 
 class BikeFilter(django_filters.FilterSet):
     price_min = django_filters.NumberFilter(field_name="price", lookup_expr="gte")
@@ -17,9 +89,14 @@ class BikeFilter(django_filters.FilterSet):
     fuel_type = django_filters.CharFilter(field_name="fuel_type", lookup_expr="icontains")
     color = django_filters.CharFilter(field_name="color", lookup_expr="icontains")
 
-    # custom multi-field search (search across title/description/brand/location.name)
+    # custom multi-field search (title/description/brand/category/location.name),
+    # falling back to typo-tolerant matching when it finds little
     search = django_filters.CharFilter(method="search_filter")
 
+    # near=lat,lng[&radius=km]: bikes at the closest showrooms first
+    near = LatLngFilter(method="near_filter")
+    radius = django_filters.NumberFilter(method="radius_filter", min_value=0)
+
     class Meta:
         model = BuyBike
         # keep fields empty so only our custom filters are exposed
@@ -27,9 +104,29 @@ class BikeFilter(django_filters.FilterSet):
 
     def search_filter(self, queryset, name, value):
         # treat location as FK -> search location.name
-        return queryset.filter(
+        exact = (
             Q(title__icontains=value) |
             Q(description__icontains=value) |
             Q(brand__icontains=value) |
+            Q(category__icontains=value) |
             Q(location__name__icontains=value)
         )
+        # Few exact hits: also take close spellings (bikes/fuzzy.py), best first.
+        sparse = getattr(settings, "BIKES_FUZZY_MIN_RESULTS", 5)
+        if queryset.filter(exact)[:sparse].count() >= sparse:
+            return queryset.filter(exact)
+        fuzzy = fuzzy_match(value)
+        if fuzzy is None:
+            return queryset.filter(exact)
+        match, relevance = fuzzy
+        return queryset.filter(exact | match).annotate(
+            relevance=Case(When(exact, then=Value(1.0)), default=relevance, output_field=FloatField())
+        )
+
+    def near_filter(self, queryset, name, value):
+        radius = self.form.cleaned_data.get("radius")
+        return near(queryset, *value, float(radius) if radius is not None else None)
+
+    def radius_filter(self, queryset, name, value):
+        # Applied by near_filter.
+        return queryset
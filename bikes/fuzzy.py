@@ -0,0 +1,97 @@
+"""
+Typo-tolerant matching for the catalog ``search`` parameter.
+
+Words are compared by trigram similarity, as PostgreSQL's ``pg_trgm``
+does: each word is padded ("  enfield ") and split into three-letter
+grams, and two words score ``shared / (grams1 + grams2 - shared)``, so
+"enfeild" scores 0.33 against "enfield".
+
+The words compared against are the vocabulary of the brands, models and
+titles on sale, taken from the worker's suggestion index
+(``bikes/suggest.py``) and inverted by trigram. Fuzzy matching therefore
+happens in memory over a few thousand words, not per bike, and the
+database only sees the resulting ``icontains`` lookups. That works the same
+on SQLite and PostgreSQL and needs no extension.
+"""
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Case, FloatField, Q, Value, When
+
+from .suggest import get_index
+
+
+FIELDS = ("brand", "bike_model", "title")
+
+WORD = re.compile(r"[^\W_]+")
+
+MIN_WORD_LENGTH = 3
+
+# Spelling variants tried per query word.
+MAX_VARIANTS = 5
+
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    def __init__(self, words):
+        self.words = sorted(words)
+        self.grams = [trigrams(word) for word in self.words]
+        self.postings = {}
+        for i, grams in enumerate(self.grams):
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(i)
+
+    def similar(self, word, threshold, limit=MAX_VARIANTS):
+        """Up to ``limit`` ``(word, similarity)`` pairs scoring at least ``threshold``, best first."""
+        grams = trigrams(word)
+        shared = Counter(i for gram in grams for i in self.postings.get(gram, ()))
+        scored = []
+        for i, count in shared.items():
+            score = count / (len(grams) + len(self.grams[i]) - count)
+            if score >= threshold:
+                scored.append((score, self.words[i]))
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return [(w, score) for score, w in scored[:limit]]
+
+
+def vocabulary():
+    """The ``TrigramIndex`` of the current suggestion index, built once per version of it."""
+    index = get_index()
+    if index.fuzzy is None:
+        index.fuzzy = TrigramIndex({
+            word for (field, value) in index.terms if field in FIELDS for word in WORD.findall(value)
+        })
+    return index.fuzzy
+
+
+def word_q(word):
+    return Q(**{f"{field}__icontains": word for field in FIELDS}, _connector=Q.OR)
+
+
+def fuzzy_match(text, threshold=None):
+    """
+    ``(q, relevance)`` for bikes whose brand, model or title contain a close
+    spelling of every word of ``text``, with ``relevance`` the mean
+    similarity of the best spellings found (1.0 when all are exact). ``None``
+    when some word has no close spelling.
+    """
+    if threshold is None:
+        threshold = getattr(settings, "BIKES_FUZZY_THRESHOLD", 0.3)
+    words = [word for word in WORD.findall(text.casefold()) if len(word) >= MIN_WORD_LENGTH]
+    if not words:
+        return None
+    index = vocabulary()
+    match, scores = Q(), []
+    for word in words:
+        variants = index.similar(word, threshold)
+        if not variants:
+            return None
+        match &= Q(*(word_q(variant) for variant, _ in variants), _connector=Q.OR)
+        scores.append(Case(*(When(word_q(variant), then=Value(score)) for variant, score in variants),
+                           default=Value(0.0), output_field=FloatField()))
+    return match, sum(scores[1:], scores[0]) / len(scores)
@@ -0,0 +1,108 @@
+"""
+Geohash index and distances for showroom locations, without PostGIS.
+
+Each ``Location`` stores a geohash of its coordinates in an indexed column.
+A radius search first narrows showrooms to the 3x3 block of geohash cells
+around the centre, at the finest precision whose cells are still at least
+the radius across (so the circle cannot leave the block). Each cell is a
+prefix, i.e. a plain index range scan. Exact great-circle distances are
+then computed for the few candidates in one pass.
+"""
+import math
+
+from django.db.models import Q
+
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+PRECISION = 9
+
+EARTH_RADIUS_KM = 6371.0088
+
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def encode(latitude, longitude, precision=PRECISION):
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, coord = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def cell_size(precision):
+    """``(lat_degrees, lng_degrees)`` covered by one cell."""
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180 / 2 ** lat_bits, 360 / 2 ** lng_bits
+
+
+def distances_km(latitude, longitude, points):
+    """Distances from one origin to many ``(lat, lng)`` points, origin terms computed once."""
+    phi1 = math.radians(latitude)
+    cos_phi1 = math.cos(phi1)
+    lam1 = math.radians(longitude)
+    out = []
+    for lat, lng in points:
+        phi2 = math.radians(lat)
+        a = (math.sin((phi2 - phi1) / 2) ** 2
+             + cos_phi1 * math.cos(phi2) * math.sin((math.radians(lng) - lam1) / 2) ** 2)
+        out.append(2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a))))
+    return out
+
+
+def covering_cells(latitude, longitude, radius_km):
+    """
+    Geohash prefixes whose cells together contain every point within
+    ``radius_km``, or ``None`` when the radius is too large to be worth it.
+    """
+    # Longitude degrees shrink towards the poles; size for the worst latitude.
+    worst_lat = min(89.0, abs(latitude) + radius_km / KM_PER_DEGREE)
+    lng_km = KM_PER_DEGREE * math.cos(math.radians(worst_lat))
+    for precision in range(PRECISION, 0, -1):
+        lat_deg, lng_deg = cell_size(precision)
+        if lat_deg * KM_PER_DEGREE >= radius_km and lng_deg * lng_km >= radius_km:
+            break
+    else:
+        return None
+    if precision == 1:
+        return None
+    cells = set()
+    for dlat in (-lat_deg, 0, lat_deg):
+        for dlng in (-lng_deg, 0, lng_deg):
+            lat = max(-90.0, min(90.0, latitude + dlat))
+            lng = (longitude + dlng + 180) % 360 - 180
+            cells.add(encode(lat, lng, precision))
+    return sorted(cells)
+
+
+def next_prefix(prefix):
+    """The smallest string greater than every string starting with ``prefix``."""
+    stripped = prefix.rstrip(BASE32[-1])
+    if not stripped:
+        return None
+    return stripped[:-1] + BASE32[BASE32.index(stripped[-1]) + 1]
+
+
+def prefix_q(field, cells):
+    """``Q`` matching ``field`` values in any of ``cells``, as index range scans."""
+    q = Q()
+    for cell in cells:
+        upper = next_prefix(cell)
+        rng = Q(**{f"{field}__gte": cell})
+        if upper is not None:
+            rng &= Q(**{f"{field}__lt": upper})
+        q |= rng
+    return q
@@ -0,0 +1,19 @@
+"""
+Password hashing with an operator-controlled cost.
+
+``TunablePBKDF2PasswordHasher`` is Django's PBKDF2-SHA256 hasher with the
+iteration count taken from ``BIKES_PBKDF2_ITERATIONS`` (Django's default when
+unset). It keeps the ``pbkdf2_sha256`` algorithm name, so existing hashes
+verify unchanged, and Django re-hashes a password at the configured count
+the next time that user logs in. Raising the count hardens hashes over time;
+lowering it under login load takes effect for each user after their next
+login.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return getattr(settings, "BIKES_PBKDF2_ITERATIONS", None) or PBKDF2PasswordHasher.iterations
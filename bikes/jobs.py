@@ -0,0 +1,255 @@
+"""
+A small job queue kept in the database, so there is no broker to run.
+
+Work is registered under a name with ``@job`` (``bikes/tasks.py``) and
+queued with ``enqueue(name, **kwargs)``. The ``Job`` row is written in the
+caller's transaction: a job queued by a request that rolls back never runs,
+and one queued by a request that commits is never lost.
+
+``manage.py run_jobs`` runs a pool of worker threads, optionally in several
+processes. A thread claims the highest-priority job that is due with one
+conditional ``UPDATE``, so no two workers run the same job, and that
+``UPDATE`` also checks the job type's ``concurrency`` limit across all
+workers. A claimed job is leased for its type's ``timeout``. If its worker
+dies, the job is claimed again once the lease runs out.
+
+A failing job is retried after ``RETRY_BASE * 2 ** (attempt - 1)`` seconds
+(at most ``RETRY_MAX``, with jitter) until it has used ``max_attempts``.
+Then it is kept as "dead", with its traceback, for the admin to inspect and
+requeue. Outcomes and run time per job type are counted in the shared
+metrics (``/api/metrics/``), next to the queue depth read from the table.
+"""
+import os
+import random
+import socket
+import threading
+import time
+import traceback
+from datetime import timedelta
+
+from django.db import close_old_connections, connection, connections, transaction
+from django.db.models import Count, Exists, F
+from django.utils import timezone
+
+from . import metrics
+from .models import Job
+
+
+RUNS_METRIC = "bikes_jobs_total"
+
+RUN_TIME_METRIC = "bikes_job_run_milliseconds_total"
+
+DEPTH_METRIC = "bikes_jobs"
+
+OUTCOMES = ("done", "retried", "dead")
+
+RETRY_BASE = 10
+
+RETRY_MAX = 3600
+
+# Due jobs looked at per claim.
+CLAIM_BATCH = 20
+
+
+class JobType:
+    def __init__(self, name, func, priority, concurrency, max_attempts, timeout):
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+
+
+JOBS = {}
+
+
+def job(name=None, priority=0, concurrency=4, max_attempts=5, timeout=300):
+    """
+    Register the decorated function as a job type. ``concurrency`` caps how
+    many of its jobs run at once over all workers; ``timeout`` is the lease
+    after which a job whose worker vanished is run again.
+    """
+    def register(func):
+        key = name or func.__name__
+        JOBS[key] = JobType(key, func, priority, concurrency, max_attempts, timeout)
+        return func
+    return register
+
+
+def enqueue(name, /, priority=None, delay=0, **kwargs):
+    """Queue job ``name`` to run ``func(**kwargs)``; ``kwargs`` must be JSON-serializable."""
+    spec = JOBS.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown job {name!r}")
+    return Job.objects.create(
+        name=name,
+        kwargs=kwargs,
+        priority=spec.priority if priority is None else priority,
+        max_attempts=spec.max_attempts,
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def retry_delay(attempt):
+    delay = min(RETRY_MAX, RETRY_BASE * 2 ** (attempt - 1))
+    return delay * random.uniform(0.5, 1)
+
+
+# Claiming
+
+def due(now):
+    """Jobs that may be claimed: queued and due, or running on an expired lease."""
+    return Job.objects.filter(status=Job.QUEUED, run_at__lte=now) | Job.objects.filter(
+        status=Job.RUNNING, locked_until__lte=now,
+    )
+
+
+def running(now):
+    return Job.objects.filter(status=Job.RUNNING, locked_until__gt=now)
+
+
+def lock_type(name):
+    # SQLite runs one write at a time; PostgreSQL needs the claims of one
+    # type serialized for the concurrency check to hold.
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [f"bikes-job:{name}"])
+
+
+def claim(worker, names=None):
+    """Lease the next due job of a registered type (or of ``names``) to ``worker``; ``None`` if there is none."""
+    now = timezone.now()
+    names = [name for name in (names or JOBS) if name in JOBS]
+    busy = dict(running(now).filter(name__in=names).values_list("name").annotate(n=Count("pk")).order_by())
+    open_names = [name for name in names if busy.get(name, 0) < JOBS[name].concurrency]
+    if not open_names:
+        return None
+    candidates = (due(now).filter(name__in=open_names).order_by("-priority", "run_at", "pk")
+                  .values_list("pk", "name")[:CLAIM_BATCH])
+    for pk, name in candidates:
+        spec = JOBS[name]
+        # The spec.concurrency-th running job of this type; none means a slot is free.
+        full = running(now).filter(name=name).order_by()[spec.concurrency - 1:spec.concurrency]
+        with transaction.atomic():
+            lock_type(name)
+            claimed = due(now).filter(pk=pk).filter(~Exists(full)).update(
+                status=Job.RUNNING,
+                attempts=F("attempts") + 1,
+                locked_by=worker,
+                locked_until=now + timedelta(seconds=spec.timeout),
+            )
+        if claimed:
+            return Job.objects.get(pk=pk)
+    return None
+
+
+# Running
+
+def execute(job):
+    """Run a claimed ``job`` and record how it went: "done", "retried" or "dead"."""
+    spec = JOBS[job.name]
+    started = time.monotonic()
+    try:
+        if job.attempts > job.max_attempts:
+            # Reclaimed after its last attempt's worker died mid-run.
+            raise RuntimeError(f"Lease expired on the last of {job.max_attempts} attempts")
+        spec.func(**job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        if job.attempts >= job.max_attempts:
+            outcome, changes = "dead", {"status": Job.DEAD, "finished_at": timezone.now()}
+        else:
+            outcome = "retried"
+            changes = {"status": Job.QUEUED,
+                       "run_at": timezone.now() + timedelta(seconds=retry_delay(job.attempts))}
+        changes["last_error"] = error
+    else:
+        outcome, changes = "done", {"status": Job.DONE, "finished_at": timezone.now()}
+    # Only while still ours: after an expired lease another worker owns it.
+    Job.objects.filter(pk=job.pk, status=Job.RUNNING, locked_by=job.locked_by).update(
+        locked_until=None, **changes,
+    )
+    metrics.incr(RUNS_METRIC, job=job.name, outcome=outcome)
+    metrics.incr(RUN_TIME_METRIC, amount=int((time.monotonic() - started) * 1000), job=job.name)
+    return outcome
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+
+
+def run_pending(names=None, limit=None):
+    """Run due jobs in this thread until there are none (or ``limit`` ran); return how many ran."""
+    worker, ran = worker_name(), 0
+    while limit is None or ran < limit:
+        job = claim(worker, names)
+        if job is None:
+            break
+        execute(job)
+        ran += 1
+    return ran
+
+
+def purge(days):
+    """Delete jobs that finished successfully more than ``days`` days ago."""
+    return Job.objects.filter(status=Job.DONE, finished_at__lt=timezone.now() - timedelta(days=days)).delete()[0]
+
+
+def requeue(queryset):
+    """Give dead jobs a fresh set of attempts."""
+    return queryset.filter(status=Job.DEAD).update(
+        status=Job.QUEUED, attempts=0, run_at=timezone.now(), finished_at=None,
+    )
+
+
+class WorkerPool:
+    """``threads`` threads each claiming and running jobs until ``stop`` is set."""
+
+    def __init__(self, threads=4, names=None, poll_interval=1.0):
+        self.threads = threads
+        self.names = names
+        self.poll_interval = poll_interval
+
+    def work(self, stop):
+        worker = worker_name()
+        try:
+            while not stop.is_set():
+                close_old_connections()
+                job = claim(worker, self.names)
+                if job is None:
+                    stop.wait(self.poll_interval)
+                else:
+                    execute(job)
+        finally:
+            connections.close_all()
+
+    def run(self, stop):
+        threads = [threading.Thread(target=self.work, args=(stop,), name=f"jobs-{i}")
+                   for i in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+
+# Metrics
+
+def run_label_sets():
+    return [{"job": name, "outcome": outcome} for name in sorted(JOBS) for outcome in OUTCOMES]
+
+
+def time_label_sets():
+    return [{"job": name} for name in sorted(JOBS)]
+
+
+def queue_depth():
+    """``[(labels, jobs)]`` for the queued, running and dead jobs of every type."""
+    counts = dict(
+        ((name, status), n) for name, status, n in
+        Job.objects.exclude(status=Job.DONE).values_list("name", "status").annotate(n=Count("pk")).order_by()
+    )
+    return [
+        ({"job": name, "status": status}, counts.get((name, status), 0))
+        for name in sorted(JOBS) for status in (Job.QUEUED, Job.RUNNING, Job.DEAD)
+    ]
@@ -0,0 +1,86 @@
+"""
+Process-cached site layout: the footer row (logo, social icons, address,
+contact details) shared by ``footer_context`` and the footer API views.
+
+The row is loaded once per process and its serialized form, with absolute
+image URLs, is kept per site root (scheme + host), so a warm request costs
+neither a query nor serializer work. The Host header is the client's to
+choose, so only the ``MAX_ROOTS`` most recently used roots are kept.
+Saving or deleting a ``Footer`` drops the copy in the saving process
+immediately and bumps the shared ``Footer`` version (``bikes/cache.py``);
+other processes notice within ``VERSION_CHECK_INTERVAL`` seconds.
+"""
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+
+from .cache import get_version
+from .detail_cache import LRUCache
+from .models import Footer
+from .serializers.sections import FooterSerializer
+
+
+VERSION_NAMESPACE = Footer._meta.label_lower
+
+VERSION_CHECK_INTERVAL = 5
+
+MAX_ROOTS = 8
+
+
+class SiteLayout:
+    def __init__(self, footer, version):
+        self.footer = footer
+        self.version = version
+        self.checked_at = time.monotonic()
+        # Replaced with the layout when the version moves, so no expiry.
+        self._rendered = LRUCache(MAX_ROOTS, ttl=float("inf"))
+
+    def as_data(self, request):
+        """``FooterSerializer`` output for ``request``'s site root, computed once per root."""
+        root = request.build_absolute_uri("/")
+        data = self._rendered.get(root)
+        if data is None:
+            data = dict(FooterSerializer(self.footer, context={"request": request}).data)
+            self._rendered.set(root, data)
+        return data
+
+
+_layout = None
+_lock = threading.Lock()
+
+
+def _fresh_layout():
+    """The loaded layout if it is still current, without touching the database."""
+    layout = _layout
+    if layout is None:
+        return None
+    now = time.monotonic()
+    if now - layout.checked_at < VERSION_CHECK_INTERVAL:
+        return layout
+    if get_version(VERSION_NAMESPACE) == layout.version:
+        layout.checked_at = now
+        return layout
+    return None
+
+
+def get_layout():
+    global _layout
+    layout = _fresh_layout()
+    if layout is not None:
+        return layout
+    with _lock:
+        layout = _fresh_layout()
+        if layout is None:
+            version = get_version(VERSION_NAMESPACE)
+            layout = _layout = SiteLayout(Footer.objects.last(), version)
+    return layout
+
+
+async def aget_layout():
+    return _fresh_layout() or await sync_to_async(get_layout)()
+
+
+def invalidate():
+    global _layout
+    _layout = None
@@ -0,0 +1,226 @@
+import random
+import threading
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import (
+    CaptureQueriesContext, override_settings, setup_test_environment, teardown_test_environment,
+)
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from bikes.analytics import rebuild
+from bikes.benchmarking import (
+    BenchmarkDatabase, compare, load_baseline, measure, save_baseline, summarize,
+)
+from bikes.models import BuyBike
+from bikes.renderers import ORJSONRenderer
+from bikes.serializers.catalog import BuyBikeSerializer
+from bikes.synthetic import seed_bikes, seed_locations, seed_sections
+
+
+# Common BikeFilter combinations seen from the catalog page.
+LIST_QUERIES = {
+    "all": {},
+    "brand": {"brand": "yamaha"},
+    "price_range": {"price_min": 50000, "price_max": 150000},
+    "year_km": {"year_min": 2018, "km_max": 30000},
+    "search": {"search": "royal"},
+    "ordering_price": {"ordering": "price"},
+    "combined": {"brand": "bajaj", "price_max": 200000, "year_min": 2016, "ordering": "-year"},
+}
+
+SECTION_URLS = [
+    "hero-section", "info-section", "support-features", "homepage-banner",
+    "last-section-latest", "testimonials", "trusted-section", "faq-list",
+    "api-about", "footer", "sellbike-page", "login-content",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the bikes API hot paths against synthetic catalogs in a throwaway "
+        "database. Reports p50/p99 latency, queries and peak memory per scenario and "
+        "compares them with a stored baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000],
+                            help="Catalog sizes to benchmark (e.g. 1000 10000 100000).")
+        parser.add_argument("--locations", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=20, help="Timed requests per scenario.")
+        parser.add_argument("--concurrency", type=int, default=8, help="Threads creating bookings.")
+        parser.add_argument("--bookings", type=int, default=10, help="Bookings per thread.")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--baseline", default=str(settings.BASE_DIR / "bench_baseline.json"))
+        parser.add_argument("--save-baseline", action="store_true",
+                            help="Write this run as the new baseline instead of comparing.")
+        parser.add_argument("--fail-threshold", type=float, default=None,
+                            help="Exit with an error if any p50 regresses by more than this percent.")
+        parser.add_argument("--response-cache", action="store_true",
+                            help="Keep the API response cache on (repeated requests then measure cache hits).")
+
+    def handle(self, *args, **options):
+        results = {}
+        sizes = sorted(set(options["sizes"]))
+
+        # Every benchmark request comes from one client address; measure the
+        # views, not the write throttle (nor, by default, the response cache).
+        overrides = {"BIKES_THROTTLES": {}}
+        if not options["response_cache"]:
+            overrides["BIKES_API_CACHE_TIMEOUT"] = 0
+        with BenchmarkDatabase(), override_settings(**overrides):
+            setup_test_environment()
+            try:
+                seed_sections(seed=options["seed"])
+                locations = seed_locations(options["locations"])
+                results.update(self.bench_sections(options["repeat"]))
+
+                for size in sizes:
+                    missing = size - BuyBike.objects.count()
+                    if missing > 0:
+                        self.stdout.write(f"Seeding catalog up to {size} bikes...")
+                        seed_bikes(missing, locations, seed=options["seed"] + size)
+                        rebuild()
+                    results.update(self.bench_catalog(size, options["repeat"], options["seed"]))
+                    results.update(self.bench_bookings(
+                        size, options["concurrency"], options["bookings"], options["seed"]
+                    ))
+            finally:
+                teardown_test_environment()
+
+        self.report(results)
+        meta = {"sizes": sizes, "repeat": options["repeat"], "vendor": connection.vendor,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+        if options["save_baseline"]:
+            save_baseline(options["baseline"], results, meta)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}"))
+            return
+
+        baseline = load_baseline(options["baseline"])
+        if not baseline:
+            self.stdout.write(f"No baseline at {options['baseline']} (run with --save-baseline).")
+            return
+        self.report_comparison(results, baseline, options["fail_threshold"])
+
+    # -- scenarios ---------------------------------------------------------
+
+    def bench_sections(self, repeat):
+        client = Client()
+        results = {}
+        for name in SECTION_URLS:
+            url = reverse(name)
+            results[f"sections/{name}"] = measure(lambda: client.get(url).status_code < 500, repeat)
+        return results
+
+    def bench_catalog(self, size, repeat, seed):
+        client = Client()
+        results = {}
+        list_url = reverse("buybike-list")
+        for name, params in LIST_QUERIES.items():
+            results[f"{size}/list/{name}"] = measure(
+                lambda: client.get(list_url, params).status_code == 200, repeat
+            )
+
+        results.update(self.bench_renderers(size, repeat))
+
+        rng = random.Random(seed)
+        pks = list(BuyBike.objects.values_list("pk", flat=True))
+        sample = iter(rng.choice(pks) for _ in range(repeat + 1))
+        results[f"{size}/detail"] = measure(
+            lambda: client.get(reverse("buybike-detail", args=[next(sample)])).status_code == 200, repeat
+        )
+        return results
+
+    def bench_renderers(self, size, repeat):
+        """Encoding cost alone for the unfiltered catalog list, DRF's renderer vs orjson."""
+        request = RequestFactory().get(reverse("buybike-list"))
+        data = BuyBikeSerializer(
+            BuyBike.objects.select_related("location"), many=True, context={"request": request}
+        ).data
+        renderers = {"json": JSONRenderer(), "orjson": ORJSONRenderer()}
+        if renderers["json"].render(data) != renderers["orjson"].render(data):
+            self.stderr.write(self.style.WARNING(f"{size}: orjson output differs from JSONRenderer"))
+        return {
+            f"{size}/render/{name}": measure(lambda: renderer.render(data), repeat)
+            for name, renderer in renderers.items()
+        }
+
+    def bench_bookings(self, size, concurrency, per_thread, seed):
+        url = reverse("booking-create")
+        rng = random.Random(seed)
+        pks = list(BuyBike.objects.values_list("pk", flat=True))
+
+        # Single booking in this thread for the query count and memory profile.
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            tracemalloc.start()
+            Client().post(url, {"buybike": rng.choice(pks)}, content_type="application/json")
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        latencies = []
+        errors = [0]
+        lock = threading.Lock()
+
+        def worker(bike_ids):
+            client = Client()
+            try:
+                for pk in bike_ids:
+                    start = time.perf_counter()
+                    try:
+                        ok = client.post(url, {"buybike": pk}, content_type="application/json").status_code == 201
+                    except Exception:
+                        ok = False
+                    elapsed = time.perf_counter() - start
+                    with lock:
+                        latencies.append(elapsed)
+                        errors[0] += not ok
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=worker, args=([rng.choice(pks) for _ in range(per_thread)],))
+            for _ in range(concurrency)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - started
+
+        metrics = summarize(latencies, queries=len(ctx.captured_queries), peak_kib=peak // 1024, errors=errors[0])
+        metrics["throughput_rps"] = round(len(latencies) / wall, 1) if wall else 0.0
+        return {f"{size}/booking_x{concurrency}": metrics}
+
+    # -- output ------------------------------------------------------------
+
+    def report(self, results):
+        header = f"{'scenario':<36} {'p50 ms':>9} {'p99 ms':>9} {'queries':>8} {'peak KiB':>9} {'errors':>7}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for name, m in results.items():
+            self.stdout.write(
+                f"{name:<36} {m['p50_ms']:>9.2f} {m['p99_ms']:>9.2f} {m['queries']:>8} "
+                f"{m['peak_kib']:>9} {m['errors']:>7}"
+            )
+
+    def report_comparison(self, results, baseline, fail_threshold):
+        self.stdout.write("\nCompared with baseline:")
+        regressions = []
+        for scenario, key, old, new, delta in compare(results, baseline):
+            if delta is None or delta == 0:
+                continue
+            line = f"  {scenario:<36} {key:<9} {old:>10} -> {new:<10} ({delta:+.1f}%)"
+            style = self.style.ERROR if delta > 0 else self.style.SUCCESS
+            self.stdout.write(style(line))
+            if key == "p50_ms" and fail_threshold is not None and delta > fail_threshold:
+                regressions.append(scenario)
+        if regressions:
+            raise CommandError(f"p50 regressed more than {fail_threshold}% in: {', '.join(regressions)}")
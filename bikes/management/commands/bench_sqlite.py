@@ -0,0 +1,105 @@
+import multiprocessing
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from secondsbikes.database import sqlite_pragmas
+
+
+SCHEMA = """
+CREATE TABLE bike (id INTEGER PRIMARY KEY, title TEXT, price INTEGER, is_booked INTEGER DEFAULT 0);
+CREATE TABLE booking (id INTEGER PRIMARY KEY, bike_id INTEGER, amount INTEGER, created_at REAL);
+CREATE INDEX booking_bike ON booking (bike_id);
+CREATE INDEX bike_price ON bike (price);
+"""
+
+# "default" mirrors stock Django on SQLite (rollback journal, deferred
+# transactions, the sqlite3 module's 5s timeout); "production" mirrors
+# DB_SQLITE_PRODUCTION=1.
+PROFILES = {
+    "default": {"timeout": 5, "begin": "BEGIN", "pragmas": []},
+    "production": {"timeout": 20, "begin": "BEGIN IMMEDIATE", "pragmas": sqlite_pragmas()},
+}
+
+
+def worker(path, profile, deadline, write_ratio, seed, bikes):
+    """
+    One gunicorn-worker-like process. Reads fetch a catalog page; writes do
+    what BookingCreateView does: read the bike, insert a booking and flag the
+    bike, in one transaction.
+    """
+    settings = PROFILES[profile]
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path, timeout=settings["timeout"], isolation_level=None)
+    for pragma in settings["pragmas"]:
+        conn.execute(pragma)
+
+    reads = writes = errors = 0
+    while time.time() < deadline:
+        try:
+            if rng.random() < write_ratio:
+                bike_id = rng.randint(1, bikes)
+                conn.execute(settings["begin"])
+                try:
+                    (price,) = conn.execute("SELECT price FROM bike WHERE id = ?", (bike_id,)).fetchone()
+                    conn.execute("INSERT INTO booking (bike_id, amount, created_at) VALUES (?, ?, ?)",
+                                 (bike_id, price, time.time()))
+                    conn.execute("UPDATE bike SET is_booked = 1 WHERE id = ?", (bike_id,))
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+                writes += 1
+            else:
+                offset = rng.randint(0, max(bikes - 50, 0))
+                conn.execute("SELECT * FROM bike ORDER BY price LIMIT 50 OFFSET ?", (offset,)).fetchall()
+                reads += 1
+        except sqlite3.OperationalError:
+            errors += 1
+    conn.close()
+    return reads, writes, errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure read/write throughput and 'database is locked' errors of concurrent "
+        "processes on SQLite, with stock settings and with DB_SQLITE_PRODUCTION tuning."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=4)
+        parser.add_argument("--duration", type=float, default=5.0, help="Seconds per profile.")
+        parser.add_argument("--write-ratio", type=float, default=0.2)
+        parser.add_argument("--bikes", type=int, default=20000)
+
+    def handle(self, *args, **options):
+        rows = []
+        for profile in PROFILES:
+            with tempfile.TemporaryDirectory(prefix="bikes-sqlite-") as tmp:
+                path = str(Path(tmp) / "bench.sqlite3")
+                self.prepare(path, options["bikes"])
+                deadline = time.time() + options["duration"]
+                args = [(path, profile, deadline, options["write_ratio"], seed, options["bikes"])
+                        for seed in range(options["processes"])]
+                with multiprocessing.Pool(options["processes"]) as pool:
+                    results = pool.starmap(worker, args)
+            reads, writes, errors = (sum(col) for col in zip(*results))
+            rows.append((profile, reads / options["duration"], writes / options["duration"], errors))
+
+        self.stdout.write(f"{'profile':<12} {'reads/s':>10} {'writes/s':>10} {'lock errors':>12}")
+        for profile, reads, writes, errors in rows:
+            self.stdout.write(f"{profile:<12} {reads:>10.1f} {writes:>10.1f} {errors:>12}")
+
+    def prepare(self, path, bikes):
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA)
+        conn.executemany(
+            "INSERT INTO bike (title, price) VALUES (?, ?)",
+            ((f"Bike {i}", random.randrange(25000, 350000)) for i in range(bikes)),
+        )
+        conn.commit()
+        conn.close()
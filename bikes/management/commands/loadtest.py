@@ -0,0 +1,193 @@
+import asyncio
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from contextlib import nullcontext
+from urllib.parse import urlencode
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from bikes.benchmarking import summarize
+from bikes.models import BuyBike
+from bikes.synthetic import CATALOG, CITIES
+
+
+# (action, weight) — roughly what the frontend sends on a normal day.
+TRAFFIC_MIX = [
+    ("home", 25),
+    ("detail", 25),
+    ("filter", 20),
+    ("search", 15),
+    ("browse", 10),
+    ("book", 5),
+]
+
+SECTION_URLS = [
+    "hero-section", "info-section", "support-features", "homepage-banner",
+    "last-section-latest", "testimonials", "trusted-section", "faq-list", "footer",
+]
+
+
+def build_plan(total, bike_ids, seed):
+    """Return ``total`` deterministic ``(action, method, path, payload)`` tuples."""
+    rng = random.Random(seed)
+    actions, weights = zip(*TRAFFIC_MIX)
+    list_url = reverse("buybike-list")
+    plan = []
+    for action in rng.choices(actions, weights, k=total):
+        if action == "home":
+            plan.append((action, "GET", reverse(rng.choice(SECTION_URLS)), None))
+        elif action == "detail":
+            plan.append((action, "GET", reverse("buybike-detail", args=[rng.choice(bike_ids)]), None))
+        elif action == "filter":
+            low = rng.randrange(20000, 150000, 10000)
+            params = {"brand": rng.choice(list(CATALOG)), "price_min": low, "price_max": low + 100000}
+            plan.append((action, "GET", f"{list_url}?{urlencode(params)}", None))
+        elif action == "search":
+            term = rng.choice([rng.choice(list(CATALOG)), rng.choice(CITIES), rng.choice(CATALOG["Yamaha"])[0]])
+            plan.append((action, "GET", f"{list_url}?{urlencode({'search': term})}", None))
+        elif action == "browse":
+            ordering = rng.choice(["-created_at", "price", "-price", "kilometers"])
+            plan.append((action, "GET", f"{list_url}?{urlencode({'ordering': ordering, 'year_min': 2018})}", None))
+        else:
+            plan.append((action, "POST", reverse("booking-create"), {"buybike": rng.choice(bike_ids)}))
+    return plan
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay a realistic mix of catalog browsing, searching and booking. Targets the "
+        "in-process WSGI or ASGI handler, or a running server via --url. Seed data first "
+        "with `manage.py seed_data`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", choices=["wsgi", "asgi", "http"], default="wsgi")
+        parser.add_argument("--url", default="http://127.0.0.1:8000",
+                            help="Base URL used with --target http.")
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--timeout", type=float, default=30.0)
+
+    def handle(self, *args, **options):
+        bike_ids = list(BuyBike.objects.values_list("pk", flat=True))
+        if not bike_ids:
+            raise CommandError("No bikes in the database; run `manage.py seed_data` first.")
+        plan = build_plan(options["requests"], bike_ids, options["seed"])
+
+        latencies = defaultdict(list)
+        errors = defaultdict(int)
+        # In-process targets send everything from one address, which the write
+        # throttle would cut off; an --target http server keeps its own limits.
+        unthrottled = override_settings(BIKES_THROTTLES={}) if options["target"] != "http" else nullcontext()
+        started = time.perf_counter()
+        with unthrottled:
+            if options["target"] == "asgi":
+                asyncio.run(self.run_asgi(plan, options["concurrency"], latencies, errors))
+            else:
+                self.run_threads(plan, options, latencies, errors)
+        wall = time.perf_counter() - started
+
+        self.report(latencies, errors, wall)
+
+    # -- executors ---------------------------------------------------------
+
+    def run_threads(self, plan, options, latencies, errors):
+        lock = threading.Lock()
+        cursor = iter(plan)
+
+        if options["target"] == "http":
+            base = options["url"].rstrip("/")
+
+            def send(_client, method, path, payload):
+                data = json.dumps(payload).encode() if payload is not None else None
+                req = urllib.request.Request(base + path, data=data, method=method,
+                                             headers={"Content-Type": "application/json"})
+                try:
+                    with urllib.request.urlopen(req, timeout=options["timeout"]) as resp:
+                        resp.read()
+                        return resp.status
+                except urllib.error.HTTPError as exc:
+                    return exc.code
+
+            def make_client():
+                return None
+        else:
+            def send(client, method, path, payload):
+                if method == "POST":
+                    return client.post(path, payload, content_type="application/json").status_code
+                return client.get(path).status_code
+            make_client = Client
+
+        def worker():
+            client = make_client()
+            try:
+                while True:
+                    with lock:
+                        item = next(cursor, None)
+                    if item is None:
+                        return
+                    action, method, path, payload = item
+                    start = time.perf_counter()
+                    try:
+                        ok = send(client, method, path, payload) < 400
+                    except Exception:
+                        ok = False
+                    elapsed = time.perf_counter() - start
+                    with lock:
+                        latencies[action].append(elapsed)
+                        errors[action] += not ok
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(options["concurrency"])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    async def run_asgi(self, plan, concurrency, latencies, errors):
+        queue = asyncio.Queue()
+        for item in plan:
+            queue.put_nowait(item)
+
+        async def worker():
+            client = AsyncClient()
+            while not queue.empty():
+                action, method, path, payload = queue.get_nowait()
+                start = time.perf_counter()
+                try:
+                    if method == "POST":
+                        response = await client.post(path, payload, content_type="application/json")
+                    else:
+                        response = await client.get(path)
+                    ok = response.status_code < 400
+                except Exception:
+                    ok = False
+                latencies[action].append(time.perf_counter() - start)
+                errors[action] += not ok
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    # -- output ------------------------------------------------------------
+
+    def report(self, latencies, errors, wall):
+        total = sum(len(v) for v in latencies.values())
+        header = f"{'action':<10} {'requests':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for action, _ in TRAFFIC_MIX:
+            if action not in latencies:
+                continue
+            m = summarize(latencies[action], errors=errors[action])
+            self.stdout.write(f"{action:<10} {m['requests']:>9} {m['p50_ms']:>9.2f} {m['p99_ms']:>9.2f} {m['errors']:>7}")
+        self.stdout.write(f"\n{total} requests in {wall:.2f}s ({total / wall:.1f} req/s)")
@@ -0,0 +1,91 @@
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from bikes.jobs import JOBS, WorkerPool, purge, run_pending
+
+
+# Seconds between purges of old finished jobs.
+PURGE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs (bikes/jobs.py) with a pool of worker threads, optionally in "
+        "several processes. Use --once from cron to drain the queue and exit."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=4, help="Worker threads per process.")
+        parser.add_argument("--processes", type=int, default=1,
+                            help="Worker processes, each with --threads threads.")
+        parser.add_argument("--job", action="append", dest="names", metavar="NAME",
+                            help="Only run these job types (repeatable); default: all.")
+        parser.add_argument("--poll", type=float, default=1.0,
+                            help="Seconds an idle thread waits before looking for jobs again.")
+        parser.add_argument("--keep-days", type=int, default=7,
+                            help="Delete successful jobs after this many days.")
+        parser.add_argument("--once", action="store_true",
+                            help="Run the jobs that are due in this thread, then exit.")
+
+    def handle(self, *args, **options):
+        names = options["names"]
+        unknown = sorted(set(names or ()) - set(JOBS))
+        if unknown:
+            raise CommandError(f"Unknown job types: {', '.join(unknown)} (known: {', '.join(sorted(JOBS))})")
+        if options["threads"] < 1 or options["processes"] < 1:
+            raise CommandError("--threads and --processes must be at least 1")
+
+        if options["once"]:
+            ran = run_pending(names)
+            self.stdout.write(f"Ran {ran} jobs")
+            return
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop.set())
+
+        if options["processes"] > 1:
+            self.supervise(options, stop)
+        else:
+            pool = WorkerPool(options["threads"], names, options["poll"])
+            runner = threading.Thread(target=pool.run, args=(stop,))
+            runner.start()
+            self.stdout.write(f"Running jobs with {options['threads']} threads")
+            self.housekeep(options, stop)
+            runner.join()
+
+    def housekeep(self, options, stop):
+        while not stop.is_set():
+            purged = purge(options["keep_days"])
+            if purged:
+                self.stdout.write(f"Purged {purged} finished jobs")
+            stop.wait(PURGE_INTERVAL)
+
+    def supervise(self, options, stop):
+        """Keep ``--processes`` single-process workers running, restarting any that exit."""
+        command = [sys.executable, sys.argv[0], "run_jobs", "--threads", str(options["threads"]),
+                   "--poll", str(options["poll"]), "--keep-days", str(options["keep_days"])]
+        for name in options["names"] or ():
+            command += ["--job", name]
+        children = [None] * options["processes"]
+        self.stdout.write(f"Running jobs in {len(children)} processes of {options['threads']} threads")
+        while not stop.is_set():
+            for i, child in enumerate(children):
+                if child is None or child.poll() is not None:
+                    if child is not None:
+                        self.stderr.write(f"Worker {child.pid} exited with {child.returncode}; restarting")
+                    children[i] = subprocess.Popen(command)
+            stop.wait(1)
+        for child in children:
+            child.terminate()
+        deadline = time.monotonic() + 60
+        for child in children:
+            try:
+                child.wait(max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                child.kill()
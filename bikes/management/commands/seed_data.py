@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from bikes.analytics import rebuild
+from bikes.synthetic import (
+    seed_bikes, seed_bookings, seed_contacts, seed_locations, seed_sections,
+    seed_testimonials, seed_users,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large, realistic dataset (locations, bikes, bookings, contacts, "
+        "testimonials) with bulk inserts. The same --seed always produces the same data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bikes", type=int, default=10000)
+        parser.add_argument("--locations", type=int, default=20)
+        parser.add_argument("--users", type=int, default=500)
+        parser.add_argument("--bookings", type=int, default=2000)
+        parser.add_argument("--contacts", type=int, default=5000)
+        parser.add_argument("--testimonials", type=int, default=30)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--sections", action="store_true",
+                            help="Also create homepage/static section content.")
+
+    def handle(self, *args, **options):
+        seed = options["seed"]
+        batch_size = options["batch_size"]
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            if options["sections"]:
+                self.step("sections", lambda: seed_sections(seed=seed))
+            locations = self.step("locations", lambda: seed_locations(options["locations"]))
+            self.step("bikes", lambda: seed_bikes(options["bikes"], locations, seed=seed, batch_size=batch_size))
+            users = self.step("users", lambda: seed_users(options["users"], seed=seed))
+            self.step("bookings", lambda: seed_bookings(options["bookings"], users, seed=seed, batch_size=batch_size))
+            self.step("contacts", lambda: seed_contacts(options["contacts"], seed=seed, batch_size=batch_size))
+            self.step("testimonials", lambda: seed_testimonials(options["testimonials"], seed=seed))
+            # Bulk inserts skip the signals that keep the rollups current.
+            self.step("analytics", rebuild)
+
+        self.stdout.write(self.style.SUCCESS(f"Done in {time.perf_counter() - started:.1f}s"))
+
+    def step(self, label, func):
+        started = time.perf_counter()
+        result = func()
+        count = len(result) if isinstance(result, list) else result
+        if count is not None:
+            self.stdout.write(f"  {label:<13} {count:>8} rows  {time.perf_counter() - started:6.2f}s")
+        else:
+            self.stdout.write(f"  {label:<13} {'':>8}       {time.perf_counter() - started:6.2f}s")
+        return result
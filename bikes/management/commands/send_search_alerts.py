@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from bikes.saved_searches import ALERT_BATCH, send_alerts
+
+
+class Command(BaseCommand):
+    help = (
+        "Mail pending saved-search alerts, one message per user per batch. Use --every to "
+        "keep running as a sidecar, or call it from cron/systemd timers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=ALERT_BATCH)
+        parser.add_argument("--every", type=int, default=0,
+                            help="Repeat every N seconds instead of running once.")
+
+    def handle(self, *args, **options):
+        while True:
+            while True:
+                alerts, messages = send_alerts(options["batch"])
+                if alerts:
+                    self.stdout.write(f"Sent {alerts} alerts in {messages} messages")
+                if alerts < options["batch"]:
+                    break
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
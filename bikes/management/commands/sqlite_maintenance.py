@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = (
+        "Run PRAGMA optimize and a WAL checkpoint on a SQLite database. Use --every to "
+        "keep running as a sidecar, or call it from cron/systemd timers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--every", type=int, default=0,
+                            help="Repeat every N seconds instead of running once.")
+        parser.add_argument("--checkpoint", choices=["PASSIVE", "FULL", "RESTART", "TRUNCATE"],
+                            default="TRUNCATE")
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor != "sqlite":
+            raise CommandError(f"Database '{options['database']}' is not SQLite.")
+
+        while True:
+            self.run_once(connection, options["checkpoint"])
+            if not options["every"]:
+                return
+            # Don't hold the connection (and its read snapshot) between runs.
+            connection.close()
+            time.sleep(options["every"])
+
+    def run_once(self, connection, mode):
+        started = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA optimize")
+            cursor.execute(f"PRAGMA wal_checkpoint({mode})")
+            busy, log_frames, checkpointed = cursor.fetchone()
+        self.stdout.write(
+            f"optimize + wal_checkpoint({mode}) in {time.perf_counter() - started:.3f}s "
+            f"(busy={busy}, wal_frames={log_frames}, checkpointed={checkpointed})"
+        )
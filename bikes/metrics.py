@@ -0,0 +1,41 @@
+"""
+Counters shared by every worker, kept in the default cache and exported in
+Prometheus text format by ``/api/metrics/``.
+
+A counter is a name plus a small set of labels. The cache can't list its
+keys, so exporters pass the label sets they want to read.
+"""
+from django.core.cache import cache
+
+
+KEY_PREFIX = "metrics"
+
+
+def counter_key(name, labels):
+    return ":".join([KEY_PREFIX, name, *(f"{k}={labels[k]}" for k in sorted(labels))])
+
+
+def incr(name, amount=1, **labels):
+    key = counter_key(name, labels)
+    if cache.add(key, amount, timeout=None):
+        return
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        # Evicted between add() and incr().
+        cache.set(key, amount, timeout=None)
+
+
+def read(name, label_sets):
+    """Return ``[(labels, value), ...]`` for ``name``, 0 where never incremented."""
+    keys = {counter_key(name, labels): labels for labels in label_sets}
+    values = cache.get_many(list(keys))
+    return [(labels, values.get(key, 0)) for key, labels in keys.items()]
+
+
+def render_prometheus(name, help_text, samples, kind="counter"):
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        rendered = ",".join(f'{k}="{labels[k]}"' for k in sorted(labels))
+        lines.append(f"{name}{{{rendered}}} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-19 13:45
+
+from django.db import migrations, models
+
+
+def backfill_changes(apps, schema_editor):
+    # Existing bikes get one change each, so syncing from the start lists them all.
+    BuyBike = apps.get_model("bikes", "BuyBike")
+    CatalogChange = apps.get_model("bikes", "CatalogChange")
+    bike_ids = BuyBike.objects.order_by("updated_at", "pk").values_list("pk", flat=True)
+    CatalogChange.objects.bulk_create(
+        (CatalogChange(bike_id=pk) for pk in bike_ids.iterator()), batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bikes', '0010_booking_contact_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('bike_id', models.PositiveBigIntegerField()),
+                ('deleted', models.BooleanField(default=False)),
+                ('changed_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['bike_id'], name='catalogchange_bike_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_changes, migrations.RunPython.noop),
+    ]
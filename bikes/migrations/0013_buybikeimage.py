@@ -0,0 +1,77 @@
+# Generated by Django 5.2.6 on 2026-10-19 13:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+VARIANT_FIELDS = ["variant_image1", "variant_image2", "variant_image3", "variant_image4", "variant_image5"]
+
+
+def copy_variants_to_gallery(apps, schema_editor):
+    BuyBike = apps.get_model("bikes", "BuyBike")
+    BuyBikeImage = apps.get_model("bikes", "BuyBikeImage")
+    images = []
+    for row in BuyBike.objects.values_list("pk", *VARIANT_FIELDS).iterator():
+        images.extend(
+            BuyBikeImage(bike_id=row[0], image=name, order=order)
+            for order, name in enumerate(row[1:], start=1)
+            if name
+        )
+        if len(images) >= 1000:
+            BuyBikeImage.objects.bulk_create(images)
+            images = []
+    BuyBikeImage.objects.bulk_create(images)
+
+
+def copy_gallery_to_variants(apps, schema_editor):
+    BuyBike = apps.get_model("bikes", "BuyBike")
+    BuyBikeImage = apps.get_model("bikes", "BuyBikeImage")
+    galleries = {}
+    for bike_id, name in BuyBikeImage.objects.order_by("bike_id", "order", "id").values_list("bike_id", "image"):
+        galleries.setdefault(bike_id, []).append(name)
+    for bike_id, names in galleries.items():
+        BuyBike.objects.filter(pk=bike_id).update(**dict(zip(VARIANT_FIELDS, names)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bikes', '0012_location_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BuyBikeImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='buybikes/variants/')),
+                ('order', models.PositiveSmallIntegerField(default=0)),
+                ('bike', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='bikes.buybike')),
+            ],
+            options={
+                'ordering': ('order', 'id'),
+                'indexes': [models.Index(fields=['bike', 'order'], name='buybikeimage_bike_order_idx')],
+            },
+        ),
+        migrations.RunPython(copy_variants_to_gallery, copy_gallery_to_variants),
+        migrations.RemoveField(
+            model_name='buybike',
+            name='variant_image1',
+        ),
+        migrations.RemoveField(
+            model_name='buybike',
+            name='variant_image2',
+        ),
+        migrations.RemoveField(
+            model_name='buybike',
+            name='variant_image3',
+        ),
+        migrations.RemoveField(
+            model_name='buybike',
+            name='variant_image4',
+        ),
+        migrations.RemoveField(
+            model_name='buybike',
+            name='variant_image5',
+        ),
+    ]
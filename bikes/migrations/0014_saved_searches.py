@@ -0,0 +1,50 @@
+# Generated by Django 5.2.6 on 2026-10-19 13:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bikes', '0013_buybikeimage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('brand', models.CharField(blank=True, max_length=100)),
+                ('price_min', models.PositiveIntegerField(blank=True, null=True)),
+                ('price_max', models.PositiveIntegerField(blank=True, null=True)),
+                ('year_min', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('year_max', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('km_max', models.PositiveIntegerField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='bikes.location')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('bike', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='bikes.buybike')),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='alerts', to='bikes.savedsearch')),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['sent_at', 'created_at'], name='searchalert_pending_idx')],
+                'constraints': [models.UniqueConstraint(fields=('saved_search', 'bike'), name='searchalert_unique_match')],
+            },
+        ),
+    ]
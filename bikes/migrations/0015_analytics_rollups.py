@@ -0,0 +1,63 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bikes', '0014_saved_searches'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(choices=[('created', 'Created'), ('paid', 'Paid'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('bookings', models.IntegerField(default=0)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('gst_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('test_drive_fee', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+            ],
+            options={
+                'ordering': ['day', 'status'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'status'), name='bookingdailystats_unique_bucket')],
+            },
+        ),
+        migrations.CreateModel(
+            name='InventoryDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('brand', models.CharField(blank=True, max_length=100)),
+                ('listed', models.IntegerField(default=0)),
+                ('booked', models.IntegerField(default=0)),
+                ('released', models.IntegerField(default=0)),
+                ('removed', models.IntegerField(default=0)),
+                ('location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='bikes.location')),
+            ],
+            options={
+                'ordering': ['day'],
+                'indexes': [models.Index(fields=['day', 'brand', 'location'], name='inventorydaily_bucket_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='InventoryLevel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('brand', models.CharField(blank=True, max_length=100)),
+                ('on_sale', models.IntegerField(default=0)),
+                ('booked', models.IntegerField(default=0)),
+                ('value', models.BigIntegerField(default=0, help_text='Total asking price of the bikes on sale')),
+                ('location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='bikes.location')),
+            ],
+            options={
+                'ordering': ['brand', 'location'],
+                'indexes': [models.Index(fields=['brand', 'location'], name='inventorylevel_bucket_idx')],
+            },
+        ),
+    ]
@@ -1,5 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+
+from .geo import encode as geohash_encode
 
 
 class LastSection(models.Model):
@@ -67,6 +70,10 @@ class Booking(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="booking_created_idx"),
+            models.Index(fields=["status", "-created_at"], name="booking_status_created_idx"),
+        ]
 
     def __str__(self):
         return f"Booking #{self.id} for {self.buybike.title}"
@@ -135,10 +142,24 @@ class SupportFeature(models.Model):
 class Location(models.Model):
     name = models.CharField(max_length=150, unique=True)
     image = models.ImageField(upload_to="locations/", blank=True, null=True)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    # Kept in sync with the coordinates on save; indexed for radius searches (bikes/geo.py).
+    geohash = models.CharField(max_length=12, blank=True, db_index=True, editable=False)
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        if self.latitude is None or self.longitude is None:
+            self.geohash = ""
+        else:
+            self.geohash = geohash_encode(self.latitude, self.longitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geohash"}
+        super().save(*args, **kwargs)
+
 class BuyBike(models.Model):
     TRANSMISSION_CHOICES = [
         ("manual", "Manual"),
@@ -203,12 +224,7 @@ class BuyBike(models.Model):
     featured_image = models.ImageField(upload_to="buybikes/images/", blank=True, null=True)
     card_bg_image = models.ImageField(upload_to="buybikes/card_bg/", blank=True, null=True)
 
-    # ✅ 5 Variant Thumbnails
-    variant_image1 = models.ImageField(upload_to="buybikes/variants/", blank=True, null=True)
-    variant_image2 = models.ImageField(upload_to="buybikes/variants/", blank=True, null=True)
-    variant_image3 = models.ImageField(upload_to="buybikes/variants/", blank=True, null=True)
-    variant_image4 = models.ImageField(upload_to="buybikes/variants/", blank=True, null=True)
-    variant_image5 = models.ImageField(upload_to="buybikes/variants/", blank=True, null=True)
+    # gallery thumbnails live in BuyBikeImage (bike.images)
 
     # specs
     ignition_type = models.CharField(max_length=120, blank=True, help_text="e.g. Kick & Self Start")
@@ -229,6 +245,183 @@ class BuyBike(models.Model):
         return self.title
 
 
+class BuyBikeImage(models.Model):
+    bike = models.ForeignKey(BuyBike, on_delete=models.CASCADE, related_name="images")
+    image = models.ImageField(upload_to="buybikes/variants/")
+    order = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ("order", "id")
+        indexes = [
+            models.Index(fields=["bike", "order"], name="buybikeimage_bike_order_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.bike_id} - Image {self.order}"
+
+
+class SavedSearch(models.Model):
+    """
+    A buyer's catalog filter, matched against new listings by
+    ``bikes/saved_searches.py``. Empty fields match anything.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="saved_searches")
+    brand = models.CharField(max_length=100, blank=True)
+    location = models.ForeignKey("Location", on_delete=models.CASCADE, null=True, blank=True)
+    price_min = models.PositiveIntegerField(null=True, blank=True)
+    price_max = models.PositiveIntegerField(null=True, blank=True)
+    year_min = models.PositiveSmallIntegerField(null=True, blank=True)
+    year_max = models.PositiveSmallIntegerField(null=True, blank=True)
+    km_max = models.PositiveIntegerField(null=True, blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Saved search #{self.pk} for {self.user}"
+
+
+class SearchAlert(models.Model):
+    """A new bike matching a saved search, waiting for the next alert batch."""
+    saved_search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name="alerts")
+    bike = models.ForeignKey(BuyBike, on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        constraints = [
+            models.UniqueConstraint(fields=["saved_search", "bike"], name="searchalert_unique_match"),
+        ]
+        indexes = [
+            models.Index(fields=["sent_at", "created_at"], name="searchalert_pending_idx"),
+        ]
+
+    def __str__(self):
+        return f"Alert: {self.bike_id} for search #{self.saved_search_id}"
+
+
+class CatalogChange(models.Model):
+    """
+    One row per changed or deleted bike, newest change only; the id is the
+    sync cursor served by ``/api/buybikes/changes/`` (see ``bikes/changes.py``).
+    """
+    id = models.BigAutoField(primary_key=True)
+    bike_id = models.PositiveBigIntegerField()
+    deleted = models.BooleanField(default=False)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["bike_id"], name="catalogchange_bike_idx"),
+        ]
+
+    def __str__(self):
+        return f"{'Deleted' if self.deleted else 'Changed'} bike #{self.bike_id}"
+
+
+class BookingDailyStats(models.Model):
+    """
+    Bookings made on ``day`` that are now in ``status``, with their amounts;
+    kept up to date by ``bikes/analytics.py``.
+    """
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Booking.STATUS_CHOICES)
+    bookings = models.IntegerField(default=0)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    gst_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    test_drive_fee = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_amount = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+
+    class Meta:
+        ordering = ["day", "status"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "status"], name="bookingdailystats_unique_bucket"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.status}: {self.bookings}"
+
+
+class InventoryDailyStats(models.Model):
+    """Listing activity per day, brand and showroom (``bikes/analytics.py``)."""
+    day = models.DateField()
+    brand = models.CharField(max_length=100, blank=True)
+    location = models.ForeignKey("Location", on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    listed = models.IntegerField(default=0)
+    booked = models.IntegerField(default=0)
+    released = models.IntegerField(default=0)
+    removed = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["day"]
+        indexes = [
+            models.Index(fields=["day", "brand", "location"], name="inventorydaily_bucket_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.brand or '-'} @ {self.location_id or '-'}"
+
+
+class InventoryLevel(models.Model):
+    """Current stock per brand and showroom (``bikes/analytics.py``)."""
+    brand = models.CharField(max_length=100, blank=True)
+    location = models.ForeignKey("Location", on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    on_sale = models.IntegerField(default=0)
+    booked = models.IntegerField(default=0)
+    value = models.BigIntegerField(default=0, help_text="Total asking price of the bikes on sale")
+
+    class Meta:
+        ordering = ["brand", "location"]
+        indexes = [
+            models.Index(fields=["brand", "location"], name="inventorylevel_bucket_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.brand or '-'} @ {self.location_id or '-'}: {self.on_sale} on sale"
+
+
+class Job(models.Model):
+    """A unit of background work, run by ``manage.py run_jobs`` (see ``bikes/jobs.py``)."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    DEAD = "dead"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (DEAD, "Dead"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    name = models.CharField(max_length=100)
+    kwargs = models.JSONField(default=dict, blank=True)
+    priority = models.SmallIntegerField(default=0, help_text="Higher runs first")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now, help_text="Not claimed before this time")
+    locked_by = models.CharField(max_length=200, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "priority", "run_at"], name="job_due_idx"),
+            models.Index(fields=["name", "status"], name="job_name_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
 
 
 
@@ -367,6 +560,11 @@ class Contact(models.Model):
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at"], name="contact_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name} - {self.reason}"
 
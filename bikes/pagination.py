@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Newest-first keyset pagination on the ``created_at`` indexes. Unlike
+    page-number pagination it never counts the table and every page costs the
+    same, however deep the client pages.
+    """
+    ordering = "-created_at"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
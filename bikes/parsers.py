@@ -0,0 +1,23 @@
+"""orjson-backed counterpart of DRF's ``JSONParser`` (see ``bikes/renderers.py``)."""
+import io
+
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # optional: plain DRF parsing
+    orjson = None
+
+
+class ORJSONParser(JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # Let the stdlib parser produce DRF's usual error (or accept what
+            # orjson is stricter about, such as integers beyond 64 bits).
+            return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,54 @@
+"""
+orjson-backed JSON renderer for DRF.
+
+``ORJSONRenderer`` produces the same bytes as DRF's ``JSONRenderer`` with the
+default settings (compact separators, UTF-8 rather than ``\\u`` escapes,
+U+2028/U+2029 escaped) in a fraction of the CPU time:
+
+* datetimes, dates and times are handed to DRF's ``JSONEncoder`` instead of
+  orjson's own formatting, so they come out exactly as before (``Z`` for
+  UTC, DRF's time handling);
+* ``Decimal``, lazy translation strings, querysets and anything else orjson
+  doesn't know also go through DRF's encoder.
+
+Whatever orjson can't reproduce falls back to ``JSONRenderer``: an
+``indent`` requested by the client, non-default ``UNICODE_JSON`` /
+``COMPACT_JSON`` settings, integers beyond 64 bits, or orjson not being
+installed. Floats are written in orjson's shortest form, so very large or
+very small ones read ``1e16`` / ``0.00001`` where ``json`` writes ``1e+16`` /
+``1e-05`` (same value).
+"""
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional: plain DRF rendering
+    orjson = None
+
+
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class ORJSONRenderer(JSONRenderer):
+    options = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def __init__(self):
+        self.default = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same as JSONRenderer: keep the output safe to embed in JavaScript.
+        return ret.replace(LINE_SEPARATOR, b"\\u2028").replace(PARAGRAPH_SEPARATOR, b"\\u2029")
@@ -0,0 +1,217 @@
+"""
+Matching new listings against saved searches.
+
+A new bike is matched against every active ``SavedSearch`` without
+scanning them. ``SearchIndex`` numbers the searches 0..n-1 and keeps, per
+predicate, Python ints used as bitmaps over those numbers:
+
+* categorical fields (brand, location) are hash buckets: one bitmap per
+  value plus one for "any", so a lookup is a dict get and an OR;
+* each range bound (``price_min``, ``price_max``, ``year_min``, ...) is a
+  sorted array of bounds with cumulative bitmaps every ``block`` entries.
+  ``bisect`` finds how many searches accept the bike's value; the bitmap
+  of those is the checkpoint below plus the rest of that block.
+
+ANDing the bitmaps gives exactly the matching searches, so the cost is a
+few big-int operations plus one pass over the result: a couple of
+milliseconds with 100k searches, with no per-search Python in between.
+
+The index is built per process on first use and rebuilt when the
+``SavedSearch`` version (``bikes/cache.py``) changes. Matches become
+``SearchAlert`` rows that ``manage.py send_search_alerts`` mails out in
+batches.
+"""
+import threading
+from bisect import bisect_right
+
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from .cache import get_version
+from .models import BuyBike, SavedSearch, SearchAlert
+
+
+VERSION_NAMESPACE = SavedSearch._meta.label_lower
+
+NEG_INF = float("-inf")
+
+ALERT_BATCH = 5000
+
+# (bike attribute, saved-search lower bound, saved-search upper bound)
+RANGES = [
+    ("price", "price_min", "price_max"),
+    ("year", "year_min", "year_max"),
+    ("kilometers", None, "km_max"),
+]
+
+COLUMNS = ["pk", "brand", "location_id"] + [
+    column for _, low, high in RANGES for column in (low, high) if column
+]
+
+
+def normalize_brand(brand):
+    return (brand or "").strip().casefold()
+
+
+def bitmap(positions, n):
+    bits = bytearray((n + 7) // 8)
+    for pos in positions:
+        bits[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(bits, "little")
+
+
+BYTE_BITS = [[bit for bit in range(8) if byte >> bit & 1] for byte in range(256)]
+
+
+def iter_bits(mask):
+    # One pass over the bytes; peeling bits off a 100k-bit int is quadratic.
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset << 3
+            for bit in BYTE_BITS[byte]:
+                yield base + bit
+
+
+class Bound:
+    """
+    Searches whose bound admits a value. ``lower=True`` means
+    ``bound <= value`` (``None`` admits everything), otherwise
+    ``value <= bound``.
+    """
+
+    def __init__(self, bounds, lower, block):
+        self.size = n = len(bounds)
+        # Upper bounds are negated so both kinds sort "most permissive first".
+        sign = 1 if lower else -1
+        keyed = sorted((NEG_INF if b is None else sign * b, pos) for pos, b in enumerate(bounds))
+        self.sign = sign
+        self.keys = [key for key, _ in keyed]
+        self.order = [pos for _, pos in keyed]
+        self.unbounded = bisect_right(self.keys, NEG_INF)
+        self.block = block
+        # checkpoints[j]: bitmap of the first j * block searches in key order.
+        bits = bytearray((n + 7) // 8)
+        self.checkpoints = [0]
+        for i, pos in enumerate(self.order, start=1):
+            bits[pos >> 3] |= 1 << (pos & 7)
+            if i % block == 0:
+                self.checkpoints.append(int.from_bytes(bits, "little"))
+
+    def admitting(self, value):
+        # A bike without the value only satisfies searches without this bound.
+        count = self.unbounded if value is None else bisect_right(self.keys, self.sign * value)
+        start = count // self.block
+        return self.checkpoints[start] | bitmap(self.order[start * self.block:count], self.size)
+
+
+class SearchIndex:
+    def __init__(self, rows, version=None):
+        self.version = version
+        self.rows = rows
+        n = len(rows)
+        self.block = max(256, n // 64)
+
+        self.brands, self.any_brand = self.buckets([normalize_brand(row[1]) for row in rows], "")
+        self.locations, self.any_location = self.buckets([row[2] for row in rows], None)
+
+        self.bounds = []
+        column = 3
+        for attr, low, high in RANGES:
+            checks = []
+            for lower, present in ((True, low), (False, high)):
+                if present:
+                    checks.append(Bound([row[column] for row in rows], lower, self.block))
+                    column += 1
+            self.bounds.append((attr, checks))
+
+    @staticmethod
+    def buckets(values, wildcard):
+        positions = {}
+        for pos, value in enumerate(values):
+            positions.setdefault(value, []).append(pos)
+        n = len(values)
+        any_mask = bitmap(positions.pop(wildcard, []), n)
+        return {value: bitmap(pos, n) for value, pos in positions.items()}, any_mask
+
+    @classmethod
+    def load(cls, version=None):
+        rows = list(SavedSearch.objects.filter(is_active=True).order_by("pk").values_list(*COLUMNS))
+        return cls(rows, version)
+
+    def matching(self, bike):
+        mask = self.brands.get(normalize_brand(bike.brand), 0) | self.any_brand
+        mask &= self.locations.get(bike.location_id, 0) | self.any_location
+        for attr, checks in self.bounds:
+            value = getattr(bike, attr)
+            for check in checks:
+                if not mask:
+                    return 0
+                mask &= check.admitting(value)
+        return mask
+
+    def match(self, bike):
+        """Ids of the saved searches ``bike`` satisfies."""
+        return [self.rows[pos][0] for pos in iter_bits(self.matching(bike))]
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def get_index():
+    global _index
+    version = get_version(VERSION_NAMESPACE)
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _lock:
+        if _index is None or _index.version != version:
+            _index = SearchIndex.load(version)
+        return _index
+
+
+def queue_alerts(bike_id):
+    """Record a ``SearchAlert`` for every saved search a new bike matches."""
+    bike = BuyBike.objects.filter(pk=bike_id).only("brand", "location", "price", "year", "kilometers").first()
+    if bike is None:
+        return 0
+    search_ids = get_index().match(bike)
+    SearchAlert.objects.bulk_create(
+        [SearchAlert(saved_search_id=pk, bike=bike) for pk in search_ids], ignore_conflicts=True
+    )
+    return len(search_ids)
+
+
+def alert_message(user, bikes):
+    lines = [f"- {bike.title}: Rs. {bike.price}" for bike in bikes]
+    body = "\n".join([f"Hi {user.get_username()},", "", "New bikes matching your saved searches:", "", *lines,
+                      "", "Regards,", "Drive RP Team"])
+    return EmailMessage(
+        f"{len(bikes)} new bike{'s' if len(bikes) != 1 else ''} matching your saved searches",
+        body,
+        from_email="rockyranjith1121@gmail.com",
+        to=[user.email],
+    )
+
+
+def send_alerts(limit=ALERT_BATCH, connection=None):
+    """
+    Mail up to ``limit`` pending alerts, one message per user over a single
+    SMTP connection, and mark them sent. Returns ``(alerts, messages)``.
+    """
+    alerts = list(
+        SearchAlert.objects.filter(sent_at__isnull=True)
+        .select_related("saved_search__user", "bike")
+        .order_by("created_at", "pk")[:limit]
+    )
+    by_user = {}
+    for alert in alerts:
+        user = alert.saved_search.user
+        bikes = by_user.setdefault(user.pk, (user, {}))[1]
+        bikes.setdefault(alert.bike_id, alert.bike)
+    messages = [alert_message(user, list(bikes.values())) for user, bikes in by_user.values() if user.email]
+    if messages:
+        (connection or get_connection()).send_messages(messages)
+    SearchAlert.objects.filter(pk__in=[alert.pk for alert in alerts]).update(sent_at=timezone.now())
+    return len(alerts), len(messages)
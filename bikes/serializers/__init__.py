@@ -0,0 +1,44 @@
+"""
+Serializers, one module per feature (re-exported lazily like ``bikes.views``).
+"""
+from importlib import import_module
+
+
+_EXPORTS = {
+    "sections": [
+        "AbsoluteImageMixin", "LastSectionImageSerializer", "LastSectionSerializer",
+        "HeroBikeImageSerializer", "HeroSectionSerializer", "InfoSectionSerializer",
+        "SupportFeatureSerializer", "StatItemSerializer", "HomepageBannerSerializer",
+        "TestimonialSerializer", "TestimonialsSectionSerializer",
+        "TrustedSectionSerializer", "FAQSerializer", "LoginPageContentSerializer",
+        "HowItWorksSerializer", "SellBikePageSerializer",
+        "AboutSection3ImageSerializer", "AboutSectionSerializer", "FooterSerializer",
+    ],
+    "catalog": [
+        "LocationSerializer", "BuyBikeSerializer", "BuyBikeImageSerializer",
+        "BuyBikeDetailSerializer",
+    ],
+    "bookings": [
+        "BookingCreateSerializer", "BookingDetailSerializer",
+    ],
+    "accounts": [
+        "SignupSerializer",
+    ],
+    "contact": [
+        "ContactSerializer",
+    ],
+    "searches": [
+        "SavedSearchSerializer",
+    ],
+}
+
+_LOOKUP = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LOOKUP)
+
+
+def __getattr__(name):
+    module = _LOOKUP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module}", __name__), name)
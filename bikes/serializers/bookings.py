@@ -0,0 +1,57 @@
+from rest_framework import serializers
+
+from ..models import Booking, BuyBike
+
+
+class BookingCreateSerializer(serializers.ModelSerializer):
+    buybike = serializers.PrimaryKeyRelatedField(queryset=BuyBike.objects.all())
+
+    class Meta:
+        model = Booking
+        fields = ("id", "buybike", "test_drive_fee")
+
+    def create(self, validated_data):
+        bike = validated_data["buybike"]
+        subtotal = float(getattr(bike, "price", 0) or 0)
+        test_drive_fee = float(validated_data.get("test_drive_fee", 0) or 0)
+        gst_amount = round(subtotal * 0.18, 2)
+        total_amount = subtotal + gst_amount + test_drive_fee
+
+        booking = Booking.objects.create(
+            buybike=bike,
+            amount=subtotal,
+            gst_amount=gst_amount,
+            test_drive_fee=test_drive_fee,
+            total_amount=total_amount,
+            status="created",
+        )
+        bike.is_booked = True
+        bike.save(update_fields=["is_booked", "updated_at"])
+        return booking
+
+
+class BookingDetailSerializer(serializers.ModelSerializer):
+    buybike_obj = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Booking
+        fields = [
+            "id",
+            "buybike",
+            "buybike_obj",
+            "amount",
+            "gst_amount",
+            "test_drive_fee",
+            "total_amount",
+            "status",
+            "created_at",
+            "updated_at",
+        ]
+
+    def get_buybike_obj(self, obj):
+        return {
+            "id": obj.buybike.id,
+            "title": obj.buybike.title,
+            "price": obj.buybike.price,
+            "featured_image_url": (obj.buybike.featured_image.url if obj.buybike.featured_image else None),
+        }
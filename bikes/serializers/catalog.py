@@ -0,0 +1,77 @@
+from rest_framework import serializers
+
+from ..models import BuyBike, BuyBikeImage, Location
+
+
+class LocationSerializer(serializers.ModelSerializer):
+    image_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Location
+        fields = ["id", "name", "image", "image_url", "latitude", "longitude"]
+
+    def get_image_url(self, obj):
+        request = self.context.get("request")
+        if obj.image:
+            return request.build_absolute_uri(obj.image.url) if request else obj.image.url
+        return None
+
+
+class BuyBikeSerializer(serializers.ModelSerializer):
+    featured_image_url = serializers.SerializerMethodField()
+    card_bg_image_url = serializers.SerializerMethodField()
+
+    location_obj = LocationSerializer(source="location", read_only=True)
+
+    class Meta:
+        model = BuyBike
+        fields = [
+            "id", "title", "description", "price", "location", "location_obj",
+            "brand", "bike_model", "bike_variant", "year", "registration_year",
+            "kilometers", "engine_cc", "fuel_type", "color",
+            "category", "owner", "owners", "transmission",
+            "rto_state", "rto_city",
+            "refurbished", "registration_certificate", "finance", "insurance", "warranty",
+            "is_booked",
+            "ignition_type", "front_brake_type", "rear_brake_type", "abs", "odometer", "wheel_type",
+         
+            "featured_image", "featured_image_url",
+            "card_bg_image", "card_bg_image_url",
+            "created_at", "updated_at"
+        ]
+
+    def get_featured_image_url(self, obj):
+        request = self.context.get("request")
+        return request.build_absolute_uri(obj.featured_image.url) if obj.featured_image and request else (obj.featured_image.url if obj.featured_image else None)
+
+    def get_card_bg_image_url(self, obj):
+        request = self.context.get("request")
+        return request.build_absolute_uri(obj.card_bg_image.url) if obj.card_bg_image and request else (obj.card_bg_image.url if obj.card_bg_image else None)
+
+
+class BuyBikeImageSerializer(serializers.ModelSerializer):
+    image_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = BuyBikeImage
+        fields = ["id", "image", "image_url", "order"]
+
+    def get_image_url(self, obj):
+        request = self.context.get("request")
+        return request.build_absolute_uri(obj.image.url) if request else obj.image.url
+
+
+class BuyBikeDetailSerializer(BuyBikeSerializer):
+    """A bike with its gallery; expects ``images`` to be prefetched."""
+    images = BuyBikeImageSerializer(many=True, read_only=True)
+
+    class Meta(BuyBikeSerializer.Meta):
+        fields = BuyBikeSerializer.Meta.fields + ["images"]
+
+
+class BikeEventSerializer(serializers.ModelSerializer):
+    """The slice of a bike pushed by ``/api/events/`` (``bikes/events.py``)."""
+
+    class Meta:
+        model = BuyBike
+        fields = ["id", "title", "price", "is_booked", "created_at", "updated_at"]
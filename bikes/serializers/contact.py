@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+from ..models import Contact
+
+
+class ContactSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Contact
+        fields = "__all__"
@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from ..models import SavedSearch
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SavedSearch
+        fields = (
+            "id", "brand", "location", "price_min", "price_max", "year_min", "year_max",
+            "km_max", "is_active", "created_at",
+        )
+        read_only_fields = ("created_at",)
+
+    def validate(self, attrs):
+        for low, high in (("price_min", "price_max"), ("year_min", "year_max")):
+            lo = attrs.get(low, getattr(self.instance, low, None))
+            hi = attrs.get(high, getattr(self.instance, high, None))
+            if lo is not None and hi is not None and lo > hi:
+                raise serializers.ValidationError({low: f"Must not be greater than {high}."})
+        return attrs
@@ -1,18 +1,19 @@
 from rest_framework import serializers
-from .models import AboutSection, AboutSection3Image, Footer
-from rest_framework import serializers
-from .models import SellBikePage, HowItWorks, Contact
-from .models import LoginPageContent
-from django.contrib.auth.models import User
-from .models import HeroSection, HeroBikeImage, InfoSection, SupportFeature
-from .models import BuyBike, Location
-from .models import Booking, BuyBike
-from .models import LastSection, LastSectionImage
-from .models import HomepageBanner, StatItem
-from .models import TestimonialsSection, Testimonial
-from .models import TrustedSection
-from .models import FAQ
 
+from ..models import (
+    FAQ, AboutSection, AboutSection3Image, Footer, HeroBikeImage, HeroSection,
+    HomepageBanner, HowItWorks, InfoSection, LastSection, LastSectionImage,
+    LoginPageContent, SellBikePage, StatItem, SupportFeature, Testimonial,
+    TestimonialsSection, TrustedSection,
+)
+
+
+class AbsoluteImageMixin:
+    def get_absolute_url(self, obj, field_name, request):
+        field = getattr(obj, field_name)
+        if field and hasattr(field, "url"):
+            return request.build_absolute_uri(field.url) if request else field.url
+        return None
 
 
 class LastSectionImageSerializer(serializers.ModelSerializer):
@@ -41,66 +42,6 @@ class LastSectionSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at", "images"]
 
 
-class BookingCreateSerializer(serializers.ModelSerializer):
-    buybike = serializers.PrimaryKeyRelatedField(queryset=BuyBike.objects.all())
-
-    class Meta:
-        model = Booking
-        fields = ("id", "buybike", "test_drive_fee")
-
-    def create(self, validated_data):
-        bike = validated_data["buybike"]
-        subtotal = float(getattr(bike, "price", 0) or 0)
-        test_drive_fee = float(validated_data.get("test_drive_fee", 0) or 0)
-        gst_amount = round(subtotal * 0.18, 2)
-        total_amount = subtotal + gst_amount + test_drive_fee
-
-        booking = Booking.objects.create(
-            buybike=bike,
-            amount=subtotal,
-            gst_amount=gst_amount,
-            test_drive_fee=test_drive_fee,
-            total_amount=total_amount,
-            status="created",
-        )
-        bike.is_booked = True
-        bike.save(update_fields=["is_booked"])
-        return booking
-
-class BookingDetailSerializer(serializers.ModelSerializer):
-    buybike_obj = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Booking
-        fields = [
-            "id",
-            "buybike",
-            "buybike_obj",
-            "amount",
-            "gst_amount",
-            "test_drive_fee",
-            "total_amount",
-            "status",
-            "created_at",
-            "updated_at",
-        ]
-
-    def get_buybike_obj(self, obj):
-        return {
-            "id": obj.buybike.id,
-            "title": obj.buybike.title,
-            "price": obj.buybike.price,
-            "featured_image_url": (obj.buybike.featured_image.url if obj.buybike.featured_image else None),
-        }
-
-
-class AbsoluteImageMixin:
-    def get_absolute_url(self, obj, field_name, request):
-        field = getattr(obj, field_name)
-        if field and hasattr(field, "url"):
-            return request.build_absolute_uri(field.url) if request else field.url
-        return None
-    
 class HeroBikeImageSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
 
@@ -112,7 +53,7 @@ class HeroBikeImageSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         if request:
             return request.build_absolute_uri(obj.image.url)
-        return obj.image.url  
+        return obj.image.url
 
 
 class HeroSectionSerializer(serializers.ModelSerializer):
@@ -165,85 +106,8 @@ class SupportFeatureSerializer(serializers.ModelSerializer):
     def get_arrow_image_url(self, obj):
         request = self.context.get("request")
         return AbsoluteImageMixin().get_absolute_url(obj, "arrow_image", request)
-   
-
-class LocationSerializer(serializers.ModelSerializer):
-    image_url = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Location
-        fields = ["id", "name", "image", "image_url"]
-
-    def get_image_url(self, obj):
-        request = self.context.get("request")
-        if obj.image:
-            return request.build_absolute_uri(obj.image.url) if request else obj.image.url
-        return None
-
-class BuyBikeSerializer(serializers.ModelSerializer):
-    featured_image_url = serializers.SerializerMethodField()
-    card_bg_image_url = serializers.SerializerMethodField()
 
-    
-    variant_image1_url = serializers.SerializerMethodField()
-    variant_image2_url = serializers.SerializerMethodField()
-    variant_image3_url = serializers.SerializerMethodField()
-    variant_image4_url = serializers.SerializerMethodField()
-    variant_image5_url = serializers.SerializerMethodField()
 
-    location_obj = LocationSerializer(source="location", read_only=True)
-
-    class Meta:
-        model = BuyBike
-        fields = [
-            "id", "title", "description", "price", "location", "location_obj",
-            "brand", "bike_model", "bike_variant", "year", "registration_year",
-            "kilometers", "engine_cc", "fuel_type", "color",
-            "category", "owner", "owners", "transmission",
-            "rto_state", "rto_city",
-            "refurbished", "registration_certificate", "finance", "insurance", "warranty",
-            "is_booked",
-            "ignition_type", "front_brake_type", "rear_brake_type", "abs", "odometer", "wheel_type",
-         
-            "featured_image", "featured_image_url",
-            "card_bg_image", "card_bg_image_url",
-            "variant_image1", "variant_image1_url",
-            "variant_image2", "variant_image2_url",
-            "variant_image3", "variant_image3_url",
-            "variant_image4", "variant_image4_url",
-            "variant_image5", "variant_image5_url",
-            "created_at", "updated_at"
-        ]
-
-    def get_featured_image_url(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.featured_image.url) if obj.featured_image and request else (obj.featured_image.url if obj.featured_image else None)
-
-    def get_card_bg_image_url(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.card_bg_image.url) if obj.card_bg_image and request else (obj.card_bg_image.url if obj.card_bg_image else None)
-
-    def get_variant_image1_url(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.variant_image1.url) if obj.variant_image1 and request else (obj.variant_image1.url if obj.variant_image1 else None)
-
-    def get_variant_image2_url(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.variant_image2.url) if obj.variant_image2 and request else (obj.variant_image2.url if obj.variant_image2 else None)
-
-    def get_variant_image3_url(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.variant_image3.url) if obj.variant_image3 and request else (obj.variant_image3.url if obj.variant_image3 else None)
-
-    def get_variant_image4_url(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.variant_image4.url) if obj.variant_image4 and request else (obj.variant_image4.url if obj.variant_image4 else None)
-
-    def get_variant_image5_url(self, obj):
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.variant_image5.url) if obj.variant_image5 and request else (obj.variant_image5.url if obj.variant_image5 else None)
-
-    
 class StatItemSerializer(serializers.ModelSerializer):
     icon_url = serializers.SerializerMethodField()
 
@@ -257,6 +121,7 @@ class StatItemSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.icon.url) if request else obj.icon.url
         return None
 
+
 class HomepageBannerSerializer(serializers.ModelSerializer):
     stats = StatItemSerializer(many=True, read_only=True)
     logo_url = serializers.SerializerMethodField()
@@ -275,7 +140,7 @@ class HomepageBannerSerializer(serializers.ModelSerializer):
         return None
 
     def get_logo_url(self, obj): return self._abs_url(obj.logo)
-    
+
 
 class TestimonialSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
@@ -290,11 +155,13 @@ class TestimonialSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url) if request else obj.image.url
         return None
 
+
 class TestimonialsSectionSerializer(serializers.ModelSerializer):
     class Meta:
         model = TestimonialsSection
         fields = ("id", "title", "subtitle", "is_active")
-        
+
+
 class TrustedSectionSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
 
@@ -307,33 +174,14 @@ class TrustedSectionSerializer(serializers.ModelSerializer):
         if obj.image and hasattr(obj.image, "url"):
             return request.build_absolute_uri(obj.image.url) if request else obj.image.url
         return None
-    
+
+
 class FAQSerializer(serializers.ModelSerializer):
     class Meta:
         model = FAQ
         fields = ("id", "question", "answer", "order")
 
 
-class ContactSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Contact
-        fields = "__all__"
-
-class SignupSerializer(serializers.ModelSerializer):
-    password = serializers.CharField(write_only=True)
-
-    class Meta:
-        model = User
-        fields = ["username", "email", "password"]
-
-    def create(self, validated_data):
-        user = User.objects.create_user(
-            username=validated_data["username"],
-            email=validated_data["email"],
-            password=validated_data["password"],
-        )
-        return user
-
 class LoginPageContentSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
 
@@ -347,11 +195,13 @@ class LoginPageContentSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return None
 
+
 class HowItWorksSerializer(serializers.ModelSerializer):
     class Meta:
         model = HowItWorks
         fields = ["id", "title", "image"]
 
+
 class SellBikePageSerializer(serializers.ModelSerializer):
     how_it_works = HowItWorksSerializer(many=True, read_only=True)
 
@@ -379,6 +229,7 @@ class AboutSection3ImageSerializer(serializers.ModelSerializer):
         model = AboutSection3Image
         fields = ['id', 'image']
 
+
 class AboutSectionSerializer(serializers.ModelSerializer):
     images = AboutSection3ImageSerializer(many=True, read_only=True)
 
@@ -390,4 +241,4 @@ class AboutSectionSerializer(serializers.ModelSerializer):
 class FooterSerializer(serializers.ModelSerializer):
     class Meta:
         model = Footer
-        fields = "__all__"
\ No newline at end of file
+        fields = "__all__"
@@ -0,0 +1,115 @@
+"""Model signal handlers, connected in ``BikesConfig.ready``."""
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import analytics, detail_cache, events, layout
+from .cache import bump_version
+from .jobs import enqueue
+from .changes import record_changes
+from .models import (
+    FAQ, AboutSection, AboutSection3Image, Booking, BuyBike, BuyBikeImage, Footer, HeroBikeImage, HeroSection,
+    HomepageBanner, HowItWorks, InfoSection, LastSection, LastSectionImage, Location,
+    LoginPageContent, SavedSearch, SellBikePage, StatItem, SupportFeature, Testimonial,
+    TestimonialsSection, TrustedSection,
+)
+
+
+# Models whose cached derivatives (API responses, admin filter choices) are
+# keyed on their version.
+VERSIONED_MODELS = [
+    BuyBike, BuyBikeImage, Location, SavedSearch,
+    HeroSection, HeroBikeImage, InfoSection, SupportFeature, HomepageBanner, StatItem,
+    TestimonialsSection, Testimonial, TrustedSection, FAQ, LastSection, LastSectionImage,
+    AboutSection, AboutSection3Image, SellBikePage, HowItWorks, LoginPageContent,
+]
+
+
+def invalidate_model_caches(sender, **kwargs):
+    bump_version(sender._meta.label_lower)
+
+
+for model in VERSIONED_MODELS:
+    post_save.connect(invalidate_model_caches, sender=model, dispatch_uid=f"bikes-version-{model._meta.label_lower}")
+    post_delete.connect(invalidate_model_caches, sender=model, dispatch_uid=f"bikes-version-{model._meta.label_lower}")
+
+
+@receiver([post_save, post_delete], sender=Footer)
+def invalidate_site_layout(sender, **kwargs):
+    layout.invalidate()
+    bump_version(sender._meta.label_lower)
+
+
+@receiver(post_save, sender=BuyBike)
+def log_bike_saved(sender, instance, created, update_fields=None, **kwargs):
+    record_changes([instance.pk])
+    transaction.on_commit(partial(events.publish_bike, instance))
+    # Until the save commits, other workers read (and cache) the old row
+    # under its old stamp; the new stamp is published once it is visible.
+    detail_cache.drop_stamp(instance.pk)
+    transaction.on_commit(partial(detail_cache.store_stamp, instance.pk, instance.updated_at))
+    if created:
+        enqueue("match_saved_searches", bike_id=instance.pk)
+    if instance.featured_image and (created or update_fields is None):
+        enqueue("render_thumbnails", image=instance.featured_image.name, heights=[80, 120])
+
+
+@receiver(post_delete, sender=BuyBike)
+def log_bike_deleted(sender, instance, **kwargs):
+    record_changes([instance.pk], deleted=True)
+    transaction.on_commit(partial(events.publish_removed, instance.pk))
+    detail_cache.drop_stamp(instance.pk)
+    transaction.on_commit(partial(detail_cache.drop_stamp, instance.pk))
+
+
+@receiver(post_save, sender=Location)
+def log_location_saved(sender, instance, created, **kwargs):
+    if not created:
+        record_changes(instance.buybikes.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Location)
+def log_location_deleted(sender, instance, **kwargs):
+    # Its bikes are detached (SET_NULL) by an UPDATE that sends no signals.
+    record_changes(instance.buybikes.values_list("pk", flat=True))
+
+
+# Analytics rollups (bikes/analytics.py): remember the stored state before a
+# save so the handlers after it can move the row between buckets.
+
+@receiver(pre_save, sender=Booking)
+def remember_booking(sender, instance, **kwargs):
+    instance._analytics_before = analytics.stored_booking_state(instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=Booking)
+def roll_up_booking(sender, instance, **kwargs):
+    analytics.booking_changed(getattr(instance, "_analytics_before", None), analytics.booking_state(instance))
+
+
+@receiver(post_delete, sender=Booking)
+def roll_up_booking_deleted(sender, instance, **kwargs):
+    analytics.booking_changed(analytics.booking_state(instance), None)
+
+
+@receiver(pre_save, sender=BuyBike)
+def remember_bike(sender, instance, **kwargs):
+    instance._analytics_before = analytics.stored_bike_state(instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=BuyBike)
+def roll_up_bike(sender, instance, **kwargs):
+    analytics.bike_changed(getattr(instance, "_analytics_before", None), analytics.bike_state(instance))
+
+
+@receiver(post_delete, sender=BuyBike)
+def roll_up_bike_deleted(sender, instance, **kwargs):
+    analytics.bike_changed(analytics.bike_state(instance), None)
+
+
+@receiver(post_save, sender=BuyBikeImage)
+def render_gallery_thumbnails(sender, instance, created, update_fields=None, **kwargs):
+    if instance.image and (created or update_fields is None):
+        enqueue("render_thumbnails", image=instance.image.name, heights=[80])
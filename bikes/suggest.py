@@ -0,0 +1,244 @@
+"""
+Typeahead suggestions for the catalog search box (``/api/buybikes/suggest/``).
+
+Each worker keeps a ``SuggestIndex`` of the brands, models, variants, titles
+and showroom names of the bikes on sale, each weighted by how many bikes
+carry it. A value is indexed under every word start ("Classic 350" is found
+by "cla" and by "35"), in one sorted array of keys, so a prefix is a
+``bisect`` range. The best ``TOP`` terms of every prefix up to
+``SHORT_PREFIX`` characters, whose ranges are the widest, are kept ready.
+
+A lookup never touches the database. Every ``VERSION_CHECK_INTERVAL``
+seconds the worker compares the ``BuyBike``/``Location`` versions
+(``bikes/cache.py``); when they moved it reads the catalog change log
+(``bikes/changes.py``) from its cursor and re-indexes just those bikes.
+"""
+import copy
+import heapq
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+
+from asgiref.sync import sync_to_async
+
+from .cache import get_version
+from .changes import read_changes, settled_cursor
+from .models import BuyBike, CatalogChange, Location
+
+
+FIELDS = ("brand", "bike_model", "bike_variant", "title", "location__name")
+
+# How each field is labelled in the response.
+KINDS = {"brand": "brand", "bike_model": "model", "bike_variant": "variant", "title": "title",
+         "location__name": "location"}
+
+VERSION_NAMESPACES = (BuyBike._meta.label_lower, Location._meta.label_lower)
+
+VERSION_CHECK_INTERVAL = 5
+
+SHORT_PREFIX = 3
+
+TOP = 10
+
+MAX_LIMIT = 25
+
+CHANGE_BATCH = 1000
+
+WORD_START = re.compile(r"\b\w")
+
+
+def normalize(text):
+    return " ".join(text.casefold().split())
+
+
+def word_starts(key):
+    return [key[match.start():] for match in WORD_START.finditer(key)]
+
+
+def bike_terms(row):
+    """``(field, value)`` terms of a ``values_list("pk", *FIELDS)`` row."""
+    return tuple((field, value.strip()) for field, value in zip(FIELDS, row[1:]) if value and value.strip())
+
+
+def load_rows(pks=None):
+    queryset = BuyBike.objects.filter(is_booked=False)
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+    return queryset.values_list("pk", *FIELDS).iterator(chunk_size=2000)
+
+
+class SuggestIndex:
+    def __init__(self, rows, cursor=0, versions=None):
+        self.cursor = cursor
+        self.versions = versions
+        self.checked_at = time.monotonic()
+        self.by_bike = {}
+        # (field, normalized value) -> (display value, bike count)
+        self.terms = {}
+        for row in rows:
+            terms = bike_terms(row)
+            self.by_bike[row[0]] = terms
+            for term in terms:
+                self._count(term, 1)
+        self.keys = sorted(
+            (key, term) for term in self.terms for key in word_starts(term[1])
+        )
+        self.top = {}
+        # Typo-tolerant word index (bikes/fuzzy.py), built on first use.
+        self.fuzzy = None
+        self._refresh_top({key[:n] for key, _ in self.keys for n in range(1, SHORT_PREFIX + 1)})
+
+    def _count(self, term, delta):
+        """Apply ``delta`` to a ``(field, value)`` term; report whether it appeared or vanished."""
+        field, value = term
+        ident = (field, normalize(value))
+        entry = self.terms.get(ident)
+        if entry is None:
+            self.terms[ident] = (value, delta)
+            return ident, True
+        if entry[1] + delta <= 0:
+            del self.terms[ident]
+            return ident, True
+        self.terms[ident] = (entry[0], entry[1] + delta)
+        return ident, False
+
+    def _range(self, prefix):
+        lo = bisect_left(self.keys, (prefix,))
+        hi = bisect_left(self.keys, (prefix + "\U0010ffff",), lo)
+        return lo, hi
+
+    def _best(self, prefix, limit):
+        lo, hi = self._range(prefix)
+        idents = {ident for _, ident in self.keys[lo:hi]}
+        best = heapq.nsmallest(limit, idents, key=lambda ident: (-self.terms[ident][1], ident[1], ident[0]))
+        return [(ident[0], *self.terms[ident]) for ident in best]
+
+    def _refresh_top(self, prefixes):
+        for prefix in prefixes:
+            best = self._best(prefix, TOP)
+            if best:
+                self.top[prefix] = best
+            else:
+                self.top.pop(prefix, None)
+
+    def copy(self):
+        clone = copy.copy(self)
+        clone.by_bike, clone.terms = dict(self.by_bike), dict(self.terms)
+        clone.keys, clone.top = list(self.keys), dict(self.top)
+        clone.fuzzy = None
+        return clone
+
+    def update(self, bike_ids, rows):
+        """
+        Re-index ``bike_ids``; ``rows`` are the current rows of those still on
+        sale. Only for an index no request can see yet (see ``copy``).
+        """
+        touched = set()
+        new = {row[0]: bike_terms(row) for row in rows}
+        for pk in bike_ids:
+            old_terms = self.by_bike.pop(pk, ())
+            new_terms = new.get(pk, ())
+            if new_terms:
+                self.by_bike[pk] = new_terms
+            for terms, delta in ((old_terms, -1), (new_terms, 1)):
+                for term in terms:
+                    ident, added_or_removed = self._count(term, delta)
+                    keys = word_starts(ident[1])
+                    if added_or_removed:
+                        for key in keys:
+                            if ident in self.terms:
+                                insort(self.keys, (key, ident))
+                            else:
+                                i = bisect_left(self.keys, (key, ident))
+                                if i < len(self.keys) and self.keys[i] == (key, ident):
+                                    del self.keys[i]
+                    touched.update(key[:n] for key in keys for n in range(1, SHORT_PREFIX + 1))
+        self._refresh_top(touched)
+
+    def suggest(self, query, limit=TOP):
+        """``[(field, value, count)]`` for the terms with a word starting with ``query``, most stocked first."""
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        if len(prefix) <= SHORT_PREFIX and limit <= TOP:
+            return self.top.get(prefix, [])[:limit]
+        return self._best(prefix, limit)
+
+
+def suggestion_data(index, params):
+    """Response body for ``?q=<text>&limit=<n>``; raises ``ValueError`` on a bad limit."""
+    query = params.get("q", "")
+    limit = min(int(params.get("limit") or TOP), MAX_LIMIT)
+    if limit < 1:
+        raise ValueError(limit)
+    return {
+        "query": query,
+        "results": [{"text": value, "kind": KINDS[field], "count": count}
+                    for field, value, count in index.suggest(query, limit)],
+    }
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def current_versions():
+    return tuple(get_version(namespace) for namespace in VERSION_NAMESPACES)
+
+
+def build_index():
+    versions = current_versions()
+    cursor = settled_cursor()
+    return SuggestIndex(load_rows(), cursor, versions)
+
+
+def catch_up(index, versions):
+    """A copy of ``index`` with the settled change-log rows after its cursor applied."""
+    index = index.copy()
+    while True:
+        rows, cursor, more = read_changes(index.cursor, CHANGE_BATCH)
+        bike_ids = {bike_id for _, bike_id, _ in rows}
+        if bike_ids:
+            index.update(bike_ids, load_rows(bike_ids))
+        index.cursor = cursor
+        if not more:
+            break
+    # Changes still inside the settle window are picked up on a later check.
+    if not CatalogChange.objects.filter(id__gt=index.cursor).exists():
+        index.versions = versions
+    index.checked_at = time.monotonic()
+    return index
+
+
+def _fresh_index():
+    index = _index
+    if index is None:
+        return None
+    now = time.monotonic()
+    if now - index.checked_at < VERSION_CHECK_INTERVAL:
+        return index
+    if current_versions() == index.versions:
+        index.checked_at = now
+        return index
+    return None
+
+
+def get_index():
+    global _index
+    index = _fresh_index()
+    if index is not None:
+        return index
+    with _lock:
+        index = _fresh_index()
+        if index is None:
+            if _index is None:
+                index = build_index()
+            else:
+                index = catch_up(_index, current_versions())
+            _index = index
+    return index
+
+
+async def aget_index():
+    return _fresh_index() or await sync_to_async(get_index)()
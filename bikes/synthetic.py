@@ -0,0 +1,306 @@
+"""
+Deterministic synthetic data for benchmarks and local load tests.
+
+Everything here is driven by a seeded ``random.Random`` so two runs with the
+same seed produce the same catalog. Rows are written with ``bulk_create``;
+image fields only store names that already exist under ``media/`` so the
+API renders real-looking URLs without touching the filesystem. Bulk inserts
+send no signals, so ``seed_bikes`` writes the catalog change log and bumps
+the versions itself.
+"""
+import random
+
+from django.contrib.auth.models import User
+
+from .cache import bump_version
+from .changes import record_changes
+from .geo import encode as geohash_encode
+from .models import (
+    FAQ, AboutSection, Booking, BuyBike, BuyBikeImage, Contact, Footer, HeroBikeImage, HeroSection,
+    HomepageBanner, HowItWorks, InfoSection, LastSection, LastSectionImage,
+    Location, LoginPageContent, SellBikePage, StatItem, SupportFeature,
+    Testimonial, TestimonialsSection, TrustedSection,
+)
+
+
+CATALOG = {
+    "Royal Enfield": [("Classic 350", 349), ("Himalayan", 411), ("Meteor 350", 349), ("Bullet 350", 346)],
+    "Yamaha": [("MT 15", 155), ("R15 V4", 155), ("FZ-S", 149), ("Fascino", 125)],
+    "Bajaj": [("Pulsar 150", 149), ("Pulsar NS200", 199), ("Dominar 400", 373), ("Avenger 220", 220)],
+    "TVS": [("Apache RTR 160", 159), ("Jupiter", 109), ("Ntorq 125", 124), ("Raider 125", 124)],
+    "Honda": [("Activa 6G", 109), ("Shine", 124), ("Unicorn", 162), ("CB350", 348)],
+    "Hero": [("Splendor Plus", 97), ("Glamour", 124), ("Xpulse 200", 199), ("Passion Pro", 113)],
+    "Suzuki": [("Access 125", 124), ("Gixxer", 155), ("Burgman Street", 124)],
+    "KTM": [("Duke 200", 199), ("Duke 390", 373), ("RC 200", 199)],
+    "Ola": [("S1 Pro", 0), ("S1 Air", 0)],
+}
+
+VARIANTS = ["Standard", "Deluxe", "ABS", "Dual Channel ABS", "Disc", "Drum", "Special Edition"]
+CATEGORIES = ["Motor bike", "Scooter", "Sports", "Cruiser", "Adventure"]
+COLORS = ["Black", "Red", "Blue", "Grey", "White", "Green", "Silver"]
+CITIES = [
+    "Chennai", "Chengalpattu", "Tambaram", "Guindy", "Velachery", "Porur", "Anna Nagar",
+    "Coimbatore", "Madurai", "Trichy", "Salem", "Vellore", "Bengaluru", "Hyderabad",
+    "Pondicherry", "Tirunelveli", "Erode", "Hosur", "Kanchipuram", "Thanjavur",
+]
+# Approximate city-centre coordinates for CITIES, in the same order.
+CITY_COORDINATES = [
+    (13.0827, 80.2707), (12.6819, 79.9888), (12.9249, 80.1000), (13.0067, 80.2206),
+    (12.9815, 80.2180), (13.0382, 80.1565), (13.0850, 80.2101), (11.0168, 76.9558),
+    (9.9252, 78.1198), (10.7905, 78.7047), (11.6643, 78.1460), (12.9165, 79.1325),
+    (12.9716, 77.5946), (17.3850, 78.4867), (11.9416, 79.8083), (8.7139, 77.7567),
+    (11.3410, 77.7172), (12.7409, 77.8253), (12.8342, 79.7036), (10.7870, 79.1378),
+]
+RTO_STATES = ["Tamil Nadu", "Karnataka", "Telangana", "Puducherry"]
+
+FEATURED_IMAGES = [
+    "buybikes/images/RoyalEnfiled_Himalayan.png",
+    "buybikes/images/Yamaha_MT15.png",
+    "buybikes/images/bajaj_pulsar_ls.png",
+    "buybikes/images/ola_s1_pro.png",
+    "buybikes/images/susukiAccess_125cc.png",
+]
+VARIANT_IMAGES = [
+    "buybikes/variants/bike1.png", "buybikes/variants/bike2.png",
+    "buybikes/variants/bike3.png", "buybikes/variants/bike4.png",
+    "buybikes/variants/ev.png",
+]
+
+
+def seed_locations(count=20):
+    """Create ``count`` showroom locations (idempotent on name)."""
+    names = [CITIES[i % len(CITIES)] + ("" if i < len(CITIES) else f" {i // len(CITIES) + 1}")
+             for i in range(count)]
+    existing = set(Location.objects.filter(name__in=names).values_list("name", flat=True))
+    locations = []
+    for i, name in enumerate(names):
+        if name in existing:
+            continue
+        # Extra showrooms in a city sit a couple of km apart.
+        lat, lng = CITY_COORDINATES[i % len(CITIES)]
+        lat += 0.02 * (i // len(CITIES))
+        locations.append(Location(name=name, image="locations/location.png", latitude=lat, longitude=lng,
+                                  geohash=geohash_encode(lat, lng)))
+    Location.objects.bulk_create(locations)
+    return list(Location.objects.filter(name__in=names).order_by("pk"))
+
+
+def build_bike(rng, locations):
+    """Return an unsaved, fully populated ``BuyBike``."""
+    brand = rng.choice(list(CATALOG))
+    model, engine_cc = rng.choice(CATALOG[brand])
+    variant = rng.choice(VARIANTS)
+    year = rng.randint(2012, 2025)
+    electric = engine_cc == 0
+    return BuyBike(
+        title=f"{year} | {brand} {model} | {variant}",
+        description=f"Well maintained {brand} {model}, serviced at authorised centres.",
+        price=rng.randrange(25000, 350000, 500),
+        location=rng.choice(locations) if locations else None,
+        brand=brand,
+        bike_model=model,
+        bike_variant=variant,
+        year=year,
+        registration_year=min(year + rng.randint(0, 1), 2025),
+        kilometers=rng.randint(500, 90000),
+        engine_cc=engine_cc or None,
+        fuel_type="Electric" if electric else "Petrol",
+        color=rng.choice(COLORS),
+        category="Scooter" if electric else rng.choice(CATEGORIES),
+        owners=rng.choice([c for c, _ in BuyBike.OWNER_CHOICES]),
+        transmission="auto" if electric else rng.choice(["manual", "manual", "semi-auto"]),
+        rto_state=rng.choice(RTO_STATES),
+        rto_city=rng.choice(CITIES),
+        refurbished=rng.random() < 0.3,
+        registration_certificate=rng.random() < 0.9,
+        finance=rng.random() < 0.5,
+        insurance=rng.random() < 0.7,
+        warranty=rng.random() < 0.2,
+        is_booked=rng.random() < 0.1,
+        featured_image=rng.choice(FEATURED_IMAGES),
+        card_bg_image="buybikes/card_bg/bg_img.png",
+        ignition_type="Self Start" if electric else "Kick & Self Start",
+        front_brake_type="Disc",
+        rear_brake_type=rng.choice(["Drum", "Disc"]),
+        abs=rng.random() < 0.4,
+        odometer=rng.choice(["analogue", "digital", "both"]),
+        wheel_type="Alloy",
+    )
+
+
+def build_gallery(rng, bike):
+    """Return unsaved gallery images (two to five) for a saved ``bike``."""
+    return [BuyBikeImage(bike=bike, image=rng.choice(VARIANT_IMAGES), order=order)
+            for order in range(1, rng.randint(2, 5) + 1)]
+
+
+def seed_bikes(count, locations=None, seed=42, batch_size=2000):
+    """Bulk insert ``count`` bikes spread over ``locations``."""
+    rng = random.Random(seed)
+    locations = list(locations or [])
+    created = 0
+    while created < count:
+        batch = [build_bike(rng, locations) for _ in range(min(batch_size, count - created))]
+        BuyBike.objects.bulk_create(batch, batch_size=batch_size)
+        BuyBikeImage.objects.bulk_create(
+            [image for bike in batch for image in build_gallery(rng, bike)], batch_size=batch_size
+        )
+        record_changes(bike.pk for bike in batch)
+        created += len(batch)
+    for model in (BuyBike, BuyBikeImage):
+        bump_version(model._meta.label_lower)
+    return created
+
+
+def seed_users(count, seed=42):
+    """Create ``count`` customer accounts with an unusable password (fast to insert)."""
+    users = [User(username=f"rider{seed}_{i}", email=f"rider{seed}_{i}@example.com", password="!")
+             for i in range(count)]
+    User.objects.bulk_create(users, ignore_conflicts=True)
+    return list(User.objects.filter(username__startswith=f"rider{seed}_").order_by("pk"))
+
+
+def seed_bookings(count, users=None, seed=42, batch_size=2000):
+    """
+    Bulk insert ``count`` bookings against random bikes. Amounts follow the
+    same rules as ``BookingCreateView`` (18% GST plus the test drive fee).
+    """
+    rng = random.Random(seed)
+    bikes = list(BuyBike.objects.values_list("pk", "price"))
+    users = list(users or [])
+    if not bikes:
+        return 0
+    statuses = ["created"] * 5 + ["paid"] * 4 + ["cancelled"]
+    created = 0
+    while created < count:
+        batch = []
+        for _ in range(min(batch_size, count - created)):
+            pk, price = rng.choice(bikes)
+            fee = rng.choice([0, 0, 500, 1000])
+            gst = round(price * 0.18, 2)
+            batch.append(Booking(
+                buybike_id=pk,
+                user=rng.choice(users) if users and rng.random() < 0.7 else None,
+                amount=price,
+                gst_amount=gst,
+                test_drive_fee=fee,
+                total_amount=round(price + gst + fee, 2),
+                status=rng.choice(statuses),
+            ))
+        Booking.objects.bulk_create(batch, batch_size=batch_size)
+        created += len(batch)
+    return created
+
+
+def seed_contacts(count, seed=42, batch_size=2000):
+    """Bulk insert ``count`` contact-form leads."""
+    rng = random.Random(seed)
+    reasons = [c for c, _ in Contact.REASON_CHOICES]
+    sources = [c for c, _ in Contact.FIND_US_CHOICES]
+    created = 0
+    while created < count:
+        batch = []
+        for i in range(created, created + min(batch_size, count - created)):
+            brand = rng.choice(list(CATALOG))
+            batch.append(Contact(
+                name=f"Customer {i}",
+                email=f"customer{i}@example.com",
+                phone=f"+91 9{rng.randint(100000000, 999999999)}",
+                reason=rng.choice(reasons),
+                find_us=rng.choice(sources),
+                message=f"Interested in a used {brand} {rng.choice(CATALOG[brand])[0]} near {rng.choice(CITIES)}.",
+            ))
+        Contact.objects.bulk_create(batch, batch_size=batch_size)
+        created += len(batch)
+    return created
+
+
+def seed_testimonials(count, seed=42):
+    """Bulk insert ``count`` visible testimonials after the existing ones."""
+    rng = random.Random(seed)
+    quotes = [
+        "Smooth buying experience.", "Bike was exactly as described.",
+        "Paperwork was handled quickly.", "Great test ride and fair price.",
+        "Friendly staff at the showroom.",
+    ]
+    start = Testimonial.objects.count()
+    Testimonial.objects.bulk_create(
+        [Testimonial(name=f"Rider {start + i}", role=rng.choice(["Customer", "Seller", "Commuter"]),
+                     quote=rng.choice(quotes), image=f"testimonials/us{i % 3 + 1}.jpg", order=start + i)
+         for i in range(count)]
+    )
+    return count
+
+
+def seed_sections(seed=42):
+    """Populate every homepage/static section endpoint with one record set."""
+    rng = random.Random(seed)
+
+    hero = HeroSection.objects.create(
+        title="Find your next ride", description="Certified pre-owned bikes.",
+        trapezoid_image="hero/trapezoid/trapezoid.png",
+    )
+    HeroBikeImage.objects.bulk_create(
+        [HeroBikeImage(hero_section=hero, image=f"hero/bike/bike{i}.png", order=i) for i in range(1, 5)]
+    )
+    InfoSection.objects.bulk_create(
+        [InfoSection(description=f"Info block {i}", bike_image="info_section/bike_info.png", order=i)
+         for i in range(3)]
+    )
+    SupportFeature.objects.bulk_create(
+        [SupportFeature(title=f"Support {i}", subtitle="Always on", description="We are here to help.",
+                        image="support_features/247support.jpg",
+                        arrow_image="support_features/arrows/up_arrow.png",
+                        arrow=rng.choice(["up", "down"]), order=i)
+         for i in range(4)]
+    )
+
+    banner = HomepageBanner.objects.create(title="Seconds Bikes", logo="homepage/banner/logo.png")
+    StatItem.objects.bulk_create(
+        [StatItem(banner=banner, icon=icon, value=value, caption=caption, order=i)
+         for i, (icon, value, caption) in enumerate([
+             ("homepage/stat_icons/badge.png", "10K+", "Happy riders"),
+             ("homepage/stat_icons/bike_2.png", "2K+", "Bikes sold"),
+             ("homepage/stat_icons/star.png", "4.8", "Average rating"),
+         ])]
+    )
+
+    TestimonialsSection.objects.create()
+    Testimonial.objects.bulk_create(
+        [Testimonial(name=f"Rider {i}", role="Customer", quote="Smooth buying experience.",
+                     image=f"testimonials/us{i % 3 + 1}.jpg", order=i)
+         for i in range(6)]
+    )
+    TrustedSection.objects.create(description="Trusted across Tamil Nadu.", image="trusted_section/rider.png")
+    FAQ.objects.bulk_create(
+        [FAQ(question=f"Question {i}?", answer="Answer.", order=i) for i in range(8)]
+    )
+
+    last = LastSection.objects.create(heading="How it works", subtitle="Three simple steps")
+    LastSectionImage.objects.bulk_create(
+        [LastSectionImage(section=last, image=f"last_section/{name}.png", title=name, order_no=i)
+         for i, name in enumerate(["choose_your_bike", "take_test_ride", "immediate_delivery"])]
+    )
+
+    for key, _ in AboutSection.SECTION_CHOICES:
+        AboutSection.objects.get_or_create(
+            section=key, defaults={"title": key.title(), "image": "about/abs1.png"}
+        )
+
+    page = SellBikePage.objects.create(
+        top_banner_image="sellbike/sb1.png", top_banner_text="Sell your bike",
+        second_banner_image="sellbike/sb2.png", brand_options=",".join(CATALOG),
+    )
+    HowItWorks.objects.bulk_create(
+        [HowItWorks(page=page, title=f"Step {i}", image=f"sellbike/steps/sb3{i}.jpg") for i in (1, 2)]
+    )
+    LoginPageContent.objects.create(image="login_images/loginbike.png")
+    Footer.objects.create(logo="footer/logo.png", bike_image="footer/bike.png")
+
+
+def seed_catalog(bikes=1000, locations=20, seed=42):
+    """Seed sections, locations and ``bikes`` listings. Returns the locations."""
+    seed_sections(seed=seed)
+    showrooms = seed_locations(locations)
+    seed_bikes(bikes, showrooms, seed=seed)
+    return showrooms
@@ -0,0 +1,42 @@
+"""
+Background jobs (``bikes/jobs.py``): work moved off the request threads.
+
+* ``send_email``: contact-form confirmations and signup mails, retried while
+  the SMTP server is unreachable.
+* ``render_thumbnails``: the admin previews of a new upload, so the first
+  changelist showing it doesn't resize originals.
+* ``match_saved_searches``: the saved-search alerts for a new listing.
+"""
+from django.core.mail import EmailMessage
+
+from . import saved_searches
+from .jobs import enqueue, job
+from .thumbnails import thumbnail_url
+
+
+@job(priority=10, concurrency=2, max_attempts=8)
+def send_email(subject, body, to, from_email=None, bcc=()):
+    EmailMessage(subject, body, from_email=from_email, to=to, bcc=bcc).send(fail_silently=False)
+
+
+def queue_email(message):
+    """Send an ``EmailMessage`` from a worker instead of the current thread."""
+    return enqueue(
+        "send_email", subject=message.subject, body=message.body, to=message.to,
+        from_email=message.from_email, bcc=message.bcc,
+    )
+
+
+@job(priority=-10, concurrency=2, max_attempts=3)
+def render_thumbnails(image, heights):
+    for height in heights:
+        try:
+            thumbnail_url(image, height)
+        except FileNotFoundError:
+            # Replaced or deleted since it was queued.
+            return
+
+
+@job(concurrency=1)
+def match_saved_searches(bike_id):
+    saved_searches.queue_alerts(bike_id)
@@ -1,3 +1,1266 @@
-from django.test import TestCase
+import asyncio
+import datetime
+import gzip
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import DatabaseError, connection, connections
+from django.db.models import Sum
+from django.http import HttpResponse, JsonResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from secondsbikes.database import database_config
+from secondsbikes.routers import ReadReplicaRouter, ReplicaRoutingMiddleware
+
+from . import analytics, detail_cache, events, jobs, layout, metrics, suggest, views
+from .benchmarking import compare, percentile, startup_profile
+from . import cache as api_cache
+from .cache import bump_version, cached_api, negotiate_encoding, version_key
+from .changes import read_changes
+from .fuzzy import TrigramIndex
+from .geo import covering_cells, distances_km, encode
+from .context_processors import footer_context
+from .models import (
+    FAQ, AboutSection, AboutSection3Image, Booking, BookingDailyStats, BuyBike, BuyBikeImage, CatalogChange,
+    Contact, Footer, HeroSection, InfoSection, InventoryDailyStats, InventoryLevel, Job, Location, SavedSearch, SearchAlert,
+    SupportFeature,
+)
+from .parsers import ORJSONParser
+from .renderers import ORJSONRenderer
+from .saved_searches import COLUMNS, SearchIndex, send_alerts
+from .serializers.bookings import BookingDetailSerializer
+from .serializers.catalog import BuyBikeSerializer
+from .serializers.sections import (
+    AboutSectionSerializer, FAQSerializer, HeroSectionSerializer, InfoSectionSerializer,
+    SupportFeatureSerializer,
+)
+from .synthetic import (
+    seed_bikes, seed_bookings, seed_contacts, seed_locations, seed_sections, seed_users,
+)
+from .throttling import hit_window
+from .views import asynchronous as async_views
+from .views.events import bike_events
+
+
+class BenchmarkHelpersTests(TestCase):
+    def test_percentile_nearest_rank(self):
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_compare_reports_relative_change(self):
+        rows = list(compare({"a": {"p50_ms": 12.0}}, {"a": {"p50_ms": 10.0}}, keys=("p50_ms",)))
+        self.assertEqual(rows, [("a", "p50_ms", 10.0, 12.0, 20.0)])
+
+    def test_seed_bikes_is_deterministic(self):
+        locations = seed_locations(3)
+        seed_bikes(25, locations, seed=7)
+        first = list(BuyBike.objects.order_by("pk").values_list("title", "price"))
+        BuyBike.objects.all().delete()
+        seed_bikes(25, locations, seed=7)
+        second = list(BuyBike.objects.order_by("pk").values_list("title", "price"))
+        self.assertEqual(first, second)
+        self.assertEqual(Location.objects.count(), 3)
+
+
+class SyntheticDataTests(TestCase):
+    @override_settings(BIKES_CHANGES_SETTLE_SECONDS=0)
+    def test_seeded_bikes_are_in_the_change_log(self):
+        seed_bikes(12, seed_locations(2), batch_size=5)
+        rows, _, _ = read_changes(0, 100)
+        self.assertEqual(sorted(bike_id for _, bike_id, _ in rows),
+                         sorted(BuyBike.objects.values_list("pk", flat=True)))
+
+    def test_seed_bookings_follow_booking_pricing(self):
+        seed_bikes(10, seed_locations(2))
+        seed_bookings(20, seed_users(3))
+        self.assertEqual(Booking.objects.count(), 20)
+        for booking in Booking.objects.select_related("buybike"):
+            self.assertEqual(booking.amount, booking.buybike.price)
+            self.assertEqual(booking.total_amount, booking.amount + booking.gst_amount + booking.test_drive_fee)
+
+    def test_seed_data_rebuilds_the_analytics_rollups(self):
+        call_command("seed_data", bikes=15, locations=2, users=3, bookings=5, contacts=0,
+                     testimonials=0, stdout=io.StringIO())
+        self.assertEqual(sum(InventoryLevel.objects.values_list("on_sale", flat=True)),
+                         BuyBike.objects.filter(is_booked=False).count())
+        self.assertEqual(sum(BookingDailyStats.objects.values_list("bookings", flat=True)), 5)
+
+    def test_seed_contacts_uses_valid_choices(self):
+        seed_contacts(50, batch_size=20)
+        reasons = {c for c, _ in Contact.REASON_CHOICES}
+        self.assertEqual(Contact.objects.count(), 50)
+        self.assertTrue(set(Contact.objects.values_list("reason", flat=True)) <= reasons)
+
+
+class AsyncViewParityTests(TestCase):
+    """The ASGI views must return byte-identical JSON to the DRF views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_sections()
+        seed_bikes(30, seed_locations(3))
+
+    def assertSameBody(self, drf_view, async_view, path, **kwargs):
+        factory = RequestFactory()
+        expected = drf_view(factory.get(path, HTTP_ACCEPT="application/json"), **kwargs)
+        expected.render()
+        actual = async_to_sync(async_view)(factory.get(path), **kwargs)
+        self.assertEqual(actual.status_code, expected.status_code)
+        self.assertEqual(actual.content, expected.content)
+
+    def test_sections(self):
+        self.assertSameBody(views.HeroSectionList.as_view(), async_views.hero_section_list, "/api/hero/")
+        self.assertSameBody(views.HomepageBannerAPIView.as_view(), async_views.homepage_banner, "/api/homepage-banner/")
+        self.assertSameBody(views.TestimonialsAPIView.as_view(), async_views.testimonials, "/api/testimonials/")
+        self.assertSameBody(views.LastSectionLatestAPIView.as_view(), async_views.last_section_latest, "/api/last-section/")
+
+    def test_catalog_list_with_filters(self):
+        self.assertSameBody(
+            views.BuyBikeList.as_view(), async_views.buybike_list,
+            "/api/buybikes/?brand=yamaha&price_max=200000&ordering=price",
+        )
+        self.assertSameBody(views.BuyBikeList.as_view(), async_views.buybike_list, "/api/buybikes/?year_min=abc")
+        self.assertSameBody(
+            views.BuyBikeList.as_view(), async_views.buybike_list, "/api/buybikes/?near=13.08,80.27&radius=100",
+        )
+
+    def test_detail(self):
+        pk = BuyBike.objects.values_list("pk", flat=True).first()
+        self.assertSameBody(views.BuyBikeDetail.as_view(), async_views.buybike_detail, f"/api/buybikes/{pk}/", pk=pk)
+        self.assertSameBody(views.BuyBikeDetail.as_view(), async_views.buybike_detail, "/api/buybikes/0/", pk=0)
+
+
+class DatabaseProfileTests(TestCase):
+    def test_default_is_bundled_sqlite(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            config = database_config(Path("/srv/app"))
+        self.assertEqual(list(config), ["default"])
+        self.assertEqual(config["default"]["ENGINE"], "django.db.backends.sqlite3")
+        self.assertEqual(config["default"]["NAME"], Path("/srv/app/db.sqlite3"))
+
+    def test_sqlite_production_mode(self):
+        with mock.patch.dict(os.environ, {"DB_SQLITE_PRODUCTION": "1", "DB_SQLITE_BUSY_TIMEOUT": "30"}, clear=True):
+            options = database_config(Path("/srv/app"))["default"]["OPTIONS"]
+        self.assertEqual(options["transaction_mode"], "IMMEDIATE")
+        self.assertEqual(options["timeout"], 30)
+        self.assertIn("PRAGMA journal_mode=WAL", options["init_command"].split(";"))
+        self.assertIn("PRAGMA synchronous=NORMAL", options["init_command"].split(";"))
+
+    def test_postgres_pool_and_replicas(self):
+        env = {"DB_ENGINE": "postgres", "DB_HOST": "primary", "DB_POOL": "1",
+               "DB_POOL_MAX_SIZE": "20", "DB_REPLICA_HOSTS": "r1, r2"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            config = database_config(Path("/srv/app"))
+        default = config["default"]
+        self.assertEqual(default["CONN_MAX_AGE"], 0)
+        self.assertEqual(default["OPTIONS"]["pool"]["max_size"], 20)
+        self.assertTrue(default["CONN_HEALTH_CHECKS"])
+        self.assertEqual([config["replica1"]["HOST"], config["replica2"]["HOST"]], ["r1", "r2"])
+        self.assertEqual(config["replica1"]["TEST"], {"MIRROR": "default"})
+
+
+class ReplicaRoutingTests(TestCase):
+    def route_during(self, method, view):
+        seen = []
+        router = ReadReplicaRouter()
+        middleware = ReplicaRoutingMiddleware(lambda request: HttpResponse())
+        request = getattr(RequestFactory(), method.lower())("/")
+        with mock.patch("secondsbikes.routers.replica_aliases", return_value=["replica1"]):
+            middleware.process_view(request, view, (), {})
+            seen.append(router.db_for_read(BuyBike))
+            middleware.process_response(request, HttpResponse())
+            seen.append(router.db_for_read(BuyBike))
+        return seen
+
+    def test_get_on_catalog_view_reads_from_replica(self):
+        self.assertEqual(self.route_during("GET", views.BuyBikeList.as_view()), ["replica1", None])
+
+    def test_writes_and_unmarked_views_stay_on_primary(self):
+        self.assertEqual(self.route_during("POST", views.BuyBikeList.as_view()), [None, None])
+        self.assertEqual(self.route_during("GET", views.BookingDetailView.as_view()), [None, None])
+
+    def test_health_endpoint(self):
+        response = self.client.get("/api/health/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["databases"], {"default": "ok"})
+
+    def test_health_endpoint_hides_database_errors(self):
+        error = DatabaseError('connection to server at "db.internal" failed for user "bikes"')
+        with mock.patch.object(connections["default"], "cursor", side_effect=error), \
+                self.assertLogs("bikes.views.health", "ERROR"):
+            response = self.client.get("/api/health/")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"status": "error", "databases": {"default": "error"}})
+
+
+class StartupImportTests(SimpleTestCase):
+    """Tracks what a worker imports before it can serve its first request."""
+
+    def test_startup_import_graph(self):
+        timings, modules = startup_profile(env={"CLOUDINARY_URL": ""})
+        self.assertIn("bikes.views.catalog", modules)
+        self.assertNotIn("cloudinary", modules)
+        self.assertNotIn("cloudinary_storage", modules)
+        # Wall-clock budgets only hold on a quiet machine; opt in to them.
+        if os.environ.get("BIKES_TIMING_TESTS") == "1":
+            total_ms = sum(self_us for self_us, _ in timings.values()) / 1000
+            budget_ms = float(os.environ.get("BIKES_IMPORT_BUDGET_MS", 2500))
+            self.assertLess(total_ms, budget_ms, f"startup imports took {total_ms:.0f}ms")
+
+
+class GunicornConfigTests(SimpleTestCase):
+    def load(self, env):
+        config = {}
+        with mock.patch.dict(os.environ, env):
+            os.environ.pop("REDIS_URL", None)
+            os.environ.update(env)
+            exec(Path(settings.BASE_DIR, "gunicorn.conf.py").read_text(), config)
+        return config
+
+    def start(self, config, workers, env):
+        cfg = SimpleNamespace(workers=workers)
+        cfg.set = lambda name, value: setattr(cfg, name, value)
+        server = SimpleNamespace(cfg=cfg, log=mock.Mock())
+        with mock.patch.dict(os.environ, env):
+            os.environ.pop("REDIS_URL", None)
+            os.environ.update(env)
+            config["on_starting"](server)
+        return cfg.workers
+
+    def test_several_workers_need_a_shared_cache(self):
+        redis = {"REDIS_URL": "redis://cache:6379/0"}
+        local = self.load({})
+        self.assertEqual(local["workers"], 1)
+        self.assertEqual(self.start(local, 4, {}), 1)
+        shared = self.load(redis)
+        self.assertEqual(shared["workers"], 4)
+        self.assertEqual(self.start(shared, 4, redis), 4)
+
+
+@override_settings(BIKES_THROTTLES={"login": {"ip": "2/min", "user": "1/min"}})
+class ThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def login(self, **extra):
+        return self.client.post("/api/login/", {"username": "x", "password": "y"},
+                                content_type="application/json", **extra)
+
+    def test_ip_window_rejects_with_retry_after(self):
+        self.assertEqual(self.login().status_code, 401)
+        self.assertEqual(self.login().status_code, 401)
+        response = self.login()
+        self.assertEqual(response.status_code, 429)
+        self.assertIn(int(response["Retry-After"]), range(1, 91))
+        # Other addresses have their own window.
+        self.assertEqual(self.login(REMOTE_ADDR="10.0.0.2").status_code, 401)
+
+    def test_user_window_and_metrics_export(self):
+        staff = User.objects.create_user("ops", password="pw", is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.login().status_code, 401)
+        self.assertEqual(self.login(REMOTE_ADDR="10.0.0.2").status_code, 429)
+
+        body = self.client.get("/api/metrics/").content.decode()
+        self.assertIn('bikes_throttled_requests{endpoint="login",scope="user"} 1', body)
+        self.assertIn('bikes_throttled_requests{endpoint="login",scope="ip"} 0', body)
+        self.client.logout()
+        self.assertEqual(self.client.get("/api/metrics/").status_code, 403)
+
+    def test_window_slides_over_time(self):
+        windows = [("ip", "1.2.3.4", "2/min")]
+        self.assertIsNone(hit_window("login", windows, now=0))
+        self.assertIsNone(hit_window("login", windows, now=0))
+        # Both requests still weigh fully at the start of the next window.
+        self.assertEqual(hit_window("login", windows, now=0), ("ip", 90.0))
+        self.assertEqual(hit_window("login", windows, now=60), ("ip", 30.0))
+        self.assertIsNone(hit_window("login", windows, now=90))
+        self.assertEqual(hit_window("login", windows, now=90)[0], "ip")
+
+    def test_concurrent_requests_cannot_exceed_the_rate(self):
+        windows = [("ip", "1.2.3.4", "5/min")]
+        start, results = threading.Barrier(20), []
+
+        class SlowCache:
+            # Network latency: every call yields to the other requests.
+            def __getattr__(self, name):
+                method = getattr(cache, name)
+
+                def call(*args, **kwargs):
+                    time.sleep(0.005)
+                    return method(*args, **kwargs)
+                return call
+
+        slow = mock.patch("bikes.throttling.cache", SlowCache())
+        slow.start()
+        self.addCleanup(slow.stop)
+
+        def request():
+            start.wait()
+            results.append(hit_window("login", windows, now=0))
+
+        threads = [threading.Thread(target=request) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(None), 5)
+
+
+class LeadListingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff = User.objects.create_superuser("ops", "ops@example.com", "pw")
+
+    def test_contacts_are_cursor_paginated_newest_first(self):
+        seed_contacts(7)
+        first = self.client.get("/api/contacts/?page_size=5").json()
+        self.assertEqual(len(first["results"]), 5)
+        second = self.client.get(first["next"]).json()
+        self.assertEqual(len(second["results"]), 2)
+        stamps = [c["created_at"] for c in first["results"] + second["results"]]
+        self.assertEqual(stamps, sorted(stamps, reverse=True))
+
+    def test_booking_listing_is_staff_only_and_filters_by_status(self):
+        seed_bikes(5, seed_locations(1))
+        seed_bookings(6, seed_users(2))
+        paid = set(Booking.objects.filter(status="paid").values_list("pk", flat=True))
+        self.assertEqual(self.client.get("/api/bookings/").status_code, 401)
+        self.client.force_login(self.staff)
+        response = self.client.get("/api/bookings/?status=paid")
+        self.assertEqual({b["id"] for b in response.json()["results"]}, paid)
+
+    def test_admin_filter_choices_are_cached_until_catalog_changes(self):
+        seed_bikes(5, seed_locations(2))
+        self.client.force_login(self.staff)
+        url = "/admin/bikes/buybike/"
+
+        def load():
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            return response, len(ctx.captured_queries)
+
+        _, cold = load()
+        _, warm = load()
+        self.assertLess(warm, cold)
+
+        bike = BuyBike.objects.first()
+        bike.brand = "Zzyzx Motors"
+        bike.save()
+        response, _ = load()
+        self.assertContains(response, "Zzyzx Motors")
+
+
+class TokenAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("rider", "rider@example.com", "s3cret-pass")
+
+    def login(self):
+        response = self.client.post("/api/login/", {"username": "rider", "password": "s3cret-pass"},
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_access_token_authenticates_booking_calls(self):
+        seed_bikes(1, seed_locations(1))
+        tokens = self.login()
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {tokens['access']}"}
+        booking = self.client.post("/api/bookings/", {"buybike": BuyBike.objects.get().pk},
+                                   content_type="application/json", **auth).json()
+        self.assertEqual(Booking.objects.get(pk=booking["id"]).user, self.user)
+
+        url = f"/api/bookings/{booking['id']}/confirm-payment/"
+        self.assertEqual(self.client.post(url).status_code, 401)
+        self.assertEqual(self.client.post(url, **auth).status_code, 200)
+        self.assertEqual(self.client.post(url, HTTP_AUTHORIZATION="Bearer forged").status_code, 401)
+
+    def test_refresh_rotates_until_password_changes(self):
+        tokens = self.login()
+        refreshed = self.client.post("/api/token/refresh/", {"refresh": tokens["refresh"]},
+                                     content_type="application/json")
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertIn("access", refreshed.json())
+
+        self.user.set_password("new-pass-123")
+        self.user.save()
+        revoked = self.client.post("/api/token/refresh/", {"refresh": tokens["refresh"]},
+                                   content_type="application/json")
+        self.assertEqual(revoked.status_code, 401)
+
+    def test_login_rehashes_at_configured_cost(self):
+        with override_settings(BIKES_PBKDF2_ITERATIONS=1000):
+            self.login()
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+
+
+class SiteLayoutTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        layout.invalidate()
+
+    def test_footer_is_served_from_process_cache_until_saved(self):
+        footer = Footer.objects.create(logo="footer/logo.png", phone="+91 1")
+        first = self.client.get("/api/footer/").json()
+        self.assertEqual(first["logo"], "http://testserver/media/footer/logo.png")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/footer/").json(), first)
+
+        footer.phone = "+91 2"
+        footer.save()
+        self.assertEqual(self.client.get("/api/footer/").json()["phone"], "+91 2")
+
+    def test_context_processor_and_async_view_share_layout(self):
+        Footer.objects.create(phone="+91 3")
+        context = footer_context(RequestFactory().get("/"))
+        self.assertEqual(context["footer"].phone, "+91 3")
+        response = async_to_sync(async_views.footer)(RequestFactory().get("/api/footer/"))
+        self.assertEqual(json.loads(response.content), context["site_layout"])
+
+    def test_rendered_roots_are_bounded(self):
+        Footer.objects.create(phone="+91 4")
+        site = layout.get_layout()
+        for n in range(layout.MAX_ROOTS * 3):
+            site.as_data(RequestFactory().get("/", HTTP_HOST=f"host{n}.example.com"))
+        self.assertEqual(len(site._rendered.entries), layout.MAX_ROOTS)
+
+
+class CachedResponseTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_sections()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_negotiation_prefers_br_then_gzip(self):
+        available = {"identity": b"", "gzip": b"", "br": b""}
+        self.assertEqual(negotiate_encoding("gzip, deflate, br", available), "br")
+        self.assertEqual(negotiate_encoding("br;q=0, gzip", available), "gzip")
+        self.assertEqual(negotiate_encoding("", available), "identity")
+        self.assertEqual(negotiate_encoding("*", {"identity": b"", "gzip": b""}), "gzip")
+
+    def test_faqs_served_precompressed_from_cache(self):
+        plain = self.client.get("/api/faqs/")
+        self.assertNotIn("Content-Encoding", plain)
+        with self.assertNumQueries(0):
+            zipped = self.client.get("/api/faqs/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(zipped["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", zipped["Vary"])
+        self.assertEqual(gzip.decompress(zipped.content), plain.content)
+
+    def test_evicted_version_key_never_revives_an_old_entry(self):
+        faq = FAQ.objects.filter(is_active=True).first()
+        self.client.get("/api/faqs/")
+        faq.question = "First edit?"
+        faq.save()
+        self.assertContains(self.client.get("/api/faqs/"), "First edit?")
+        # The cache culls the version key, then the next edit recreates it.
+        cache.delete(version_key("bikes.faq"))
+        faq.question = "Second edit?"
+        faq.save()
+        self.assertContains(self.client.get("/api/faqs/"), "Second edit?")
+
+    @override_settings(BIKES_API_CACHE_TIMEOUT=0)
+    def test_zero_timeout_turns_caching_off(self):
+        self.client.get("/api/faqs/")
+        # update() sends no signal, so only an uncached read can see it.
+        FAQ.objects.filter(is_active=True).update(question="Fresh from the database?")
+        self.assertContains(self.client.get("/api/faqs/"), "Fresh from the database?")
+
+    def test_model_save_invalidates_and_html_bypasses(self):
+        self.client.get("/api/faqs/")
+        faq = FAQ.objects.filter(is_active=True).first()
+        faq.question = "Is this cached?"
+        faq.save()
+        self.assertContains(self.client.get("/api/faqs/"), "Is this cached?")
+        browsable = self.client.get("/api/faqs/", HTTP_ACCEPT="text/html")
+        self.assertTrue(browsable["Content-Type"].startswith("text/html"))
+
+
+class ORJSONTests(TestCase):
+    def assertSameBytes(self, data, media_type=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, media_type), JSONRenderer().render(data, media_type)
+        )
+
+    def test_renderer_matches_drf_for_catalog_and_bookings(self):
+        seed_bikes(20, seed_locations(2))
+        seed_bookings(5, seed_users(1))
+        request = RequestFactory().get("/")
+        self.assertSameBytes(
+            BuyBikeSerializer(BuyBike.objects.all(), many=True, context={"request": request}).data
+        )
+        self.assertSameBytes(BookingDetailSerializer(Booking.objects.all(), many=True).data)
+
+    def test_renderer_matches_drf_for_raw_values(self):
+        self.assertSameBytes({
+            "when": datetime.datetime(2024, 5, 1, 10, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            "day": datetime.date(2024, 5, 1),
+            "amount": Decimal("1234.50"),
+            "text": "Chennai \u2028 caf\u00e9 \x1f",
+            7: [1, 2.5, None, True],
+        })
+        self.assertSameBytes({"a": [1, 2]}, "application/json; indent=4")
+
+    def test_parser_matches_drf(self):
+        body = '{"buybike": 3, "note": "caf\u00e9", "fee": 12.5}'.encode()
+        self.assertEqual(ORJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{not json"))
+
+
+class ValuesListTests(TestCase):
+    """The values() list views must render exactly what their serializers render."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_sections()
+        HeroSection.objects.create(title="No bikes yet", trapezoid_image="hero/trapezoid/t2.png")
+        SupportFeature.objects.filter(order=0).update(arrow_image=None)
+        SupportFeature.objects.filter(order=1).update(arrow_image="")
+        section3 = AboutSection.objects.get(section="section3")
+        AboutSection3Image.objects.bulk_create(
+            [AboutSection3Image(section3=section3, image=f"about/abs3{i}.png") for i in range(3)]
+        )
+        AboutSection.objects.filter(section="section2").update(image="", title=None)
+
+    def assertSameAsSerializer(self, view_class, serializer_class, queryset):
+        request = RequestFactory().get("/api/", HTTP_ACCEPT="application/json", HTTP_HOST="bikes.example")
+        response = view_class.as_view()(request)
+        response.render()
+        expected = serializer_class(queryset, many=True, context={"request": request}).data
+        self.assertEqual(response.content, JSONRenderer().render(expected))
+
+    def test_matches_serializers(self):
+        self.assertSameAsSerializer(views.HeroSectionList, HeroSectionSerializer, HeroSection.objects.all())
+        self.assertSameAsSerializer(views.InfoSectionList, InfoSectionSerializer, InfoSection.objects.all())
+        self.assertSameAsSerializer(views.SupportFeatureList, SupportFeatureSerializer, SupportFeature.objects.all())
+        self.assertSameAsSerializer(
+            views.FAQListAPIView, FAQSerializer, FAQ.objects.filter(is_active=True).order_by("order")
+        )
+        self.assertSameAsSerializer(views.AboutSectionListAPIView, AboutSectionSerializer, AboutSection.objects.all())
+
+    def test_nested_rows_take_one_query(self):
+        request = RequestFactory().get("/api/hero/")
+        with self.assertNumQueries(2):
+            views.HeroSectionList.as_view()(request)
+
+
+@override_settings(BIKES_CHANGES_SETTLE_SECONDS=0)
+class ChangeFeedTests(TestCase):
+    def sync(self, since="0", **params):
+        response = self.client.get("/api/buybikes/changes/", {"since": since, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_incremental_sync(self):
+        location = Location.objects.create(name="Chennai")
+        bikes = [BuyBike.objects.create(title=f"Bike {i}", price=50000, location=location) for i in range(3)]
+        first = self.sync(limit=2)
+        self.assertTrue(first["more"])
+        rest = self.sync(first["cursor"])
+        self.assertFalse(rest["more"])
+        self.assertEqual([b["id"] for b in first["changed"] + rest["changed"]], [b.pk for b in bikes])
+
+        bikes[0].price = 45000
+        bikes[0].save()
+        deleted_pk = bikes[1].pk
+        bikes[1].delete()
+        delta = self.sync(rest["cursor"])
+        self.assertEqual([(b["id"], b["price"]) for b in delta["changed"]], [(bikes[0].pk, 45000)])
+        self.assertEqual(delta["deleted"], [deleted_pk])
+        self.assertEqual(self.sync(delta["cursor"])["changed"], [])
+        # One log row per bike, however often it changed.
+        self.assertEqual(CatalogChange.objects.count(), 3)
+
+    def test_location_change_and_booking_reach_the_feed(self):
+        location = Location.objects.create(name="Chennai")
+        bike = BuyBike.objects.create(title="Bike", price=50000, location=location)
+        cursor = self.sync()["cursor"]
+        location.name = "Chengalpattu"
+        location.save()
+        delta = self.sync(cursor)
+        self.assertEqual(delta["changed"][0]["location_obj"]["name"], "Chengalpattu")
+
+        before = BuyBike.objects.get(pk=bike.pk).updated_at
+        self.client.post("/api/bookings/", {"buybike": bike.pk}, content_type="application/json")
+        bike.refresh_from_db()
+        self.assertTrue(bike.is_booked)
+        self.assertGreater(bike.updated_at, before)
+        self.assertTrue(self.sync(delta["cursor"])["changed"][0]["is_booked"])
+
+    def test_bad_cursor(self):
+        self.assertEqual(self.client.get("/api/buybikes/changes/", {"since": "x"}).status_code, 400)
+
+
+@override_settings(BIKES_CHANGES_SETTLE_SECONDS=0, BIKES_EVENTS_POLL_INTERVAL=60)
+class BikeEventTests(TestCase):
+    def test_poll_reads_the_change_log(self):
+        kept = BuyBike.objects.create(title="Kept", price=50000)
+        gone = BuyBike.objects.create(title="Gone", price=60000)
+        gone_pk = gone.pk
+        gone.delete()
+        frames, cursor = events.poll_changes(0)
+        self.assertEqual([pk for pk, _ in frames], [kept.pk, gone_pk])
+        self.assertTrue(frames[0][1].startswith(b"event: bike\ndata: {"))
+        self.assertIn(b'"is_booked":false', frames[0][1])
+        self.assertEqual(frames[1][1], f'event: removed\ndata: {{"id":{gone_pk}}}\n\n'.encode())
+        self.assertEqual(events.poll_changes(cursor), ([], cursor))
+
+    @override_settings(BIKES_CHANGES_SETTLE_SECONDS=5, BIKES_EVENTS_POLL_INTERVAL=0.01)
+    def test_poller_waits_for_changes_committed_out_of_order(self):
+        early = BuyBike.objects.create(title="Early", price=50000)
+        BuyBike.objects.create(title="Late", price=60000)
+        # The first save's transaction hasn't committed when the poller starts.
+        pending = CatalogChange.objects.get(bike_id=early.pk)
+        pending_id = pending.pk
+        pending.delete()
+
+        async def scenario():
+            subscription = events.broker.subscribe()
+            while events.broker.cursor is None:
+                await asyncio.sleep(0.01)
+            await CatalogChange.objects.acreate(id=pending_id, bike_id=early.pk)
+            settled = timezone.now() + datetime.timedelta(seconds=1)
+            with mock.patch("bikes.changes.settled_before", return_value=settled):
+                received = await asyncio.wait_for(subscription.queue.get(), 2)
+            events.broker.unsubscribe(subscription)
+            return received
+
+        self.assertIn(b'"title":"Early"', async_to_sync(scenario)())
+
+    def test_stream_fans_out_to_matching_subscribers(self):
+        bike = BuyBike.objects.create(title="Bike", price=50000)
+
+        async def scenario():
+            response = await bike_events(RequestFactory().get("/api/events/", {"bike": bike.pk}))
+            stream = response.streaming_content
+            self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+            other = events.broker.subscribe(bike.pk + 1)
+            await sync_to_async(events.publish_bike)(bike)
+            received = await anext(stream)
+            await stream.aclose()
+            events.broker.unsubscribe(other)
+            return received, other.queue.qsize()
+
+        received, other_queued = async_to_sync(scenario)()
+        self.assertTrue(received.startswith(b"event: bike\n"))
+        self.assertEqual(other_queued, 0)
+        self.assertEqual(events.broker.subscriptions, set())
+
+    def test_slow_subscriber_is_dropped(self):
+        async def scenario():
+            subscription = events.broker.subscribe()
+            events.broker.fan_out([(1, b"x")] * (events.QUEUE_SIZE + 1))
+            return subscription.closed
+
+        self.assertTrue(async_to_sync(scenario)())
+        self.assertEqual(events.broker.subscriptions, set())
+
+
+class GeoSearchTests(TestCase):
+    def test_geohash_and_distance(self):
+        self.assertEqual(encode(57.64911, 10.40744, 11), "u4pruydqqvj")
+        chennai, bengaluru = (13.0827, 80.2707), (12.9716, 77.5946)
+        self.assertAlmostEqual(distances_km(*chennai, [bengaluru])[0], 290, delta=3)
+
+    def test_covering_cells_contain_the_circle(self):
+        rng = random.Random(1)
+        lat, lng, radius = 13.0827, 80.2707, 25
+        cells = covering_cells(lat, lng, radius)
+        for _ in range(500):
+            point = (lat + rng.uniform(-0.3, 0.3), lng + rng.uniform(-0.3, 0.3))
+            if distances_km(lat, lng, [point])[0] <= radius:
+                self.assertTrue(any(encode(*point).startswith(cell) for cell in cells), point)
+        self.assertIsNone(covering_cells(lat, lng, 5000))
+
+    def test_near_filter_and_distance_ordering(self):
+        cache.clear()
+        locations = seed_locations(20)
+        seed_bikes(60, locations)
+        chennai = "13.0827,80.2707"
+        response = self.client.get("/api/buybikes/", {"near": chennai, "radius": 40})
+        self.assertEqual(response.status_code, 200)
+        names = [bike["location_obj"]["name"] for bike in response.json()]
+        self.assertTrue(names)
+        self.assertEqual(set(names) - {"Chennai", "Chengalpattu", "Tambaram", "Guindy", "Velachery",
+                                       "Porur", "Anna Nagar", "Kanchipuram"}, set())
+        coords = [(b["location_obj"]["latitude"], b["location_obj"]["longitude"]) for b in response.json()]
+        distances = distances_km(13.0827, 80.2707, coords)
+        self.assertEqual(distances, sorted(distances))
+
+        by_price = self.client.get("/api/buybikes/", {"near": chennai, "radius": 40, "ordering": "price"}).json()
+        self.assertEqual([b["price"] for b in by_price], sorted(b["price"] for b in by_price))
+        self.assertEqual(self.client.get("/api/buybikes/", {"ordering": "distance"}).status_code, 200)
+        self.assertEqual(self.client.get("/api/buybikes/", {"near": "north"}).status_code, 400)
+
+    def test_list_has_no_per_bike_queries(self):
+        cache.clear()
+        seed_bikes(30, seed_locations(3))
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/buybikes/")
+        self.assertLess(len(queries), 5)
+
+
+class GalleryTests(TestCase):
+    def test_detail_serializes_prefetched_gallery(self):
+        seed_bikes(3, seed_locations(1))
+        bike = BuyBike.objects.first()
+        BuyBikeImage.objects.create(bike=bike, image="buybikes/variants/first.png", order=0)
+        expected = ["buybikes/variants/first.png"] + list(
+            bike.images.exclude(order=0).values_list("image", flat=True)
+        )
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/api/buybikes/{bike.pk}/")
+        images = response.json()["images"]
+        self.assertEqual([i["image"].split("/media/")[-1] for i in images], expected)
+        self.assertTrue(images[0]["image_url"].startswith("http://testserver/"))
+        self.assertEqual(len([q for q in queries if "buybikeimage" in q["sql"]]), 1)
+        self.assertNotIn("images", self.client.get("/api/buybikes/").json()[0])
+
+    def test_admin_bulk_upload_appends_to_gallery(self):
+        staff = User.objects.create_superuser("ops", "ops@example.com", "pw")
+        bike = BuyBike.objects.create(title="Bike", price=50000)
+        BuyBikeImage.objects.create(bike=bike, image="buybikes/variants/bike1.png", order=3)
+        buffer = io.BytesIO()
+        Image.new("RGB", (2, 2)).save(buffer, "PNG")
+        self.client.force_login(staff)
+        data = {
+            "title": "Bike", "price": "50000",
+            "images-TOTAL_FORMS": "1", "images-INITIAL_FORMS": "1",
+            "images-0-id": str(bike.images.get().pk), "images-0-bike": str(bike.pk),
+            "images-0-order": "3",
+            "upload_images": [SimpleUploadedFile(f"up{i}.png", buffer.getvalue(), "image/png") for i in range(3)],
+        }
+        with tempfile.TemporaryDirectory() as media, override_settings(MEDIA_ROOT=media):
+            response = self.client.post(f"/admin/bikes/buybike/{bike.pk}/change/", data)
+        self.assertEqual(response.status_code, 302)
+        orders = list(bike.images.values_list("order", "image"))
+        self.assertEqual([o for o, _ in orders], [3, 4, 5, 6])
+        self.assertTrue(all(name.startswith("buybikes/variants/up") for _, name in orders[1:]))
+
+
+class AdminThumbnailTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff = User.objects.create_superuser("ops", "ops@example.com", "pw")
+
+    def test_thumbnail_is_generated_once_and_persisted(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (1600, 1200), "red").save(buffer, "JPEG")
+        with tempfile.TemporaryDirectory() as media, override_settings(MEDIA_ROOT=media):
+            os.makedirs(os.path.join(media, "buybikes/images"))
+            with open(os.path.join(media, "buybikes/images/big.jpg"), "wb") as fh:
+                fh.write(buffer.getvalue())
+            self.client.force_login(self.staff)
+            url = "/admin-thumbnails/80/buybikes/images/big.jpg"
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 302)
+            self.assertEqual(response["Location"], "/media/thumbs/80/buybikes/images/big.jpg")
+            with Image.open(os.path.join(media, "thumbs/80/buybikes/images/big.jpg")) as thumb:
+                self.assertEqual(thumb.size, (107, 80))
+            self.assertEqual(self.client.get(url)["Location"], response["Location"])
+            self.assertEqual(self.client.get("/admin-thumbnails/80/missing.jpg").status_code, 404)
+            self.assertEqual(self.client.get("/admin-thumbnails/999/buybikes/images/big.jpg").status_code, 404)
+        self.client.logout()
+        self.assertEqual(self.client.get(url).status_code, 302)
+        self.assertIn("/admin/login/", self.client.get(url)["Location"])
+
+    def test_changelist_renders_thumbnails_without_storage_access(self):
+        seed_bikes(20, seed_locations(3))
+        self.client.force_login(self.staff)
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/admin/bikes/buybike/", {"q": "yamaha"})
+        self.assertContains(response, 'src="/admin-thumbnails/80/buybikes/images/')
+        self.assertLess(len(queries), 12)
+
+
+class SavedSearchTests(TestCase):
+    def random_search(self, rng, pk):
+        def maybe(value):
+            return value if rng.random() < 0.6 else None
+        price_min = maybe(rng.randrange(0, 300_000, 5000))
+        year_min = maybe(rng.randint(2010, 2024))
+        return (
+            pk, rng.choice(["", "Honda", "yamaha ", "Bajaj", "KTM"]), maybe(rng.randint(1, 5)),
+            price_min, maybe((price_min or 0) + rng.randrange(0, 300_000, 5000)),
+            year_min, maybe((year_min or 2010) + rng.randint(0, 8)), maybe(rng.randrange(5000, 80_000, 1000)),
+        )
+
+    @staticmethod
+    def brute_force(rows, bike):
+        def within(value, low, high):
+            if value is None:
+                return low is None and high is None
+            return (low is None or low <= value) and (high is None or value <= high)
+        return [
+            pk for pk, brand, location, pmin, pmax, ymin, ymax, km in rows
+            if brand.strip().casefold() in ("", bike.brand.casefold())
+            and location in (None, bike.location_id)
+            and within(bike.price, pmin, pmax) and within(bike.year, ymin, ymax)
+            and within(bike.kilometers, None, km)
+        ]
+
+    def test_index_agrees_with_brute_force(self):
+        rng = random.Random(7)
+        self.assertEqual(len(COLUMNS), 8)
+        rows = [self.random_search(rng, pk) for pk in range(1, 3001)]
+        index = SearchIndex(rows)
+        for _ in range(300):
+            bike = SimpleNamespace(
+                brand=rng.choice(["Honda", "Yamaha", "KTM", "Hero"]), location_id=rng.randint(1, 6),
+                price=rng.randrange(0, 600_000, 2500), year=rng.choice([None, *range(2008, 2026)]),
+                kilometers=rng.choice([None, rng.randrange(0, 100_000, 500)]),
+            )
+            self.assertEqual(index.match(bike), self.brute_force(rows, bike))
+
+    def test_large_index_spans_many_blocks(self):
+        rng = random.Random(11)
+        rows = [self.random_search(rng, pk) for pk in range(100_000)]
+        index = SearchIndex(rows)
+        bike = SimpleNamespace(brand="Honda", location_id=2, price=85_000, year=2019, kilometers=20_000)
+        self.assertEqual(index.match(bike), self.brute_force(rows, bike))
+        # Wall-clock budgets only hold on a quiet machine; opt in to them.
+        if os.environ.get("BIKES_TIMING_TESTS") == "1":
+            started = time.perf_counter()
+            for _ in range(10):
+                index.match(bike)
+            self.assertLess((time.perf_counter() - started) / 10, 0.02)
+
+    def test_new_bike_queues_alerts_and_sends_one_mail_per_user(self):
+        pune, chennai = Location.objects.create(name="Pune"), Location.objects.create(name="Chennai")
+        alice = User.objects.create_user("alice", "alice@example.com", "pw")
+        bob = User.objects.create_user("bob", "bob@example.com", "pw")
+        hit = SavedSearch.objects.create(user=alice, brand="honda", price_max=100_000)
+        SavedSearch.objects.create(user=alice, location=pune)
+        SavedSearch.objects.create(user=bob, location=chennai)
+        SavedSearch.objects.create(user=bob, brand="Honda", is_active=False)
+
+        bike = BuyBike.objects.create(title="Shine", brand="Honda", price=80_000, location=pune)
+        bike.price = 90_000
+        bike.save()
+        self.assertEqual(SearchAlert.objects.count(), 0)
+        self.assertEqual(jobs.run_pending(["match_saved_searches"]), 1)
+        self.assertEqual(SearchAlert.objects.count(), 2)
+        self.assertTrue(SearchAlert.objects.filter(saved_search=hit, bike=bike).exists())
+
+        self.assertEqual(send_alerts(), (2, 1))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["alice@example.com"])
+        self.assertIn("Shine", mail.outbox[0].body)
+        self.assertEqual(send_alerts(), (0, 0))
+
+    def test_api_is_scoped_to_the_user(self):
+        alice = User.objects.create_user("alice", "alice@example.com", "pw")
+        SavedSearch.objects.create(user=User.objects.create_user("bob"), brand="KTM")
+        self.assertEqual(self.client.get("/api/saved-searches/").status_code, 401)
+        self.client.force_login(alice)
+        response = self.client.post("/api/saved-searches/", {"brand": "Honda", "price_min": 5, "price_max": 1},
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post("/api/saved-searches/", {"brand": "Honda", "price_max": 90000},
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        results = self.client.get("/api/saved-searches/").json()["results"]
+        self.assertEqual([r["brand"] for r in results], ["Honda"])
+
+
+@override_settings(BIKES_CHANGES_SETTLE_SECONDS=0)
+class SuggestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        suggest._index = None
+        self.addCleanup(setattr, suggest, "_index", None)
+        self.chennai = Location.objects.create(name="Chennai")
+        for i in range(3):
+            BuyBike.objects.create(title=f"Honda Shine {i}", brand="Honda", bike_model="Shine", price=50000,
+                                   location=self.chennai)
+        BuyBike.objects.create(title="Hero Splendor", brand="Hero", bike_model="Splendor", price=40000)
+
+    def suggest(self, q, **params):
+        response = self.client.get("/api/buybikes/suggest/", {"q": q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(r["kind"], r["text"], r["count"]) for r in response.json()["results"]]
+
+    def test_prefixes_are_weighted_by_stock(self):
+        self.assertEqual(self.suggest("h")[:2], [("brand", "Honda", 3), ("brand", "Hero", 1)])
+        self.assertEqual(self.suggest("SHI", limit=1), [("model", "Shine", 3)])
+        self.assertIn(("title", "Honda Shine 2", 1), self.suggest("shine 2"))
+        self.assertEqual(self.suggest("chen"), [("location", "Chennai", 3)])
+        self.assertEqual(self.suggest(""), [])
+        self.assertEqual(self.client.get("/api/buybikes/suggest/", {"q": "h", "limit": "x"}).status_code, 400)
+        request = RequestFactory().get("/api/buybikes/suggest/", {"q": "ho"})
+        self.assertEqual(async_to_sync(async_views.buybike_suggest)(request).content,
+                         self.client.get("/api/buybikes/suggest/", {"q": "ho"}, HTTP_ACCEPT="application/json").content)
+
+    def test_warm_lookups_skip_the_database_and_changes_are_applied(self):
+        self.suggest("h")
+        with CaptureQueriesContext(connection) as queries:
+            self.suggest("hon")
+        self.assertEqual(len(queries), 0)
+
+        bike = BuyBike.objects.create(title="Hero Glamour", brand="Hero", bike_model="Glamour", price=60000)
+        BuyBike.objects.filter(brand="Honda").first().delete()
+        bike.is_booked = True
+        bike.save()
+        self.chennai.name = "Coimbatore"
+        self.chennai.save()
+        with mock.patch.object(suggest, "VERSION_CHECK_INTERVAL", 0):
+            self.assertEqual(self.suggest("h")[:2], [("brand", "Honda", 2), ("brand", "Hero", 1)])
+            self.assertEqual(self.suggest("gla"), [])
+            self.assertEqual(self.suggest("c"), [("location", "Coimbatore", 2)])
+
+
+class FuzzySearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        suggest._index = None
+        self.addCleanup(setattr, suggest, "_index", None)
+        for title, brand, model in [
+            ("Royal Enfield Himalayan", "Royal Enfield", "Himalayan"),
+            ("RoyalEnfiled_Himalayan 2019", "Royal Enfield", "Himalayan"),
+            ("Royal Enfield Classic 350", "Royal Enfield", "Classic 350"),
+            ("Honda Shine", "Honda", "Shine"),
+        ]:
+            BuyBike.objects.create(title=title, brand=brand, bike_model=model, price=100000)
+
+    def search(self, q, **params):
+        response = self.client.get("/api/buybikes/", {"search": q, **params})
+        self.assertEqual(response.status_code, 200)
+        return [bike["title"] for bike in response.json()]
+
+    def test_trigram_similarity(self):
+        index = TrigramIndex(["enfield", "himalayan", "honda", "royalenfiled"])
+        self.assertEqual([w for w, _ in index.similar("enfeild", 0.3)], ["enfield"])
+        self.assertAlmostEqual(index.similar("enfeild", 0.3)[0][1], 4 / 12)
+        self.assertEqual(index.similar("himalayan", 0.3)[0], ("himalayan", 1.0))
+
+    def test_misspellings_fall_back_to_ranked_fuzzy_matches(self):
+        self.assertEqual(self.search("royal enfeild himalyan"),
+                         ["RoyalEnfiled_Himalayan 2019", "Royal Enfield Himalayan"])
+        self.assertEqual(self.search("hnoda"), [])
+        self.assertEqual(self.search("honda shien"), ["Honda Shine"])
+        # An exact hit outranks close spellings.
+        self.assertEqual(self.search("himalayan")[0], "RoyalEnfiled_Himalayan 2019")
+        with override_settings(BIKES_FUZZY_THRESHOLD=0.9):
+            cache.clear()
+            self.assertEqual(self.search("royal enfeild"), [])
+
+    @override_settings(BIKES_FUZZY_MIN_RESULTS=2)
+    def test_plentiful_exact_hits_skip_fuzzy_matching(self):
+        self.assertEqual(len(self.search("royal")), 3)
+        self.assertEqual(self.search("himalayan", ordering="relevance"),
+                         ["RoyalEnfiled_Himalayan 2019", "Royal Enfield Himalayan"])
+
+
+class AnalyticsTests(TestCase):
+    def snapshot(self):
+        # Buckets emptied by moves linger as zero rows; a rebuild has none.
+        # Daily activity is compared in total: it keeps the showroom a bike
+        # was listed at, a rebuild only knows the current one.
+        return (
+            sorted(BookingDailyStats.objects.filter(bookings__gt=0).values_list(
+                "day", "status", "bookings", "amount", "gst_amount", "test_drive_fee", "total_amount")),
+            sorted(InventoryLevel.objects.exclude(on_sale=0, booked=0).values_list(
+                "brand", "location", "on_sale", "booked", "value"), key=str),
+            InventoryDailyStats.objects.aggregate(listed=Sum("listed"), booked=Sum("booked")),
+        )
+
+    def test_signals_keep_rollups_equal_to_a_rebuild(self):
+        pune = Location.objects.create(name="Pune")
+        honda = BuyBike.objects.create(title="Shine", brand="Honda", price=60000, location=pune)
+        hero = BuyBike.objects.create(title="Splendor", brand="Hero", price=40000, location=pune)
+        BuyBike.objects.create(title="Classic", brand="Royal Enfield", price=150000)
+        response = self.client.post("/api/bookings/", {"buybike": honda.pk, "test_drive_fee": "500"},
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        booking = Booking.objects.get()
+        booking.status = "paid"
+        booking.save(update_fields=["status"])
+        hero.location = None
+        hero.price = 45000
+        hero.save()
+        self.assertEqual(
+            list(InventoryLevel.objects.filter(on_sale__gt=0).values_list("brand", "on_sale", "value")),
+            [("Hero", 1, 45000), ("Royal Enfield", 1, 150000)],
+        )
+        self.assertEqual(InventoryLevel.objects.get(brand="Honda").booked, 1)
+        paid = BookingDailyStats.objects.get(status="paid", bookings=1)
+        self.assertEqual((paid.amount, paid.gst_amount, paid.total_amount),
+                         (Decimal("60000.00"), Decimal("10800.00"), Decimal("71300.00")))
+
+        incremental = self.snapshot()
+        analytics.rebuild()
+        self.assertEqual(self.snapshot(), incremental)
+
+        BuyBike.objects.filter(brand="Royal Enfield").delete()
+        self.assertEqual(InventoryDailyStats.objects.aggregate(n=Sum("removed"))["n"], 1)
+        self.assertFalse(InventoryLevel.objects.filter(brand="Royal Enfield", on_sale__gt=0).exists())
+
+    def test_endpoint_is_staff_only_and_reads_a_bounded_number_of_rows(self):
+        BuyBike.objects.create(title="Shine", brand="Honda", price=60000)
+        self.assertEqual(self.client.get("/api/analytics/").status_code, 401)
+        self.client.force_login(User.objects.create_user("clerk"))
+        self.assertEqual(self.client.get("/api/analytics/").status_code, 403)
+        self.client.force_login(User.objects.create_user("ops", is_staff=True))
+        response = self.client.get("/api/analytics/", {"days": 7, "brand": "honda"})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["bookings"]), 7)
+        self.assertEqual(data["inventory"][-1]["listed"], 1)
+        self.assertEqual(data["stock"][0]["on_sale"], 1)
+        self.assertEqual(self.client.get("/api/analytics/", {"days": 0}).status_code, 400)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/analytics/", {"days": 365})
+        self.assertLessEqual(len(queries), 5)
+
+
+class DetailCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        detail_cache.detail_cache.local.entries.clear()
+        detail_cache.detail_cache.local.take_counts()
+        self.location = Location.objects.create(name="Pune")
+        self.bike = BuyBike.objects.create(title="Shine", brand="Honda", price=60000, location=self.location)
+        self.url = f"/api/buybikes/{self.bike.pk}/"
+
+    def get(self):
+        response = self.client.get(self.url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_hot_listing_is_served_without_queries_and_invalidated_by_changes(self):
+        self.get()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get()["title"], "Shine")
+        self.assertEqual(len(queries), 0)
+
+        self.bike.title = "Shine SP"
+        self.bike.save()
+        self.assertEqual(self.get()["title"], "Shine SP")
+        self.location.name = "Pune East"
+        self.location.save()
+        self.assertEqual(self.get()["location_obj"]["name"], "Pune East")
+        BuyBikeImage.objects.create(bike=self.bike, image="buybikes/variants/a.jpg")
+        self.assertEqual(len(self.get()["images"]), 1)
+        self.client.post("/api/bookings/", {"buybike": self.bike.pk}, content_type="application/json")
+        self.assertTrue(self.get()["is_booked"])
+
+        pk = self.bike.pk
+        self.bike.delete()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        request = RequestFactory().get(f"/api/buybikes/{pk}/")
+        self.assertEqual(async_to_sync(async_views.buybike_detail)(request, pk).status_code, 404)
+
+    def test_shared_tier_refills_the_local_lru_and_counts_events(self):
+        local = detail_cache.LRUCache(2, ttl=60)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+        self.assertEqual(list(local.entries), ["a", "c"])
+        local.ttl = -1
+        local.set("d", 4)
+        self.assertIsNone(local.get("d"))
+        self.assertEqual(local.take_counts(), {("local", "hit"): 1, ("local", "eviction"): 3, ("local", "miss"): 1})
+
+        self.get()
+        detail_cache.detail_cache.local.entries.clear()
+        with CaptureQueriesContext(connection) as queries:
+            self.get()
+        self.assertEqual(len(queries), 0)
+        detail_cache.detail_cache.flush()
+        self.client.force_login(User.objects.create_user("ops", is_staff=True))
+        body = self.client.get("/api/metrics/").content.decode()
+        self.assertIn('bikes_detail_cache_events{event="hit",tier="shared"} 1', body)
+        self.assertIn('bikes_detail_cache_events{event="miss",tier="local"} 2', body)
+
+
+class CoalescingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def view(self, request):
+        self.calls += 1
+        self.release.wait(5)
+        return JsonResponse({"call": self.calls})
+
+    def get(self, view, path="/api/faqs/"):
+        return json.loads(view(RequestFactory().get(path)).content)
+
+    def test_concurrent_misses_compute_once(self):
+        view = cached_api(FAQ)(self.view)
+        self.release.clear()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.get(view))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{"call": 1}] * 8)
+
+    def test_waiters_get_the_previous_payload_while_one_request_recomputes(self):
+        view = cached_api(FAQ)(self.view)
+        self.assertEqual(self.get(view), {"call": 1})
+        bump_version("bikes.faq")
+        self.release.clear()
+        leader = []
+        thread = threading.Thread(target=lambda: leader.append(self.get(view)))
+        thread.start()
+        time.sleep(0.1)
+        # The editor's own request waits for the new payload; everyone else
+        # gets the old one at once.
+        self.assertEqual(self.get(view), {"call": 1})
+        self.release.set()
+        thread.join()
+        self.assertEqual(leader, [{"call": 2}])
+        self.assertEqual(self.get(view), {"call": 2})
+
+        # Another process holding the lock: stale payload, no computation.
+        bump_version("bikes.faq")
+        cache.add(api_cache.lock_key(api_cache.response_key(["bikes.faq"], "http://testserver/api/faqs/")), 1)
+        self.assertEqual(self.get(view), {"call": 2})
+        self.assertEqual(self.calls, 2)
+
+    def test_expired_payload_is_refreshed_in_the_background(self):
+        view = cached_api(FAQ, timeout=60)(self.view)
+        self.get(view)
+        key = api_cache.response_key(["bikes.faq"], "http://testserver/api/faqs/")
+        cache.set(key, {**cache.get(key), "expires": 0})
+        with mock.patch.object(api_cache, "in_background", side_effect=lambda func: func()) as background:
+            self.assertEqual(self.get(view), {"call": 1})
+        background.assert_called_once()
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.get(view)["call"], 2)
+
+    def test_async_views_coalesce_too(self):
+        async def view(request):
+            self.calls += 1
+            await asyncio.sleep(0.1)
+            return JsonResponse({"call": self.calls})
+
+        cached = cached_api(FAQ)(view)
+
+        async def burst():
+            return await asyncio.gather(*(cached(RequestFactory().get("/api/faqs/")) for _ in range(5)))
+
+        responses = async_to_sync(burst)()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual({response.content for response in responses}, {b'{"call": 1}'})
+
+
+class JobTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = []
+        registry = mock.patch.dict(jobs.JOBS)
+        registry.start()
+        self.addCleanup(registry.stop)
+        jobs.job("record", concurrency=1)(lambda **kwargs: self.calls.append(kwargs))
+        jobs.job("urgent", priority=5)(lambda **kwargs: self.calls.append(kwargs))
+
+        def flaky(**kwargs):
+            raise ConnectionError("SMTP down")
+        jobs.job("flaky", max_attempts=2)(flaky)
+
+    def test_contact_mail_is_sent_by_a_worker(self):
+        response = self.client.post("/api/contact-form/", json.dumps({
+            "name": "Asha", "email": "asha@example.com", "phone": "9000000000", "reason": "Sell",
+            "find_us": "Google", "message": "Hi",
+        }), content_type="application/json")
+        self.assertEqual(response.json()["success"], True)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Job.objects.get().name, "send_email")
+
+        call_command("run_jobs", once=True, stdout=io.StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["asha@example.com"])
+        self.assertEqual(Job.objects.get().status, Job.DONE)
+
+    def test_priority_and_concurrency_limit(self):
+        jobs.enqueue("record", n=1)
+        jobs.enqueue("record", n=2)
+        jobs.enqueue("urgent", n=3)
+        first = jobs.claim("w1")
+        self.assertEqual(first.name, "urgent")
+        second = jobs.claim("w1")
+        self.assertEqual((second.name, second.kwargs), ("record", {"n": 1}))
+        # One "record" job at a time, across workers.
+        self.assertIsNone(jobs.claim("w2"))
+        jobs.execute(second)
+        self.assertEqual(jobs.claim("w2").kwargs, {"n": 2})
+        self.assertEqual(self.calls, [{"n": 1}])
+
+    def test_expired_lease_is_claimed_again(self):
+        jobs.enqueue("record", n=1)
+        lost = jobs.claim("w1")
+        Job.objects.filter(pk=lost.pk).update(locked_until=timezone.now() - datetime.timedelta(seconds=1))
+        again = jobs.claim("w2")
+        self.assertEqual((again.pk, again.attempts, again.locked_by), (lost.pk, 2, "w2"))
+        # The first worker finishing late doesn't overwrite the new lease.
+        jobs.execute(lost)
+        self.assertEqual(Job.objects.get().status, Job.RUNNING)
+
+    def test_failures_back_off_then_dead_letter(self):
+        queued = jobs.enqueue("flaky")
+        self.assertEqual(jobs.run_pending(), 1)
+        queued.refresh_from_db()
+        self.assertEqual((queued.status, queued.attempts), (Job.QUEUED, 1))
+        self.assertGreater(queued.run_at, timezone.now() + datetime.timedelta(seconds=4))
+        self.assertIn("SMTP down", queued.last_error)
+        self.assertEqual(jobs.run_pending(), 0)
+
+        Job.objects.update(run_at=timezone.now())
+        self.assertEqual(jobs.run_pending(), 1)
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, Job.DEAD)
+        self.assertEqual(
+            dict((labels["outcome"], n) for labels, n in metrics.read(jobs.RUNS_METRIC, jobs.run_label_sets())
+                 if labels["job"] == "flaky"),
+            {"done": 0, "retried": 1, "dead": 1},
+        )
+        self.assertIn(({"job": "flaky", "status": Job.DEAD}, 1), jobs.queue_depth())
+
+        self.assertEqual(jobs.requeue(Job.objects.all()), 1)
+        queued.refresh_from_db()
+        self.assertEqual((queued.status, queued.attempts), (Job.QUEUED, 0))
+
+    def test_unknown_job_is_rejected(self):
+        with self.assertRaises(ValueError):
+            jobs.enqueue("nope")
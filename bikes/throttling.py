@@ -0,0 +1,169 @@
+"""
+Rate limiting for the write endpoints.
+
+Limits are configured per URL name in ``settings.BIKES_THROTTLES``::
+
+    BIKES_THROTTLES = {
+        "contact-form": {"ip": "5/min", "user": "20/hour"},
+    }
+
+``"N/period"`` (``sec``, ``min``, ``hour`` or ``day``) lets each client make
+``N`` requests in any period, counted with a sliding window: the requests
+of the current fixed window plus those of the previous one, weighted by how
+much of it still overlaps the last period. The ``ip`` window applies to
+every caller; the ``user`` window only to authenticated users (session or
+bearer token). A request must fit in every window that applies.
+
+Only unsafe methods are throttled. The check runs in ``process_view``, after
+URL resolution but before the view reads or parses the request body, and a
+rejected request gets a 429 with ``Retry-After``. Window counts live in the
+default cache and are only changed with ``add``/``incr``/``decr``, which
+are atomic, so concurrent requests from one client can't get past the limit
+together.
+"""
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils.deprecation import MiddlewareMixin
+
+from . import metrics
+from .authentication import bearer_user_id
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+THROTTLED_METRIC = "bikes_throttled_requests"
+
+
+def parse_rate(rate):
+    """``"5/min"`` -> ``(5, 60)``."""
+    count, period = rate.split("/")
+    return int(count), PERIODS[period.strip()[0]]
+
+
+def client_ip(request):
+    """
+    The caller's address. Behind ``BIKES_THROTTLE_PROXIES`` trusted reverse
+    proxies, it is taken from that position in ``X-Forwarded-For``.
+    """
+    proxies = getattr(settings, "BIKES_THROTTLE_PROXIES", 0)
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR")
+    if proxies and forwarded:
+        addresses = [a.strip() for a in forwarded.split(",")]
+        return addresses[-min(proxies, len(addresses))]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def request_user_id(request):
+    """The session user, or the user in a valid bearer token (no query for the latter)."""
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return user.pk
+    return bearer_user_id(request)
+
+
+def window_idents(request, rules):
+    """Yield ``(scope, ident)`` for each window in ``rules`` that applies."""
+    if "ip" in rules:
+        yield "ip", client_ip(request)
+    if "user" in rules:
+        user_id = request_user_id(request)
+        if user_id is not None:
+            yield "user", str(user_id)
+
+
+def window_usage(key, period, now):
+    """
+    Count one more request against ``key``: ``(previous, current)`` window
+    counts, ``current`` including this request, read after an atomic ``incr``.
+    """
+    window = int(now // period)
+    current_key, previous_key = f"{key}:{window}", f"{key}:{window - 1}"
+    # Windows are kept for two periods: the current one and its predecessor.
+    if cache.add(current_key, 1, timeout=2 * period):
+        current = 1
+    else:
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # Expired between add() and incr().
+            cache.add(current_key, 0, timeout=2 * period)
+            current = cache.incr(current_key)
+    return cache.get(previous_key, 0), current, current_key
+
+
+def wait_for_slot(capacity, period, previous, current, elapsed):
+    """Seconds until one more request fits, assuming no other traffic meanwhile."""
+    rest = period - elapsed
+    if current < capacity and previous:
+        # The previous window's weight fades within this one.
+        wait = (previous * (1 - elapsed / period) + current + 1 - capacity) * period / previous
+        if wait <= rest:
+            return max(wait, 0)
+    # Past the window end this one's requests fade instead.
+    return rest + (max(0, 1 - (capacity - 1) / current) * period if current else 0)
+
+
+def hit_window(endpoint, windows, now=None):
+    """
+    Count the request against each ``(scope, ident, rate)`` window if all of
+    them have room. Returns ``(scope, wait_seconds)`` for the first full
+    window, or ``None`` when the request may proceed.
+    """
+    now = time.time() if now is None else now
+    taken = []
+    for scope, ident, rate in windows:
+        capacity, period = parse_rate(rate)
+        elapsed = now % period
+        previous, current, key = window_usage(f"throttle:{endpoint}:{scope}:{ident}", period, now)
+        if previous * (1 - elapsed / period) + current <= capacity:
+            taken.append(key)
+            continue
+        # Rejected requests don't use up the allowance; neither here nor in
+        # the windows already counted.
+        for counted in taken + [key]:
+            try:
+                cache.decr(counted)
+            except ValueError:
+                pass
+        return scope, wait_for_slot(capacity, period, previous, current - 1, elapsed)
+    return None
+
+
+def throttle_label_sets():
+    """Every ``{"endpoint", "scope"}`` pair configured, for the metrics export."""
+    return [
+        {"endpoint": endpoint, "scope": scope}
+        for endpoint, rules in sorted(getattr(settings, "BIKES_THROTTLES", {}).items())
+        for scope in sorted(rules)
+    ]
+
+
+class ThrottleMiddleware(MiddlewareMixin):
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method in SAFE_METHODS:
+            return None
+        match = request.resolver_match
+        rules = getattr(settings, "BIKES_THROTTLES", {}).get(match.url_name if match else None)
+        if not rules:
+            return None
+
+        windows = [(scope, ident, rules[scope]) for scope, ident in window_idents(request, rules)]
+        rejected = hit_window(match.url_name, windows)
+        if rejected is None:
+            return None
+
+        scope, wait = rejected
+        metrics.incr(THROTTLED_METRIC, endpoint=match.url_name, scope=scope)
+        retry_after = max(1, math.ceil(wait))
+        response = JsonResponse(
+            {"detail": f"Request was throttled. Expected available in {retry_after} seconds."},
+            status=429,
+        )
+        response["Retry-After"] = str(retry_after)
+        return response
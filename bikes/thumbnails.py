@@ -0,0 +1,81 @@
+"""
+Small, persisted thumbnails for admin previews.
+
+``admin_thumbnail(fieldfile, height)`` renders an ``<img>`` whose source is
+``thumbnail_view`` rather than the original upload, so rendering a
+changelist or inline touches neither storage nor Pillow. The browser then
+loads each preview lazily; the first request for a (height, image) pair
+resizes the original and saves it next to the uploads under
+``thumbs/<height>/``, later ones are redirected straight to the stored copy
+(the lookup is cached, so no storage round trip either).
+"""
+import io
+import posixpath
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.http import Http404, HttpResponseRedirect
+from django.urls import reverse
+from django.utils.html import format_html
+from PIL import Image, UnidentifiedImageError
+
+
+HEIGHTS = (80, 100, 120)
+
+THUMBNAIL_PREFIX = "thumbs"
+
+URL_TIMEOUT = 24 * 3600
+
+
+def thumbnail_name(name, height):
+    return posixpath.join(THUMBNAIL_PREFIX, str(height), name)
+
+
+def render_thumbnail(source, height):
+    """Resize an open image file to ``height`` px (never upscaling) in its own format."""
+    with Image.open(source) as image:
+        fmt = image.format if image.format in ("JPEG", "PNG", "WEBP", "GIF") else "PNG"
+        image.thumbnail((height * 4, height))
+        if fmt == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        out = io.BytesIO()
+        image.save(out, fmt)
+    return out.getvalue()
+
+
+def thumbnail_url(name, height, storage=default_storage):
+    """URL of the stored thumbnail of ``name``, creating it first if needed."""
+    key = f"thumbnail:{height}:{name}"
+    url = cache.get(key)
+    if url is not None:
+        return url
+    thumb = thumbnail_name(name, height)
+    if not storage.exists(thumb):
+        with storage.open(name, "rb") as source:
+            data = render_thumbnail(source, height)
+        thumb = storage.save(thumb, ContentFile(data))
+    url = storage.url(thumb)
+    cache.set(key, url, URL_TIMEOUT)
+    return url
+
+
+@staff_member_required
+def thumbnail_view(request, height, name):
+    if height not in HEIGHTS or ".." in name.split("/") or name.startswith(THUMBNAIL_PREFIX + "/"):
+        raise Http404
+    try:
+        return HttpResponseRedirect(thumbnail_url(name, height))
+    except (FileNotFoundError, UnidentifiedImageError):
+        raise Http404
+
+
+def admin_thumbnail(fieldfile, height=80):
+    """``<img>`` tag for a thumbnail of ``fieldfile``, or ``""`` when it is empty."""
+    if not fieldfile:
+        return ""
+    return format_html(
+        '<img src="{}" style="max-height:{}px;" loading="lazy" alt=""/>',
+        reverse("admin-thumbnail", args=[height, fieldfile.name]), height,
+    )
@@ -1,43 +1,100 @@
+from django.conf import settings
 from django.urls import path, include
-from .views import (
-    AboutSectionListAPIView, FooterAPIView, SellBikePageView,
-    LoginPageContentView, SignupView, login_view, signup_view,
-    ContactViewSet, contact_view
-)
-from .views import HeroSectionList, InfoSectionList, SupportFeatureList
-from .views import BuyBikeList, BuyBikeDetail, BookingCreateView, BookingDetailView, BookingConfirmPaymentAPIView
-from .views import LastSectionLatestAPIView
-from .views import HomepageBannerAPIView
-from .views import TestimonialsAPIView
-from .views import TrustedSectionAPIView
-from .views import FAQListAPIView
 from rest_framework.routers import DefaultRouter
 
+from .cache import cached_api
+from .models import (
+    FAQ, AboutSection, AboutSection3Image, BuyBike, HeroBikeImage, HeroSection, HomepageBanner,
+    HowItWorks, InfoSection, LastSection, LastSectionImage, Location, LoginPageContent,
+    SellBikePage, StatItem, SupportFeature, Testimonial, TestimonialsSection, TrustedSection,
+)
+from .views.accounts import login_view, signup_view, token_refresh_view
+from .views.analytics import AnalyticsAPIView
+from .views.bookings import BookingConfirmPaymentAPIView, BookingCreateView, BookingDetailView
+from .views.catalog import BuyBikeChangesAPIView, BuyBikeDetail, BuyBikeList, BuyBikeSuggestAPIView
+from .views.contact import ContactViewSet, contact_view
+from .views.health import health_view, metrics_view
+from .views.searches import SavedSearchViewSet
+from .thumbnails import thumbnail_view
+from .views.sections import (
+    AboutSectionListAPIView, FAQListAPIView, FooterAPIView, HeroSectionList,
+    HomepageBannerAPIView, InfoSectionList, LastSectionLatestAPIView, LoginPageContentView,
+    SellBikePageView, SupportFeatureList, TestimonialsAPIView, TrustedSectionAPIView,
+)
+
+# Cached, precompressed JSON responses (bikes/cache.py), each invalidated when
+# one of the models it is built from changes. Shared by the sync and async
+# variants of a view.
+hero_cache = cached_api(HeroSection, HeroBikeImage)
+info_cache = cached_api(InfoSection)
+support_cache = cached_api(SupportFeature)
+banner_cache = cached_api(HomepageBanner, StatItem)
+catalog_cache = cached_api(BuyBike, Location)
+last_section_cache = cached_api(LastSection, LastSectionImage)
+testimonials_cache = cached_api(TestimonialsSection, Testimonial)
+trusted_cache = cached_api(TrustedSection)
+faq_cache = cached_api(FAQ)
+about_cache = cached_api(AboutSection, AboutSection3Image)
+sellbike_cache = cached_api(SellBikePage, HowItWorks)
+login_content_cache = cached_api(LoginPageContent)
+
 router = DefaultRouter()
 router.register(r'contacts', ContactViewSet, basename="contact")
+router.register(r'saved-searches', SavedSearchViewSet, basename="saved-search")
 
 urlpatterns = [
-    path("api/hero/", HeroSectionList.as_view(), name="hero-section"),
-    path("api/info/", InfoSectionList.as_view(), name="info-section"),
-    path("api/support/", SupportFeatureList.as_view(), name="support-features"),
-    path("api/homepage-banner/", HomepageBannerAPIView.as_view(), name="homepage-banner"),
-    path("api/buybikes/", BuyBikeList.as_view(), name="buybike-list"),
+    path("api/hero/", hero_cache(HeroSectionList.as_view()), name="hero-section"),
+    path("api/info/", info_cache(InfoSectionList.as_view()), name="info-section"),
+    path("api/support/", support_cache(SupportFeatureList.as_view()), name="support-features"),
+    path("api/homepage-banner/", banner_cache(HomepageBannerAPIView.as_view()), name="homepage-banner"),
+    path("api/buybikes/", catalog_cache(BuyBikeList.as_view()), name="buybike-list"),
     path("api/buybikes/<int:pk>/", BuyBikeDetail.as_view(), name="buybike-detail"),
+    path("api/buybikes/changes/", BuyBikeChangesAPIView.as_view(), name="buybike-changes"),
+    path("api/buybikes/suggest/", BuyBikeSuggestAPIView.as_view(), name="buybike-suggest"),
     path("api/bookings/", BookingCreateView.as_view(), name="booking-create"),
     path("api/bookings/<int:pk>/", BookingDetailView.as_view(), name="booking-detail"),
     path("api/bookings/<int:pk>/confirm-payment/", BookingConfirmPaymentAPIView.as_view(), name="booking-confirm"),
-    path("api/last-section/", LastSectionLatestAPIView.as_view(), name="last-section-latest"),
-    path("api/testimonials/", TestimonialsAPIView.as_view(), name="testimonials"),
-    path("api/trusted-section/", TrustedSectionAPIView.as_view(), name="trusted-section"),
-    path("api/faqs/", FAQListAPIView.as_view(), name="faq-list"),
+    path("api/last-section/", last_section_cache(LastSectionLatestAPIView.as_view()), name="last-section-latest"),
+    path("api/testimonials/", testimonials_cache(TestimonialsAPIView.as_view()), name="testimonials"),
+    path("api/trusted-section/", trusted_cache(TrustedSectionAPIView.as_view()), name="trusted-section"),
+    path("api/faqs/", faq_cache(FAQListAPIView.as_view()), name="faq-list"),
     
     
-    path("api/about/", AboutSectionListAPIView.as_view(), name='api-about'),
+    path("api/about/", about_cache(AboutSectionListAPIView.as_view()), name='api-about'),
     path("api/footer/", FooterAPIView.as_view(), name="footer"),
-    path("api/sellbike/", SellBikePageView.as_view(), name="sellbike-page"),
-    path("api/login-content/", LoginPageContentView.as_view(), name="login-content"),
+    path("api/sellbike/", sellbike_cache(SellBikePageView.as_view()), name="sellbike-page"),
+    path("api/login-content/", login_content_cache(LoginPageContentView.as_view()), name="login-content"),
     path("api/login/", login_view, name="login"),
     path("api/signup/", signup_view, name="signup"),
+    path("api/token/refresh/", token_refresh_view, name="token-refresh"),
     path("api/", include(router.urls)),
-    path("api/contact-form/", contact_view),
+    path("api/contact-form/", contact_view, name="contact-form"),
+    path("api/analytics/", AnalyticsAPIView.as_view(), name="analytics"),
+    path("api/health/", health_view, name="health"),
+    path("api/metrics/", metrics_view, name="metrics"),
+    path("admin-thumbnails/<int:height>/<path:name>", thumbnail_view, name="admin-thumbnail"),
 ]
+
+if settings.BIKES_ASYNC_VIEWS:
+    # ASGI profile: native async variants of the read-heavy endpoints. Listed
+    # first so they shadow the DRF views at the same paths. The event stream
+    # holds its connection open, so it is only offered here.
+    from .views import asynchronous as async_views
+    from .views.events import bike_events
+
+    urlpatterns = [
+        path("api/hero/", hero_cache(async_views.hero_section_list), name="hero-section"),
+        path("api/info/", info_cache(async_views.info_section_list), name="info-section"),
+        path("api/support/", support_cache(async_views.support_feature_list), name="support-features"),
+        path("api/homepage-banner/", banner_cache(async_views.homepage_banner), name="homepage-banner"),
+        path("api/buybikes/", catalog_cache(async_views.buybike_list), name="buybike-list"),
+        path("api/buybikes/<int:pk>/", async_views.buybike_detail, name="buybike-detail"),
+        path("api/buybikes/suggest/", async_views.buybike_suggest, name="buybike-suggest"),
+        path("api/last-section/", last_section_cache(async_views.last_section_latest), name="last-section-latest"),
+        path("api/testimonials/", testimonials_cache(async_views.testimonials), name="testimonials"),
+        path("api/trusted-section/", trusted_cache(async_views.trusted_section), name="trusted-section"),
+        path("api/faqs/", faq_cache(async_views.faq_list), name="faq-list"),
+        path("api/footer/", async_views.footer, name="footer"),
+        path("api/contact-form/", async_views.contact_view, name="contact-form"),
+        path("api/events/", bike_events, name="bike-events"),
+    ] + urlpatterns
@@ -0,0 +1,148 @@
+"""
+Read-only list views that skip model instances and serializers.
+
+A ``ValuesListAPIView`` declares its output the way a serializer's
+``Meta.fields`` would, and the rows are built straight from
+``values_list()`` tuples::
+
+    class InfoSectionList(ValuesListAPIView):
+        queryset = InfoSection.objects.all()
+        fields = ("id", "description", media("bike_image"), media("bike_image", "bike_image_url"))
+
+* A plain string is a model column copied as is.
+* ``media(column, key=None)`` is an image/file column rendered the way DRF's
+  ``ImageField`` and the ``*_url`` method fields render it: the storage URL
+  made absolute against the request, or ``None`` when the column is empty.
+* ``nested(accessor, fields)`` is a reverse foreign key (``related_name``)
+  rendered as a list, fetched with one extra query for the whole page and
+  ordered by the related model's ``Meta.ordering``. One level deep only.
+
+The field list is compiled once per view class into ``(key, index, convert)``
+triples, so a row costs a tuple lookup per key. Only use this for fields
+whose serializer output is the raw column value (text, numbers, booleans);
+anything with a serializer-side transformation stays on a ``ModelSerializer``.
+"""
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class media:
+    def __init__(self, column, key=None):
+        self.column = column
+        self.key = key or column
+
+
+class nested:
+    def __init__(self, accessor, fields):
+        self.accessor = accessor
+        self.key = accessor
+        self.fields = fields
+
+
+class Plan:
+    """The compiled form of a ``fields`` declaration for one model."""
+
+    def __init__(self, model, fields):
+        self.model = model
+        self.columns = ["pk"]
+        self.children = []
+        # (key, column index, storage or None, is_nested), in output order.
+        self.entries = []
+        for spec in fields:
+            if isinstance(spec, nested):
+                rel = model._meta.get_field(spec.accessor)
+                self.children.append((spec.key, rel.field.name, Plan(rel.related_model, spec.fields)))
+                self.entries.append((spec.key, 0, None, True))
+                continue
+            if isinstance(spec, media):
+                column, key = spec.column, spec.key
+                storage = model._meta.get_field(column).storage
+            else:
+                column = key = spec
+                storage = None
+            if column not in self.columns:
+                self.columns.append(column)
+            self.entries.append((key, self.columns.index(column), storage, False))
+
+    def converters(self, request, children):
+        """``[(key, index, convert)]`` bound to ``request`` and the fetched child rows."""
+        def url(storage):
+            def convert(name):
+                return request.build_absolute_uri(storage.url(name)) if name else None
+            return convert
+
+        def related(grouped):
+            return lambda pk: grouped.get(pk, [])
+
+        converters = []
+        for key, index, storage, is_nested in self.entries:
+            if is_nested:
+                converters.append((key, index, related(children[key])))
+            else:
+                converters.append((key, index, url(storage) if storage else None))
+        return converters
+
+    def build(self, rows, children, request):
+        converters = self.converters(request, children)
+        results = []
+        for row in rows:
+            item = {}
+            for key, index, convert in converters:
+                value = row[index]
+                item[key] = convert(value) if convert else value
+            results.append(item)
+        return results
+
+    def child_queryset(self, fk_name, parent_ids):
+        return self.model._default_manager.filter(**{f"{fk_name}__in": parent_ids}).values_list(
+            fk_name, *self.columns
+        )
+
+    def group(self, rows, request):
+        """Build child rows (``(parent_id, *columns)``) grouped by parent id."""
+        grouped = {}
+        items = self.build([row[1:] for row in rows], {}, request)
+        for row, item in zip(rows, items):
+            grouped.setdefault(row[0], []).append(item)
+        return grouped
+
+    def evaluate(self, queryset, request):
+        rows = list(queryset.values_list(*self.columns))
+        ids = [row[0] for row in rows]
+        children = {}
+        for key, fk_name, plan in self.children:
+            child_rows = list(plan.child_queryset(fk_name, ids)) if ids else []
+            children[key] = plan.group(child_rows, request)
+        return self.build(rows, children, request)
+
+    async def aevaluate(self, queryset, request):
+        rows = [row async for row in queryset.values_list(*self.columns)]
+        ids = [row[0] for row in rows]
+        children = {}
+        for key, fk_name, plan in self.children:
+            child_rows = [row async for row in plan.child_queryset(fk_name, ids)] if ids else []
+            children[key] = plan.group(child_rows, request)
+        return self.build(rows, children, request)
+
+
+class ValuesListAPIView(APIView):
+    queryset = None
+    fields = ()
+
+    @classmethod
+    def plan(cls):
+        # Compiled lazily so app loading doesn't need the model fields.
+        if "_plan" not in cls.__dict__:
+            cls._plan = Plan(cls.queryset.model, cls.fields)
+        return cls._plan
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+    def get(self, request, *args, **kwargs):
+        return Response(self.plan().evaluate(self.get_queryset(), request))
+
+    @classmethod
+    async def alist(cls, request):
+        """The same data as ``get``, read with the async ORM (for ``views/asynchronous.py``)."""
+        return await cls.plan().aevaluate(cls.queryset.all(), request)
@@ -0,0 +1,50 @@
+"""
+Views, one module per feature.
+
+Names are re-exported lazily, so ``from bikes.views import BuyBikeList`` keeps
+working but only imports the feature module it needs.
+"""
+from importlib import import_module
+
+
+_EXPORTS = {
+    "sections": [
+        "LastSectionListCreateAPIView", "LastSectionRetrieveAPIView",
+        "LastSectionLatestAPIView", "HeroSectionList", "InfoSectionList",
+        "SupportFeatureList", "HomepageBannerAPIView", "TestimonialsAPIView",
+        "TrustedSectionAPIView", "FAQListAPIView", "LoginPageContentView",
+        "AboutSectionListAPIView", "SellBikePageView", "FooterAPIView",
+    ],
+    "catalog": [
+        "BuyBikeList", "BuyBikeDetail", "BuyBikeChangesAPIView", "BuyBikeSuggestAPIView",
+    ],
+    "bookings": [
+        "BookingCreateView", "BookingDetailView", "BookingConfirmPaymentAPIView",
+    ],
+    "accounts": [
+        "login_view", "signup_view", "token_refresh_view", "SignupView",
+    ],
+    "contact": [
+        "contact_confirmation_email", "contact_view", "ContactViewSet",
+    ],
+    "analytics": [
+        "AnalyticsAPIView",
+    ],
+    "searches": [
+        "SavedSearchViewSet",
+    ],
+    "health": [
+        "health_view", "metrics_view",
+    ],
+}
+
+_LOOKUP = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LOOKUP)
+
+
+def __getattr__(name):
+    module = _LOOKUP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module}", __name__), name)
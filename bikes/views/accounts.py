@@ -0,0 +1,65 @@
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from django.core.mail import EmailMessage
+from rest_framework import generics, status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from ..authentication import issue_tokens, refresh_tokens
+from ..serializers.accounts import SignupSerializer
+from ..tasks import queue_email
+
+
+@api_view(["POST"])
+def login_view(request):
+    username = request.data.get("username")
+    password = request.data.get("password")
+
+    user = authenticate(username=username, password=password)
+    if user is not None:
+        return Response({"success": True, "message": "Login successful", **issue_tokens(user)})
+    else:
+        return Response({"success": False, "message": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
+
+
+@api_view(["POST"])
+def signup_view(request):
+    username = request.data.get("username")
+    email = request.data.get("email")
+    password = request.data.get("password")
+
+    if not username or not email or not password:
+        return Response({"error": "All fields are required"}, status=status.HTTP_400_BAD_REQUEST)
+
+    if User.objects.filter(username=username).exists():
+        return Response({"error": "Username already exists"}, status=status.HTTP_400_BAD_REQUEST)
+    if User.objects.filter(email=email).exists():
+        return Response({"error": "Email already registered"}, status=status.HTTP_400_BAD_REQUEST)
+
+    user = User.objects.create_user(username=username, email=email, password=password)
+
+    # Send confirmation email to user
+    subject_user = "Welcome to Drive RP!"
+    body_user = f"Hi {username},\n\nYou have successfully registered at Drive RP.\n\nThank you!"
+    queue_email(EmailMessage(subject_user, body_user, to=[email]))
+
+    # Notify admin
+    subject_admin = "New User Registration"
+    body_admin = f"New user registered:\n\nUsername: {username}\nEmail: {email}"
+    queue_email(EmailMessage(subject_admin, body_admin, to=["rockyranjith1121@gmail.com"]))
+
+    return Response({"success": True, "message": "User registered successfully", **issue_tokens(user)})
+
+
+@api_view(["POST"])
+def token_refresh_view(request):
+    """Exchange a refresh token for a new access/refresh pair."""
+    refresh = request.data.get("refresh")
+    if not refresh:
+        return Response({"error": "refresh is required"}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(refresh_tokens(refresh))
+
+
+class SignupView(generics.CreateAPIView):
+    queryset = User.objects.all()
+    serializer_class = SignupSerializer
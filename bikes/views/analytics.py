@@ -0,0 +1,41 @@
+from datetime import date
+
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..analytics import MAX_DAYS, booking_series, day_range, inventory_levels, inventory_series
+
+
+class AnalyticsAPIView(APIView):
+    """
+    Staff dashboard figures from the rollup tables (``bikes/analytics.py``).
+
+    GET ?days=<n>&end=<YYYY-MM-DD>&brand=<brand>&location=<id> -> daily
+    bookings and amounts per status, daily listing activity (optionally for
+    one brand and/or showroom) and the current stock per brand and showroom.
+    """
+    read_replica = True
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        params = request.query_params
+        try:
+            days = int(params.get("days") or 30)
+            end = date.fromisoformat(params["end"]) if params.get("end") else None
+            location = int(params["location"]) if params.get("location") else None
+        except ValueError:
+            return Response({"detail": "days and location must be integers, end a YYYY-MM-DD date"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= days <= MAX_DAYS:
+            return Response({"detail": f"days must be between 1 and {MAX_DAYS}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        start, end = day_range(days, end)
+        return Response({
+            "start": start,
+            "end": end,
+            "bookings": booking_series(start, end),
+            "inventory": inventory_series(start, end, params.get("brand"), location),
+            "stock": inventory_levels(),
+        })
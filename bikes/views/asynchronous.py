@@ -0,0 +1,187 @@
+"""
+Native async variants of the read-heavy endpoints, used by the ASGI profile
+(see ``secondsbikes/asgi.py``).
+
+They return exactly what the DRF views in this package return for JSON
+clients: the same serializers (or ``ValuesListAPIView`` plans) and the same
+JSON renderer produce the body, only the queryset is evaluated with Django's
+async ORM so the request never parks a worker thread. Related rows that the
+serializers walk are fetched up front with ``select_related``/
+``prefetch_related`` because lazy relation access is not allowed from async
+code.
+"""
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from secondsbikes.routers import replica_safe
+
+from ..detail_cache import detail_cache
+from ..layout import aget_layout
+from ..suggest import aget_index, suggestion_data
+from ..tasks import queue_email
+from ..models import (
+    BuyBike, Contact, HomepageBanner, LastSection, Testimonial, TestimonialsSection, TrustedSection,
+)
+from ..serializers.catalog import BuyBikeDetailSerializer, BuyBikeSerializer
+from ..serializers.sections import (
+    HomepageBannerSerializer, LastSectionSerializer, TestimonialSerializer,
+    TestimonialsSectionSerializer, TrustedSectionSerializer,
+)
+from .catalog import BuyBikeList
+from .contact import contact_confirmation_email
+from .sections import FAQListAPIView, HeroSectionList, InfoSectionList, SupportFeatureList
+
+
+def render(data, status_code=status.HTTP_200_OK):
+    # The first configured renderer is the JSON one DRF views use for API clients.
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    return HttpResponse(renderer.render(data), status=status_code, content_type="application/json")
+
+
+async def serialize_many(serializer_class, queryset, request):
+    objs = [obj async for obj in queryset]
+    return render(serializer_class(objs, many=True, context={"request": request}).data)
+
+
+async def serialize_latest(serializer_class, queryset, request, missing):
+    obj = await queryset.afirst()
+    if obj is None:
+        return render({"detail": missing}, status.HTTP_404_NOT_FOUND)
+    return render(serializer_class(obj, context={"request": request}).data)
+
+
+@replica_safe
+@require_GET
+async def hero_section_list(request):
+    return render(await HeroSectionList.alist(request))
+
+
+@replica_safe
+@require_GET
+async def info_section_list(request):
+    return render(await InfoSectionList.alist(request))
+
+
+@replica_safe
+@require_GET
+async def support_feature_list(request):
+    return render(await SupportFeatureList.alist(request))
+
+
+@replica_safe
+@require_GET
+async def faq_list(request):
+    return render(await FAQListAPIView.alist(request))
+
+
+@replica_safe
+@require_GET
+async def homepage_banner(request):
+    queryset = HomepageBanner.objects.filter(is_active=True).order_by("-created_at").prefetch_related("stats")
+    return await serialize_latest(HomepageBannerSerializer, queryset, request, "No banner configured.")
+
+
+@replica_safe
+@require_GET
+async def last_section_latest(request):
+    queryset = LastSection.objects.order_by("-created_at").prefetch_related("images")
+    return await serialize_latest(LastSectionSerializer, queryset, request, "No sections found.")
+
+
+@replica_safe
+@require_GET
+async def trusted_section(request):
+    queryset = TrustedSection.objects.filter(is_active=True).order_by("-created_at")
+    return await serialize_latest(TrustedSectionSerializer, queryset, request, "Not configured")
+
+
+@replica_safe
+@require_GET
+async def testimonials(request):
+    section = await TestimonialsSection.objects.filter(is_active=True).order_by("-created_at").afirst()
+    items = [t async for t in Testimonial.objects.filter(is_visible=True).order_by("order", "created_at")]
+    return render({
+        "section": TestimonialsSectionSerializer(section).data if section else None,
+        "testimonials": TestimonialSerializer(items, many=True, context={"request": request}).data,
+    })
+
+
+@replica_safe
+@require_GET
+async def footer(request):
+    layout = await aget_layout()
+    return render(layout.as_data(request))
+
+
+@require_GET
+async def buybike_suggest(request):
+    index = await aget_index()
+    try:
+        return render(suggestion_data(index, request.GET))
+    except ValueError:
+        return render({"detail": "limit must be a positive integer"}, status.HTTP_400_BAD_REQUEST)
+
+
+@replica_safe
+@require_GET
+async def buybike_list(request):
+    """
+    Reuses the DRF filter backends configured on ``BuyBikeList`` (BikeFilter,
+    ordering and search) to build the queryset, then fetches the rows
+    asynchronously. The backends run in a thread because ``near`` looks up
+    showroom coordinates.
+    """
+    drf_request = Request(request)
+    view = BuyBikeList(request=drf_request, format_kwarg=None)
+
+    def filtered():
+        queryset = view.get_queryset()
+        for backend in view.filter_backends:
+            queryset = backend().filter_queryset(drf_request, queryset, view)
+        return queryset
+
+    try:
+        queryset = await sync_to_async(filtered)()
+    except ValidationError as exc:
+        return render(exc.detail, status.HTTP_400_BAD_REQUEST)
+    return await serialize_many(BuyBikeSerializer, queryset, request)
+
+
+@replica_safe
+@require_GET
+async def buybike_detail(request, pk):
+    def build():
+        obj = BuyBike.objects.select_related("location").prefetch_related("images").filter(pk=pk).first()
+        if obj is None:
+            raise Http404("No BuyBike matches the given query.")
+        return BuyBikeDetailSerializer(obj, context={"request": request}).data
+
+    # Served from bikes/detail_cache.py; build() only runs on a miss in both tiers.
+    try:
+        data = await detail_cache.afetch(request, pk, build)
+    except Http404:
+        return render({"detail": "No BuyBike matches the given query."}, status.HTTP_404_NOT_FOUND)
+    return render(data)
+
+
+@csrf_exempt
+async def contact_view(request):
+    """Async twin of ``views.contact_view``; the mail is queued for a job worker too."""
+    if request.method != "POST":
+        return JsonResponse({"error": "Invalid request"}, status=400)
+
+    data = json.loads(request.body)
+    fields = {key: data.get(key) for key in ("name", "email", "phone", "reason", "find_us", "message")}
+    await Contact.objects.acreate(**fields)
+
+    email_msg = contact_confirmation_email(fields["name"], fields["email"], fields["reason"], fields["message"])
+    await sync_to_async(queue_email)(email_msg)
+    return JsonResponse({"success": True, "message": "Message sent"})
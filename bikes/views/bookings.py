@@ -0,0 +1,92 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, status
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..models import Booking
+from ..pagination import CreatedAtCursorPagination
+from ..serializers.bookings import BookingCreateSerializer, BookingDetailSerializer
+
+
+# Create booking: server computes amounts and marks the BuyBike as booked.
+# GET is the staff listing: newest first, cursor-paginated, optional ?status=.
+class BookingCreateView(generics.ListCreateAPIView):
+    queryset = Booking.objects.select_related("buybike")
+    serializer_class = BookingCreateSerializer
+    permission_classes = [AllowAny]  # change if you require auth
+    pagination_class = CreatedAtCursorPagination
+
+    def get_permissions(self):
+        if self.request.method == "GET":
+            return [IsAdminUser()]
+        return super().get_permissions()
+
+    def get_serializer_class(self):
+        if self.request.method == "GET":
+            return BookingDetailSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        booking_status = self.request.query_params.get("status")
+        if booking_status:
+            queryset = queryset.filter(status=booking_status)
+        return queryset
+
+    def create(self, request, *args, **kwargs):
+        # validate incoming payload
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        buybike = serializer.validated_data.get("buybike")
+        test_drive_fee = float(serializer.validated_data.get("test_drive_fee", 0) or 0)
+
+        # server-side compute: subtotal from buybike.price, gst 18%
+        subtotal = float(getattr(buybike, "price", 0) or 0)
+        gst_amount = round(subtotal * 0.18, 2)
+        total_amount = round(subtotal + gst_amount + test_drive_fee, 2)
+
+        user = request.user if request.user and request.user.is_authenticated else None
+
+        booking = Booking.objects.create(
+            buybike=buybike,
+            user=user,
+            amount=subtotal,
+            gst_amount=gst_amount,
+            test_drive_fee=test_drive_fee,
+            total_amount=total_amount,
+            status="created",
+        )
+
+        # mark the product as booked in the buybike table (for admin visibility)
+        buybike.is_booked = True
+        buybike.save(update_fields=["is_booked", "updated_at"])
+
+        out = BookingDetailSerializer(booking, context={"request": request})
+        headers = self.get_success_headers(out.data)
+        return Response(out.data, status=status.HTTP_201_CREATED, headers=headers)
+
+
+# Booking detail (used by payment page to show amounts)
+class BookingDetailView(generics.RetrieveAPIView):
+    queryset = Booking.objects.select_related("buybike").all()
+    serializer_class = BookingDetailSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+
+# Optional: lightweight confirm endpoint that only toggles booking.status to 'paid' (no payment details saved)
+class BookingConfirmPaymentAPIView(APIView):
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    def post(self, request, pk):
+        booking = get_object_or_404(Booking, pk=pk)
+
+        if booking.status == "paid":
+            return Response({"detail": "Already paid"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # toggle paid — do NOT save payment_method or payment_reference (as requested)
+        booking.status = "paid"
+        booking.save(update_fields=["status"])
+
+        return Response({"detail": "Booking marked as paid"}, status=status.HTTP_200_OK)
@@ -0,0 +1,84 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..changes import DEFAULT_LIMIT, MAX_LIMIT, changed_bikes, read_changes
+from ..detail_cache import detail_cache
+from ..filters import AnnotatedOrderingFilter, BikeFilter
+from ..models import BuyBike
+from ..serializers.catalog import BuyBikeDetailSerializer, BuyBikeSerializer
+from ..suggest import get_index, suggestion_data
+
+
+class BuyBikeList(generics.ListAPIView):
+    read_replica = True
+    queryset = BuyBike.objects.select_related("location")
+    serializer_class = BuyBikeSerializer
+
+    # enable django-filter + ordering; ?search= is BikeFilter's (exact, then fuzzy)
+    filter_backends = [DjangoFilterBackend, AnnotatedOrderingFilter]
+    filterset_class = BikeFilter
+
+    # "distance" needs near=lat,lng, "relevance" a fuzzy search (see bikes/filters.py)
+    ordering_fields = ["created_at", "price", "kilometers", "year", "distance", "relevance"]
+    ordering = ["-created_at"]
+
+
+class BuyBikeDetail(generics.RetrieveAPIView):
+    read_replica = True
+    queryset = BuyBike.objects.select_related("location").prefetch_related("images")
+    serializer_class = BuyBikeDetailSerializer
+
+    def retrieve(self, request, *args, **kwargs):
+        # Popular listings are served from bikes/detail_cache.py.
+        return Response(detail_cache.fetch(
+            request, kwargs["pk"], lambda: super(BuyBikeDetail, self).retrieve(request, *args, **kwargs).data
+        ))
+
+
+class BuyBikeChangesAPIView(APIView):
+    """
+    Incremental catalog sync (see ``bikes/changes.py``).
+
+    GET ?since=<cursor>&limit=<n> -> bikes created or updated since the
+    cursor, ids of bikes deleted since, the next cursor and whether another
+    page is waiting.
+    """
+    read_replica = True
+
+    def get(self, request):
+        try:
+            since = int(request.query_params.get("since") or 0)
+            limit = min(int(request.query_params.get("limit") or DEFAULT_LIMIT), MAX_LIMIT)
+        except ValueError:
+            return Response({"detail": "since and limit must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+        if since < 0 or limit < 1:
+            return Response({"detail": "since and limit must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows, cursor, more = read_changes(since, limit)
+        bikes, deleted = changed_bikes(rows)
+        return Response({
+            "cursor": str(cursor),
+            "more": more,
+            "changed": BuyBikeSerializer(bikes, many=True, context={"request": request}).data,
+            "deleted": deleted,
+        })
+
+
+class BuyBikeSuggestAPIView(APIView):
+    """
+    Search-box typeahead from the in-memory index in ``bikes/suggest.py``.
+
+    GET ?q=<prefix>&limit=<n> -> brands, models, variants, titles and
+    showrooms with a word starting with the prefix, most stocked first.
+    Anonymous and query-free: there is no user lookup either.
+    """
+    authentication_classes = ()
+    permission_classes = ()
+
+    def get(self, request):
+        try:
+            return Response(suggestion_data(get_index(), request.query_params))
+        except ValueError:
+            return Response({"detail": "limit must be a positive integer"}, status=status.HTTP_400_BAD_REQUEST)
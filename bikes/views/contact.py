@@ -0,0 +1,76 @@
+import json
+
+from django.core.mail import EmailMessage
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import viewsets
+from rest_framework.permissions import AllowAny
+
+from ..models import Contact
+from ..pagination import CreatedAtCursorPagination
+from ..serializers.contact import ContactSerializer
+from ..tasks import queue_email
+
+
+def contact_confirmation_email(name, email, reason, message):
+    """Confirmation mail for a contact-form submission (shared with the async view)."""
+    subject = "Thank you for contacting Drive RP"
+    body = f"""
+        Hi {name},
+
+        Thank you for reaching out to us. We received your message:
+
+        Reason: {reason}
+        Message: {message}
+
+        Our team will get back to you soon.
+
+        Regards,
+        Drive RP Team
+        """
+
+    return EmailMessage(
+        subject,
+        body,
+        from_email="rockyranjith1121@gmail.com",
+        to=[email],   # Send to user
+        bcc=["rockyranjith1121@gmail.com"],  # Keep a copy for yourself
+    )
+
+
+@csrf_exempt
+def contact_view(request):
+    if request.method == "POST":
+        data = json.loads(request.body)
+
+        name = data.get("name")
+        email = data.get("email")
+        phone = data.get("phone")
+        reason = data.get("reason")
+        find_us = data.get("find_us")
+        message = data.get("message")
+
+        # Save to DB
+        contact = Contact.objects.create(
+            name=name,
+            email=email,
+            phone=phone,
+            reason=reason,
+            find_us=find_us,
+            message=message
+        )
+        print("✅ Saved contact:", contact.id)
+
+        # Mailed by a job worker, which retries while SMTP is unreachable.
+        queue_email(contact_confirmation_email(name, email, reason, message))
+
+        print("📩 Contact form received:", name, email)
+        return JsonResponse({"success": True, "message": "Message sent"})
+    return JsonResponse({"error": "Invalid request"}, status=400)
+
+
+class ContactViewSet(viewsets.ModelViewSet):
+    queryset = Contact.objects.all().order_by("-created_at")
+    serializer_class = ContactSerializer
+    permission_classes = [AllowAny]
+    pagination_class = CreatedAtCursorPagination
@@ -0,0 +1,44 @@
+import asyncio
+
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from ..events import broker
+
+
+KEEPALIVE_SECONDS = 15
+
+
+@require_GET
+async def bike_events(request):
+    """
+    Server-sent events for catalog changes (see ``bikes/events.py``).
+
+    ``event: bike`` carries a bike's current id, title, price, is_booked and
+    timestamps (new listings included); ``event: removed`` a deleted bike's
+    id. ``?bike=<id>`` follows a single bike, e.g. from its detail page.
+    """
+    bike_id = request.GET.get("bike")
+    if bike_id is not None:
+        try:
+            bike_id = int(bike_id)
+        except ValueError:
+            return JsonResponse({"detail": "bike must be an integer"}, status=400)
+
+    async def stream():
+        subscription = broker.subscribe(bike_id)
+        try:
+            yield b"retry: 3000\n\n"
+            while not subscription.closed:
+                try:
+                    yield await asyncio.wait_for(subscription.queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle connection.
+                    yield b": keepalive\n\n"
+        finally:
+            broker.unsubscribe(subscription)
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
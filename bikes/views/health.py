@@ -0,0 +1,68 @@
+import logging
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.http import HttpResponse, JsonResponse
+from django.utils.crypto import constant_time_compare
+
+from .. import jobs, metrics
+from ..detail_cache import EVENTS_METRIC, event_label_sets
+from ..throttling import THROTTLED_METRIC, throttle_label_sets
+
+
+logger = logging.getLogger(__name__)
+
+
+def health_view(request):
+    """Liveness/readiness probe: runs ``SELECT 1`` on every configured database."""
+    results = {}
+    healthy = True
+    for alias in connections:
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT 1")
+            results[alias] = "ok"
+        except DatabaseError:
+            # The probe is public; driver messages name hosts and users.
+            logger.exception("Health check failed on database %r", alias)
+            results[alias] = "error"
+            healthy = False
+    return JsonResponse(
+        {"status": "ok" if healthy else "error", "databases": results},
+        status=200 if healthy else 503,
+    )
+
+
+def metrics_view(request):
+    """
+    Prometheus exposition of the shared counters. Open to staff sessions and
+    to scrapers sending ``Authorization: Bearer <BIKES_METRICS_TOKEN>``.
+    """
+    token = settings.BIKES_METRICS_TOKEN
+    bearer = request.headers.get("Authorization", "")
+    if not (request.user.is_staff or (token and constant_time_compare(bearer, f"Bearer {token}"))):
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=403)
+
+    body = metrics.render_prometheus(
+        THROTTLED_METRIC,
+        "Write requests rejected by the rate-limit throttle.",
+        metrics.read(THROTTLED_METRIC, throttle_label_sets()),
+    ) + metrics.render_prometheus(
+        EVENTS_METRIC,
+        "Bike detail cache lookups per tier (hit, miss) and local LRU evictions.",
+        metrics.read(EVENTS_METRIC, event_label_sets()),
+    ) + metrics.render_prometheus(
+        jobs.RUNS_METRIC,
+        "Background job runs per type and outcome (done, retried, dead).",
+        metrics.read(jobs.RUNS_METRIC, jobs.run_label_sets()),
+    ) + metrics.render_prometheus(
+        jobs.RUN_TIME_METRIC,
+        "Time spent running background jobs per type.",
+        metrics.read(jobs.RUN_TIME_METRIC, jobs.time_label_sets()),
+    ) + metrics.render_prometheus(
+        jobs.DEPTH_METRIC,
+        "Background jobs queued, running and dead per type.",
+        jobs.queue_depth(),
+        kind="gauge",
+    )
+    return HttpResponse(body, content_type="text/plain; version=0.0.4")
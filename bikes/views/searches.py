@@ -0,0 +1,18 @@
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+
+from ..pagination import CreatedAtCursorPagination
+from ..serializers.searches import SavedSearchSerializer
+
+
+class SavedSearchViewSet(viewsets.ModelViewSet):
+    """The signed-in user's saved searches; new matching listings are mailed to them."""
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+
+    def get_queryset(self):
+        return self.request.user.saved_searches.all()
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
@@ -0,0 +1,165 @@
+from rest_framework import generics, status
+from rest_framework.generics import RetrieveAPIView
+from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..layout import get_layout
+from ..models import (
+    FAQ, AboutSection, HeroSection, HomepageBanner, InfoSection, LastSection,
+    LoginPageContent, SellBikePage, SupportFeature, Testimonial, TestimonialsSection,
+    TrustedSection,
+)
+from ..serializers.sections import (
+    HomepageBannerSerializer, LastSectionSerializer, LoginPageContentSerializer,
+    SellBikePageSerializer, TestimonialSerializer, TestimonialsSectionSerializer,
+    TrustedSectionSerializer,
+)
+from ..values_lists import ValuesListAPIView, media, nested
+
+
+class LastSectionListCreateAPIView(generics.ListCreateAPIView):
+    """
+    GET: list all sections (most recent first)
+    POST: create a new section (admin usage via API if desired)
+    """
+    read_replica = True
+    queryset = LastSection.objects.all()
+    serializer_class = LastSectionSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]  # restrict POST to authenticated if you want
+
+
+class LastSectionRetrieveAPIView(generics.RetrieveAPIView):
+    read_replica = True
+    queryset = LastSection.objects.all()
+    serializer_class = LastSectionSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+
+class LastSectionLatestAPIView(generics.GenericAPIView):
+    """
+    Returns the latest (most recently created) LastSection.
+    Useful for `/last-section/` endpoint that front-end will call.
+    """
+    read_replica = True
+    serializer_class = LastSectionSerializer
+    queryset = LastSection.objects.all()
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    def get(self, request, *args, **kwargs):
+        obj = self.get_queryset().order_by("-created_at").first()
+        if not obj:
+            return Response({"detail": "No sections found."}, status=status.HTTP_404_NOT_FOUND)
+        serializer = self.get_serializer(obj, context={"request": request})
+        return Response(serializer.data)
+
+
+class HeroSectionList(ValuesListAPIView):
+    read_replica = True
+    queryset = HeroSection.objects.all()
+    # Same output as HeroSectionSerializer.
+    fields = (
+        "id", "title", "description", "button_text",
+        media("trapezoid_image"), media("trapezoid_image", "trapezoid_image_url"),
+        nested("bike_images", ("id", media("image"), media("image", "image_url"), "order")),
+    )
+
+
+class InfoSectionList(ValuesListAPIView):
+    read_replica = True
+    queryset = InfoSection.objects.all()
+    # Same output as InfoSectionSerializer.
+    fields = ("id", "description", "button_text", media("bike_image"), media("bike_image", "bike_image_url"), "order")
+
+
+class SupportFeatureList(ValuesListAPIView):
+    read_replica = True
+    queryset = SupportFeature.objects.all()
+    # Same output as SupportFeatureSerializer.
+    fields = (
+        "id", "title", "subtitle", "description", media("image"), media("image", "image_url"),
+        media("arrow_image"), media("arrow_image", "arrow_image_url"), "arrow", "order",
+    )
+
+
+class HomepageBannerAPIView(APIView):
+    read_replica = True
+    def get(self, request, *args, **kwargs):
+        banner = HomepageBanner.objects.filter(is_active=True).order_by("-created_at").first()
+        if not banner:
+            return Response({"detail": "No banner configured."}, status=status.HTTP_404_NOT_FOUND)
+        serializer = HomepageBannerSerializer(banner, context={"request": request})
+        return Response(serializer.data)
+
+
+class TestimonialsAPIView(APIView):
+    """
+    Returns:
+    {
+      "section": { "title": "...", "subtitle": "..."},
+      "testimonials": [ { id,name,role,quote,image_url }, ... ]
+    }
+    """
+    read_replica = True
+    def get(self, request, *args, **kwargs):
+        # pick latest active section (or none)
+        section = TestimonialsSection.objects.filter(is_active=True).order_by("-created_at").first()
+        section_data = TestimonialsSectionSerializer(section).data if section else None
+
+        # get visible testimonials ordered by 'order'
+        testimonials_qs = Testimonial.objects.filter(is_visible=True).order_by("order", "created_at")
+        serializer = TestimonialSerializer(testimonials_qs, many=True, context={"request": request})
+        return Response({"section": section_data, "testimonials": serializer.data})
+
+
+class TrustedSectionAPIView(APIView):
+    """
+    Returns the latest active TrustedSection (GET /api/trusted-section/).
+    """
+    read_replica = True
+    def get(self, request, *args, **kwargs):
+        obj = TrustedSection.objects.filter(is_active=True).order_by("-created_at").first()
+        if not obj:
+            return Response({"detail": "Not configured"}, status=status.HTTP_404_NOT_FOUND)
+        serializer = TrustedSectionSerializer(obj, context={"request": request})
+        return Response(serializer.data)
+
+
+class FAQListAPIView(ValuesListAPIView):
+    read_replica = True
+    queryset = FAQ.objects.filter(is_active=True).order_by("order")
+    # Same output as FAQSerializer.
+    fields = ("id", "question", "answer", "order")
+
+
+class LoginPageContentView(APIView):
+    read_replica = True
+    def get(self, request):
+        content = LoginPageContent.objects.last()
+        serializer = LoginPageContentSerializer(content, context={"request": request})
+        return Response(serializer.data)
+
+
+class AboutSectionListAPIView(ValuesListAPIView):
+    read_replica = True
+    queryset = AboutSection.objects.all()
+    # Same output as AboutSectionSerializer.
+    fields = (
+        "id", "section", "title", "description", media("image"),
+        nested("images", ("id", media("image"))), "overlay_title", "overlay_description",
+    )
+
+
+class SellBikePageView(RetrieveAPIView):
+    read_replica = True
+    queryset = SellBikePage.objects.all()
+    serializer_class = SellBikePageSerializer
+
+    def get_object(self):
+        return SellBikePage.objects.first()
+
+
+class FooterAPIView(APIView):
+    read_replica = True
+    def get(self, request):
+        return Response(get_layout().as_data(request))
@@ -0,0 +1,52 @@
+"""
+Gunicorn settings, picked up automatically from the project root
+(``gunicorn secondsbikes.wsgi``). Anything here can be overridden on the
+command line or through ``GUNICORN_CMD_ARGS``.
+
+``preload_app`` imports Django, the apps and the URLconf once in the master
+process; workers are forked with all of that already in memory (shared
+copy-on-write), so a new or restarted worker is ready almost immediately
+instead of re-running the whole import graph. Set ``GUNICORN_PRELOAD=0``
+when using ``--reload`` during development.
+
+Several workers need a shared cache (``REDIS_URL``): model versions, bike
+detail stamps (``bikes/detail_cache.py``), throttle windows and metrics live
+there, and a per-process cache would keep serving other workers' outdated
+payloads. Without it the default is one worker, and a larger
+``GUNICORN_WORKERS`` or ``-w`` is lowered to one with a warning.
+
+Mail and other background jobs are run by a separate process,
+``python manage.py run_jobs`` (the ``worker`` entry of the ``Procfile``).
+"""
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", 4 if os.environ.get("REDIS_URL") else 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") == "1"
+
+
+def on_starting(server):
+    if server.cfg.workers > 1 and not os.environ.get("REDIS_URL"):
+        server.log.warning(
+            "%s workers need a shared cache (REDIS_URL); running one worker instead. "
+            "Raise --threads for more concurrency.", server.cfg.workers,
+        )
+        server.cfg.set("workers", 1)
+
+
+def when_ready(server):
+    # Django resolves the URLconf lazily on the first request; do it in the
+    # master so forked workers inherit every view and serializer module.
+    if not server.cfg.preload_app:
+        return
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+
+
+def post_fork(server, worker):
+    # Never share database connections opened in the master with workers.
+    from django.db import connections
+
+    connections.close_all()
@@ -5,6 +5,48 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+Deployment profiles
+-------------------
+WSGI (gunicorn, thread per request)::
+
+    gunicorn secondsbikes.wsgi -w 4 --threads 4
+
+(worker count, threads and app preloading default from ``gunicorn.conf.py``)
+
+ASGI (uvicorn, event loop per worker)::
+
+    uvicorn secondsbikes.asgi:application --workers 4 --no-access-log
+
+More than one worker requires ``REDIS_URL``: model versions and bike detail
+stamps live in the cache, and with the per-process default, workers that
+didn't make a write keep serving outdated catalog and detail payloads.
+gunicorn falls back to one worker without it; uvicorn has no such guard,
+so start it without ``--workers`` then.
+
+Background jobs (both profiles)::
+
+    python manage.py run_jobs
+
+Contact-form and signup mail, admin thumbnails and saved-search alerts are
+queued in the database (``bikes/jobs.py``) and only sent or built by this
+process, so run it next to the web server (the ``worker`` entry of the
+``Procfile``). Without it the API still answers but no mail goes out.
+
+Loading this module enables ``BIKES_ASYNC_VIEWS`` unless the environment
+already sets it, so the homepage sections, ``/api/buybikes/`` (list and
+detail) and the contact form are served by the native async views in
+``bikes/views/asynchronous.py``, and ``/api/events/`` streams live catalog
+events (``bikes/events.py``). Everything else still runs as sync DRF
+views via Django's thread adapter. Note that Django's async ORM currently
+executes queries on the shared sync thread, so the gain is in the time a
+request is *not* in the database (serialization, slow clients, SMTP), not
+in raw query throughput.
+
+To compare the two profiles, seed data (``manage.py seed_data``), start one
+server at a time and run::
+
+    python manage.py loadtest --target http --url http://127.0.0.1:8000 --concurrency 64
 """
 
 import os
@@ -12,5 +54,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'secondsbikes.settings')
+os.environ.setdefault('BIKES_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
@@ -0,0 +1,115 @@
+"""
+Environment-driven ``DATABASES`` profile.
+
+With no environment set this is the bundled SQLite database, exactly as
+before. Production points it at Postgres::
+
+    DB_ENGINE=postgres DB_NAME=bikes DB_USER=bikes DB_PASSWORD=... DB_HOST=db1
+
+Connection reuse is controlled by either
+
+* ``DB_CONN_MAX_AGE`` (seconds, default 60 on Postgres): persistent
+  connections kept per worker thread, validated with
+  ``CONN_HEALTH_CHECKS`` (``DB_CONN_HEALTH_CHECKS``, default on), or
+* ``DB_POOL=1``: Django 5's native psycopg connection pool
+  (``DB_POOL_MIN_SIZE``, ``DB_POOL_MAX_SIZE``, ``DB_POOL_TIMEOUT``). Django
+  does not allow pooling together with persistent connections, so
+  ``CONN_MAX_AGE`` is forced to 0 in that mode.
+
+Small deployments that stay on SQLite with several gunicorn workers should
+set ``DB_SQLITE_PRODUCTION=1``. Every new connection then switches to WAL
+journaling (readers no longer block behind a writer), ``synchronous=NORMAL``,
+memory-mapped I/O (``DB_SQLITE_MMAP_SIZE`` bytes), a larger page cache
+(``DB_SQLITE_CACHE_KIB``) and a busy timeout (``DB_SQLITE_BUSY_TIMEOUT``
+seconds). Transactions start with ``BEGIN IMMEDIATE``, so a writer waits for
+the lock up front instead of failing with "database is locked" when it tries
+to upgrade a read lock. Run ``manage.py sqlite_maintenance --every 3600``
+alongside the app for ``PRAGMA optimize`` and WAL checkpoints, and
+``manage.py bench_sqlite`` to compare both modes on your hardware.
+
+``DB_REPLICA_HOSTS=replica1.internal,replica2.internal`` adds one
+``replicaN`` alias per host with the same credentials; see
+``secondsbikes/routers.py`` for which requests are sent there.
+"""
+import os
+
+
+def env_bool(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, "") else default
+
+
+def sqlite_pragmas(mmap_size=256 * 1024 * 1024, cache_kib=64 * 1024):
+    return [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA mmap_size={mmap_size}",
+        f"PRAGMA cache_size=-{cache_kib}",
+        "PRAGMA temp_store=MEMORY",
+        # Bound the work PRAGMA optimize may do on large tables.
+        "PRAGMA analysis_limit=1000",
+    ]
+
+
+def sqlite_production_options():
+    pragmas = sqlite_pragmas(
+        mmap_size=env_int("DB_SQLITE_MMAP_SIZE", 256 * 1024 * 1024),
+        cache_kib=env_int("DB_SQLITE_CACHE_KIB", 64 * 1024),
+    )
+    return {
+        "timeout": env_int("DB_SQLITE_BUSY_TIMEOUT", 20),
+        "transaction_mode": "IMMEDIATE",
+        "init_command": ";".join(pragmas),
+    }
+
+
+def database_config(base_dir):
+    engine = os.environ.get("DB_ENGINE", "sqlite").lower()
+
+    if engine in ("postgres", "postgresql"):
+        default = {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("DB_NAME", "secondsbikes"),
+            "USER": os.environ.get("DB_USER", ""),
+            "PASSWORD": os.environ.get("DB_PASSWORD", ""),
+            "HOST": os.environ.get("DB_HOST", ""),
+            "PORT": os.environ.get("DB_PORT", ""),
+            "CONN_MAX_AGE": env_int("DB_CONN_MAX_AGE", 60),
+            "CONN_HEALTH_CHECKS": env_bool("DB_CONN_HEALTH_CHECKS", True),
+            "OPTIONS": {},
+        }
+        if os.environ.get("DB_SSLMODE"):
+            default["OPTIONS"]["sslmode"] = os.environ["DB_SSLMODE"]
+        if env_bool("DB_POOL"):
+            default["CONN_MAX_AGE"] = 0
+            default["OPTIONS"]["pool"] = {
+                "min_size": env_int("DB_POOL_MIN_SIZE", 2),
+                "max_size": env_int("DB_POOL_MAX_SIZE", 10),
+                "timeout": env_int("DB_POOL_TIMEOUT", 10),
+            }
+    else:
+        default = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ.get("DB_NAME", base_dir / "db.sqlite3"),
+            "CONN_MAX_AGE": env_int("DB_CONN_MAX_AGE", 0),
+            "CONN_HEALTH_CHECKS": env_bool("DB_CONN_HEALTH_CHECKS", False),
+        }
+        if env_bool("DB_SQLITE_PRODUCTION"):
+            default["OPTIONS"] = sqlite_production_options()
+
+    databases = {"default": default}
+
+    hosts = [h.strip() for h in os.environ.get("DB_REPLICA_HOSTS", "").split(",") if h.strip()]
+    for index, host in enumerate(hosts, start=1):
+        replica = dict(default, HOST=host, OPTIONS=dict(default.get("OPTIONS", {})))
+        replica["TEST"] = {"MIRROR": "default"}
+        databases[f"replica{index}"] = replica
+
+    return databases
@@ -0,0 +1,66 @@
+"""
+Read-replica routing.
+
+Reads go to a replica only while a request for a replica-safe view is being
+handled: GET/HEAD on a view marked with ``read_replica = True`` (DRF class
+views) or decorated with ``@replica_safe`` (function views). Everything else,
+including every write and any read in the same request as a write, stays on
+``default`` so users never read behind their own changes.
+"""
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+
+
+_use_replica = ContextVar("use_replica", default=False)
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias.startswith("replica")]
+
+
+def replica_safe(view):
+    """Mark a function view as safe to serve from a read replica."""
+    view.read_replica = True
+    return view
+
+
+def is_replica_safe(view_func):
+    if getattr(view_func, "read_replica", False):
+        return True
+    view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+    return bool(getattr(view_class, "read_replica", False))
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    # The flag is set/cleared rather than reset with a token: under ASGI these
+    # hooks run in separate sync_to_async contexts.
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        _use_replica.set(request.method in SAFE_METHODS and is_replica_safe(view_func))
+
+    def process_response(self, request, response):
+        _use_replica.set(False)
+        return response
+
+
+class ReadReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _use_replica.get():
+            replicas = replica_aliases()
+            if replicas:
+                return random.choice(replicas)
+        return None
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas mirror default, so objects loaded from either may be related.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from .database import database_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -50,6 +53,8 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'secondsbikes.routers.ReplicaRoutingMiddleware',
+    'bikes.throttling.ThrottleMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -72,17 +77,91 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'secondsbikes.wsgi.application'
+ASGI_APPLICATION = 'secondsbikes.asgi.application'
+
+# Serve the read-heavy endpoints from the native async views in
+# bikes/views/asynchronous.py. secondsbikes/asgi.py turns this on by default.
+BIKES_ASYNC_VIEWS = os.environ.get('BIKES_ASYNC_VIEWS', '0') == '1'
 
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Environment-driven profile (Postgres, persistent connections / psycopg
+# pool, read replicas); defaults to the bundled SQLite file. See
+# secondsbikes/database.py.
+DATABASES = database_config(BASE_DIR)
+
+DATABASE_ROUTERS = ['secondsbikes.routers.ReadReplicaRouter']
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# Model versions (and so every cached API payload), throttle windows and
+# metrics counters must be shared by all workers, so production sets
+# REDIS_URL. Without it every process has its own cache, which is only
+# correct for a single process: gunicorn.conf.py refuses to start more
+# workers then.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
     }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Lifetime of cached API responses (bikes/cache.py). Entries are also
+# invalidated as soon as a model they are built from is saved.
+BIKES_API_CACHE_TIMEOUT = int(os.environ.get('BIKES_API_CACHE_TIMEOUT', 300))
+
+# How much longer an outdated response is kept to be served while a single
+# request recomputes it (bikes/cache.py).
+BIKES_API_CACHE_STALE_TIMEOUT = int(os.environ.get('BIKES_API_CACHE_STALE_TIMEOUT', 3600))
+
+# Per-worker LRU in front of the shared cache for /api/buybikes/<pk>/
+# payloads (bikes/detail_cache.py): entries kept, and seconds each may live.
+BIKES_DETAIL_CACHE_SIZE = int(os.environ.get('BIKES_DETAIL_CACHE_SIZE', 1000))
+BIKES_DETAIL_CACHE_TTL = int(os.environ.get('BIKES_DETAIL_CACHE_TTL', 60))
+
+# ?search= on /api/buybikes/ falls back to typo-tolerant matching when it has
+# fewer exact hits than this; the threshold is the trigram similarity a
+# spelling needs (bikes/fuzzy.py).
+BIKES_FUZZY_MIN_RESULTS = int(os.environ.get('BIKES_FUZZY_MIN_RESULTS', 5))
+BIKES_FUZZY_THRESHOLD = float(os.environ.get('BIKES_FUZZY_THRESHOLD', 0.3))
+
+# Catalog changes younger than this are held back from /api/buybikes/changes/
+# so slower concurrent transactions can commit first (bikes/changes.py).
+BIKES_CHANGES_SETTLE_SECONDS = int(os.environ.get('BIKES_CHANGES_SETTLE_SECONDS', 5))
+
+# How often each ASGI worker's event broker reads that log while clients are
+# connected to /api/events/ (bikes/events.py).
+BIKES_EVENTS_POLL_INTERVAL = float(os.environ.get('BIKES_EVENTS_POLL_INTERVAL', 1))
+
+
+# Sliding-window rate limits for the write endpoints, keyed by URL name; see
+# bikes/throttling.py. Counters are exported at /api/metrics/ to staff and to
+# scrapers presenting BIKES_METRICS_TOKEN.
+BIKES_THROTTLES = {
+    'contact-form': {'ip': '5/min', 'user': '20/hour'},
+    'contact-list': {'ip': '5/min', 'user': '20/hour'},
+    'contact-detail': {'ip': '10/min', 'user': '30/hour'},
+    'booking-create': {'ip': '10/min', 'user': '30/hour'},
+    'booking-confirm': {'ip': '20/min', 'user': '60/hour'},
+    'login': {'ip': '10/min'},
+    'signup': {'ip': '5/hour'},
+    'token-refresh': {'ip': '30/min', 'user': '60/hour'},
 }
+# Number of trusted reverse proxies in front of the app (X-Forwarded-For).
+BIKES_THROTTLE_PROXIES = int(os.environ.get('BIKES_THROTTLE_PROXIES', '0'))
+BIKES_METRICS_TOKEN = os.environ.get('BIKES_METRICS_TOKEN', '')
 
 
 # Password validation
@@ -104,6 +183,43 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Hash with PBKDF2 at BIKES_PBKDF2_ITERATIONS (Django's default when unset);
+# stored hashes are upgraded on each user's next login. See bikes/hashers.py.
+PASSWORD_HASHERS = [
+    'bikes.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+BIKES_PBKDF2_ITERATIONS = int(os.environ.get('BIKES_PBKDF2_ITERATIONS', '0')) or None
+
+
+# API authentication: signed bearer tokens from /api/login/ (see
+# bikes/authentication.py) or the admin session. HTTP Basic is left out on
+# purpose, it would run the password hasher on every request.
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'bikes.authentication.SignedTokenAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+    ],
+    # orjson renderer/parser, byte-compatible with DRF's JSON ones (see
+    # bikes/renderers.py). Swap back to rest_framework.renderers.JSONRenderer
+    # and rest_framework.parsers.JSONParser to compare.
+    'DEFAULT_RENDERER_CLASSES': [
+        'bikes.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'bikes.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+BIKES_ACCESS_TOKEN_TTL = int(os.environ.get('BIKES_ACCESS_TOKEN_TTL', 15 * 60))
+BIKES_REFRESH_TOKEN_TTL = int(os.environ.get('BIKES_REFRESH_TOKEN_TTL', 14 * 24 * 3600))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -131,6 +247,16 @@ STATICFILES_DIRS = [BASE_DIR / 'static']
 
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
+# Optional integrations are only installed (and their SDKs imported) when
+# configured, so workers that don't use them don't pay for them at boot.
+# Uploads go to Cloudinary when CLOUDINARY_URL is set, to MEDIA_ROOT otherwise.
+if os.environ.get('CLOUDINARY_URL'):
+    INSTALLED_APPS += ['cloudinary_storage', 'cloudinary']
+    STORAGES = {
+        'default': {'BACKEND': 'cloudinary_storage.storage.MediaCloudinaryStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+
 
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = "smtp.gmail.com"